@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 
 import time
+
+# Imported first so the boot timer covers everything below
+from Creovue.utils.lazy import boot_complete
+
 from flask import Flask, jsonify, render_template, request
 from flask_moment import Moment
 
@@ -9,5 +13,17 @@ app = Flask(__name__)
 
 moment = Moment(app)
 
+from Creovue.utils.compression import init_compression
+from Creovue.utils.assets import init_assets
+init_compression(app)
+init_assets(app)
+
+
+import Creovue.routes
+
+# Log import time against CREO_IMPORT_BUDGET and any heavy library loaded eagerly
+boot_complete()
 
-import Creovue.routes
\ No newline at end of file
+# Importing the app starts no background work (tests, `flask` commands); the
+# server entry points do: main.py calls start_background(), gunicorn.conf.py
+# warms up in the master and starts the warmer in each worker
@@ -1,5 +1,6 @@
 import json
 import os
+import tempfile
 from dotenv import load_dotenv
 
 from os.path import join, dirname
@@ -16,6 +17,10 @@ creo_appdb_user=os.environ.get("CREO_DB_USER")
 creo_appdb_host=os.environ.get("CREO_DB_HOST")
 creo_appdb_name=os.environ.get("CREO_DB_NAME")
 creo_appdb_pass=os.environ.get("CREO_DB_PASS")
+creo_db_engine = os.environ.get('CREO_DB_ENGINE', 'sqlite').lower()
+creo_db_path = os.environ.get('CREO_DB_PATH', join(dirname(__file__), 'db', f"{creo_appdb_name or 'creovue'}.sqlite3"))
+creo_db_record_snapshots = os.environ.get('CREO_DB_RECORD_SNAPSHOTS', '1') == '1'
+creo_db_retention_days = int(os.environ.get('CREO_DB_RETENTION_DAYS', 90))
 
 
 
@@ -24,6 +29,83 @@ creo_api_key = os.environ.get('CREO_API_KEY' ) # Note: This creo_appears to be t
 cre_base_url = os.environ.get('CREO_BASE_URL')
 creo_base_url = os.environ.get('CREO_BASE_URL')
 
+# Outbound HTTP to the YouTube APIs
+creo_http_connect_timeout = float(os.environ.get('CREO_HTTP_CONNECT_TIMEOUT', 5))
+creo_http_read_timeout = float(os.environ.get('CREO_HTTP_READ_TIMEOUT', 15))
+creo_http_pool_size = int(os.environ.get('CREO_HTTP_POOL_SIZE', 16))
+creo_http_retries = int(os.environ.get('CREO_HTTP_RETRIES', 3))
+
+# YouTube Data API quota ledger, shared by all workers on the host
+creo_quota_path = os.environ.get('CREO_QUOTA_PATH', os.path.join(tempfile.gettempdir(), 'creovue_quota.sqlite3'))
+creo_quota_daily_limit = int(os.environ.get('CREO_QUOTA_DAILY_LIMIT', 10000))
+creo_quota_background_reserve = float(os.environ.get('CREO_QUOTA_BACKGROUND_RESERVE', 0.2))  # Kept for interactive calls
+creo_quota_degrade_fraction = float(os.environ.get('CREO_QUOTA_DEGRADE_FRACTION', 0.05))  # Below this, serve cached data
+
+# Shared cache: "memory" (per worker) or "sqlite" (shared by all workers on the host)
+creo_cache_backend = os.environ.get('CREO_CACHE_BACKEND', 'memory').lower()
+creo_cache_path = os.environ.get('CREO_CACHE_PATH', os.path.join(tempfile.gettempdir(), 'creovue_cache.sqlite3'))
+creo_cache_max_entries = int(os.environ.get('CREO_CACHE_MAX_ENTRIES', 4096))
+creo_cache_max_bytes = int(os.environ.get('CREO_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+creo_cache_lease_seconds = float(os.environ.get('CREO_CACHE_LEASE_SECONDS', 30))
+creo_cache_refresh_workers = int(os.environ.get('CREO_CACHE_REFRESH_WORKERS', 2))
+creo_cache_stale_grace = float(os.environ.get('CREO_CACHE_STALE_GRACE', 21600))  # Expired entries kept as a quota fallback
+
+# Background trend warmer (scheduler/trend_monitor.py)
+creo_scheduler_enabled = os.environ.get('CREO_SCHEDULER_ENABLED', '1') == '1'
+creo_warm_regions = [r.strip().upper() for r in os.environ.get('CREO_WARM_REGIONS', 'US,GB,IN,NG').split(',') if r.strip()]
+creo_warm_categories = [c.strip() for c in os.environ.get('CREO_WARM_CATEGORIES', '').split(',') if c.strip()]
+creo_warm_interval = float(os.environ.get('CREO_WARM_INTERVAL', 900))
+creo_warm_jitter = float(os.environ.get('CREO_WARM_JITTER', 0.1))
+creo_warm_quota_budget = int(os.environ.get('CREO_WARM_QUOTA_BUDGET', 3000))  # API units per day
+creo_warm_lock_path = os.environ.get('CREO_WARM_LOCK_PATH', os.path.join(tempfile.gettempdir(), 'creovue_warmer.lock'))
+
+# Persisted catalogs (video categories per region) survive restarts here
+creo_catalog_dir = os.environ.get('CREO_CATALOG_DIR', os.path.join(tempfile.gettempdir(), 'creovue_catalog'))
+
+# Region used when a request carries no region hint; geolocated once at startup if unset
+creo_default_region = os.environ.get('CREO_DEFAULT_REGION')
+creo_geolocate_default = os.environ.get('CREO_GEOLOCATE_DEFAULT', '1') == '1'
+
+# Channel metadata service: per-channel cache TTL and lookup coalescing window
+creo_channel_ttl = int(os.environ.get('CREO_CHANNEL_TTL', 21600))
+creo_channel_batch_window = float(os.environ.get('CREO_CHANNEL_BATCH_WINDOW', 0.05))
+
+# Incremental keyword indexes kept in memory (one per region/category, least recently used evicted)
+creo_keyword_index_max = int(os.environ.get('CREO_KEYWORD_INDEX_MAX', 256))
+
+# Concurrent fan-out for aggregated API routes
+creo_fanout_workers = int(os.environ.get('CREO_FANOUT_WORKERS', 8))
+creo_fanout_timeout = float(os.environ.get('CREO_FANOUT_TIMEOUT', 8))
+
+# Multi-region batch API: most region/category pairs per request, overall deadline, and
+# fetch threads (a pool of their own, so batches cannot starve /api/trend_data's fan-out)
+creo_batch_max_items = int(os.environ.get('CREO_BATCH_MAX_ITEMS', 60))
+creo_batch_timeout = float(os.environ.get('CREO_BATCH_TIMEOUT', 20))
+creo_batch_workers = int(os.environ.get('CREO_BATCH_WORKERS', 4))
+
+# Response compression and fingerprinted static assets (built with `flask build-assets`)
+creo_compress_min_size = int(os.environ.get('CREO_COMPRESS_MIN_SIZE', 1024))  # Bytes; smaller bodies are sent as-is
+creo_compress_level = int(os.environ.get('CREO_COMPRESS_LEVEL', 6))  # gzip level
+creo_brotli_quality = int(os.environ.get('CREO_BROTLI_QUALITY', 5))
+creo_asset_max_age = int(os.environ.get('CREO_ASSET_MAX_AGE', 365 * 86400))
+
+# Rendered chart images, addressed by a hash of their spec (memory tier, then a shared disk tier)
+creo_chart_memory_bytes = int(os.environ.get('CREO_CHART_MEMORY_BYTES', 32 * 1024 * 1024))
+creo_chart_dir = os.environ.get('CREO_CHART_DIR', os.path.join(tempfile.gettempdir(), 'creovue_charts'))
+creo_chart_disk_bytes = int(os.environ.get('CREO_CHART_DISK_BYTES', 256 * 1024 * 1024))
+
+# Chart render pool: worker threads, renders allowed to wait, seconds to wait for a slot / a render
+creo_render_workers = int(os.environ.get('CREO_RENDER_WORKERS', 2))
+creo_render_queue = int(os.environ.get('CREO_RENDER_QUEUE', 16))
+creo_render_wait = float(os.environ.get('CREO_RENDER_WAIT', 2))
+creo_render_timeout = float(os.environ.get('CREO_RENDER_TIMEOUT', 30))
+
+# Seconds `import Creovue` may take before start-up logs a warning (heavy libraries load on first use)
+creo_import_budget = float(os.environ.get('CREO_IMPORT_BUDGET', 2))
+
+# Warm-up before serving (utils/warmup.py); when disabled the app is marked ready without it
+creo_warmup_enabled = os.environ.get('CREO_WARMUP_ENABLED', '1') == '1'
+
 # Example: Hardcoded YouTube channel ID and mock data for now
 creo_channel_id =os.environ.get('CREO_CHANNEL_ID')
 creo_mock_view_history = os.environ.get('CREO_MOCK_VIEW_HISTORY')
@@ -0,0 +1,24 @@
+"""Init file."""
+# charts/__init__.py
+
+import base64
+
+from Creovue.charts.render import (
+    line_chart,
+    grouped_bar_chart,
+    render_chart,
+    build_figure,
+    chart_json
+)
+from Creovue.charts.pool import RenderQueueFull, get_render_pool, render_on_pool
+from Creovue.charts.cache import chart_hash, cached_chart, chart_url, load_chart, get_chart_store
+
+MIMETYPES = {
+    "png": "image/png",
+    "svg": "image/svg+xml"
+}
+
+
+def data_uri(image, fmt="png"):
+    """Inline an encoded image as a data: URI."""
+    return f"data:{MIMETYPES[fmt]};base64,{base64.b64encode(image).decode('ascii')}"
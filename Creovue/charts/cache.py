@@ -0,0 +1,213 @@
+"""Module: cache.py."""
+# charts/cache.py
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+
+from Creovue.app_secrets import creo_chart_memory_bytes, creo_chart_dir, creo_chart_disk_bytes, creo_render_timeout
+from Creovue.charts.pool import RenderQueueFull, get_render_pool
+
+logger = logging.getLogger('charts.cache')
+
+# Bump when the templates' styling changes, so old images are not reused
+RENDER_VERSION = 1
+HASH_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+PRUNE_EVERY = 64  # Disk writes between disk-tier size checks
+
+
+def chart_hash(spec, fmt="png"):
+    """Content address of a chart: its series data and styling, plus the output format."""
+    canonical = json.dumps(spec, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{RENDER_VERSION}:{fmt}:{canonical}".encode("utf-8")).hexdigest()[:32]
+
+
+class ChartStore:
+    """
+    Two-tier store of rendered chart images keyed by chart_hash.
+
+    The memory tier is an LRU bounded in bytes. The disk tier is shared by
+    every worker on the host and trimmed back to `disk_bytes`, oldest files
+    first, every PRUNE_EVERY writes.
+    Files are written atomically, so a sibling never reads a partial image.
+    """
+
+    def __init__(self, memory_bytes=creo_chart_memory_bytes, directory=creo_chart_dir, disk_bytes=creo_chart_disk_bytes):
+        self.memory_bytes = memory_bytes
+        self.directory = directory
+        self.disk_bytes = disk_bytes
+        self._memory = OrderedDict()
+        self._memory_size = 0
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.renders = 0
+
+    def _path(self, key, fmt):
+        return os.path.join(self.directory, f"{key}.{fmt}")
+
+    def _remember(self, name, image):
+        with self._lock:
+            if name in self._memory:
+                self._memory.move_to_end(name)
+                return
+            self._memory[name] = image
+            self._memory_size += len(image)
+            while self._memory_size > self.memory_bytes and self._memory:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_size -= len(evicted)
+
+    def get(self, key, fmt="png"):
+        """Return the stored image bytes, or None."""
+        name = f"{key}.{fmt}"
+        with self._lock:
+            image = self._memory.get(name)
+            if image is not None:
+                self._memory.move_to_end(name)
+                self.hits += 1
+                return image
+        try:
+            with open(self._path(key, fmt), "rb") as f:
+                image = f.read()
+        except OSError:
+            return None
+        self.disk_hits += 1
+        self._remember(name, image)
+        return image
+
+    def put(self, key, fmt, image):
+        """Store a freshly rendered image in both tiers."""
+        with self._lock:
+            self.renders += 1
+        self._remember(f"{key}.{fmt}", image)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(key, fmt)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(image)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not persist chart {key}: {e}")
+            return
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % PRUNE_EVERY == 0
+        if prune:
+            self.prune()
+
+    def prune(self):
+        """Delete the oldest images until the disk tier fits its byte budget."""
+        try:
+            entries = [entry for entry in os.scandir(self.directory) if entry.is_file() and not entry.name.endswith(".tmp")]
+        except OSError:
+            return
+        stats = sorted(((entry.stat(), entry.path) for entry in entries), key=lambda pair: pair[0].st_mtime)
+        total = sum(stat.st_size for stat, _path in stats)
+        for stat, path in stats:
+            if total <= self.disk_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= stat.st_size
+            except OSError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            return {
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_size,
+                "memory_hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "renders": self.renders
+            }
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_chart_store():
+    """Return the process-wide chart store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ChartStore()
+    return _store
+
+
+_inflight = {}  # chart hash -> Future resolved once the image is stored
+_inflight_lock = threading.Lock()
+
+
+def cached_chart(spec, fmt="png"):
+    """
+    Render a chart on the render pool unless an identical one is already stored.
+
+    Concurrent requests for the same chart share one render, and none of
+    them returns before the image is stored, so the URL they build serves.
+
+    Returns:
+        str: The chart's hash, to be served from /charts/<hash>.<fmt>
+
+    Raises:
+        RenderQueueFull: If the render pool is saturated or the render does
+        not finish within CREO_RENDER_TIMEOUT
+    """
+    store = get_chart_store()
+    key = chart_hash(spec, fmt)
+    if store.get(key, fmt) is not None:
+        return key
+
+    with _inflight_lock:
+        stored = _inflight.get(key)
+        leader = stored is None
+        if leader:
+            stored = _inflight[key] = Future()
+    if not leader:
+        try:
+            return stored.result(timeout=creo_render_timeout)
+        except FutureTimeout:
+            raise RenderQueueFull(f"Chart {key} did not render within {creo_render_timeout}s")
+
+    try:
+        # A previous leader may have stored it since the check above
+        if store.get(key, fmt) is None:
+            try:
+                image = get_render_pool().submit(spec, fmt).result(timeout=creo_render_timeout)
+            except FutureTimeout:
+                raise RenderQueueFull(f"Chart {key} did not render within {creo_render_timeout}s")
+            store.put(key, fmt, image)
+        stored.set_result(key)
+    except BaseException as e:
+        stored.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+    return key
+
+
+def chart_url(spec, fmt="png"):
+    """URL of the cached rendering of a chart spec (rendered on first use)."""
+    key = cached_chart(spec, fmt)
+    try:
+        from flask import url_for
+        return url_for("chart_image", chart_hash=key, fmt=fmt)
+    except RuntimeError:  # Outside an app context
+        return f"/charts/{key}.{fmt}"
+
+
+def load_chart(key, fmt="png"):
+    """Stored image bytes for a hash from chart_url, or None if unknown or malformed."""
+    if not HASH_PATTERN.match(key) or fmt not in ("png", "svg"):
+        return None
+    return get_chart_store().get(key, fmt)
@@ -0,0 +1,118 @@
+"""Module: pool.py."""
+# charts/pool.py
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from Creovue.app_secrets import creo_render_workers, creo_render_queue, creo_render_wait, creo_render_timeout
+from Creovue.charts.render import render_chart
+
+logger = logging.getLogger('charts.pool')
+
+
+class RenderQueueFull(Exception):
+    """Raised when no render slot frees up in time; callers should shed load (e.g. HTTP 503)."""
+
+
+class RenderPool:
+    """
+    Dedicated chart rendering threads behind a bounded queue.
+
+    Each render thread owns its Figure templates, so concurrent requests never
+    share matplotlib state. At most `workers + queue_size` renders are admitted;
+    further submissions wait up to `wait` seconds for a slot and are then
+    rejected, so a burst cannot pile up unbounded work or memory.
+    """
+
+    def __init__(self, workers=creo_render_workers, queue_size=creo_render_queue, wait=creo_render_wait):
+        self.workers = workers
+        self.capacity = workers + queue_size
+        self.wait = wait
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="creo-render")
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def submit(self, spec, fmt="png", wait=None):
+        """
+        Queue a render.
+
+        Args:
+            spec (dict): Chart spec
+            fmt (str): 'png' or 'svg'
+            wait (float, optional): Seconds to wait for a free slot (0 = fail fast)
+
+        Returns:
+            concurrent.futures.Future: Resolves to the encoded image bytes
+
+        Raises:
+            RenderQueueFull: If the queue stays full for `wait` seconds
+        """
+        wait = self.wait if wait is None else wait
+        acquired = self._slots.acquire(timeout=wait) if wait > 0 else self._slots.acquire(blocking=False)
+        if not acquired:
+            with self._lock:
+                self.rejected += 1
+            raise RenderQueueFull(f"Chart render queue full ({self.capacity} renders pending)")
+        with self._lock:
+            self.pending += 1
+        try:
+            future = self._executor.submit(render_chart, spec, fmt)
+        except Exception:
+            self._done(None)
+            raise
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, _future):
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+        self._slots.release()
+
+    def render(self, spec, fmt="png", timeout=creo_render_timeout):
+        """Render on the pool and wait for the image bytes."""
+        return self.submit(spec, fmt).result(timeout=timeout)
+
+    async def render_async(self, spec, fmt="png"):
+        """Await a render without blocking the event loop; fails fast when the queue is full."""
+        return await asyncio.wrap_future(self.submit(spec, fmt, wait=0))
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "capacity": self.capacity,
+                "pending": self.pending,
+                "completed": self.completed,
+                "rejected": self.rejected
+            }
+
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def get_render_pool():
+    """Return this process's render pool, creating it on first use (and again after a fork)."""
+    global _pool, _pool_pid
+    if _pool is None or _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool_pid != os.getpid():
+                _pool = RenderPool()
+                _pool_pid = os.getpid()
+    return _pool
+
+
+def render_on_pool(spec, fmt="png"):
+    """Render a chart spec on the render pool and return the encoded image."""
+    return get_render_pool().render(spec, fmt)
@@ -0,0 +1,197 @@
+"""Module: render.py."""
+# charts/render.py
+
+import io
+import threading
+
+from Creovue.utils.lazy import lazy_import
+
+# matplotlib and numpy load on the first render, not when the app is imported
+np = lazy_import("numpy")
+backend_agg = lazy_import("matplotlib.backends.backend_agg")
+mpl_figure = lazy_import("matplotlib.figure")
+patches = lazy_import("matplotlib.patches")
+ticker = lazy_import("matplotlib.ticker")
+
+# Charts are described by plain, JSON-serialisable specs:
+#   {"type": "line" | "grouped_bar", "title", "xlabel", "ylabel",
+#    "labels": [...x labels or categories...],
+#    "series": [{"label", "values", "color"}, ...], "legend_title"}
+# The same spec renders server-side (PNG/SVG) or is sent to the client as JSON.
+
+DEFAULT_DPI = 100
+LINE_COLOR = "#1f77b4"
+
+
+def line_chart(x_values, y_values, title="", xlabel="", ylabel=""):
+    """Spec for a single-series line chart with point markers."""
+    return {
+        "type": "line",
+        "title": title,
+        "xlabel": xlabel,
+        "ylabel": ylabel,
+        "labels": list(x_values),
+        "series": [{"label": ylabel, "values": [float(v) for v in y_values], "color": LINE_COLOR}]
+    }
+
+
+def grouped_bar_chart(categories, series, title="", xlabel="", ylabel="", legend_title=None):
+    """
+    Spec for a grouped bar chart.
+
+    Args:
+        categories (list): Category labels along the x axis
+        series (list): [{"label", "values", "color"}, ...], one bar per category each
+    """
+    return {
+        "type": "grouped_bar",
+        "title": title,
+        "xlabel": xlabel,
+        "ylabel": ylabel,
+        "labels": list(categories),
+        "series": series,
+        "legend_title": legend_title
+    }
+
+
+class LineTemplate:
+    """Figure, axes and line artist built once; each render swaps in new data."""
+
+    figsize = (8, 4)
+
+    def __init__(self):
+        self.figure = mpl_figure.Figure(figsize=self.figsize, dpi=DEFAULT_DPI)
+        backend_agg.FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot()
+        self.ax.grid(True)
+        (self.line,) = self.ax.plot([], [], marker='o', linestyle='-', color=LINE_COLOR)
+        self.figure.subplots_adjust(left=0.1, right=0.97, top=0.9, bottom=0.13)
+
+    def update(self, spec):
+        series = spec["series"][0]
+        labels = spec["labels"]
+        numeric = all(isinstance(label, (int, float)) for label in labels)
+        x = np.asarray(labels, dtype=float) if numeric else np.arange(len(labels))
+        self.line.set_data(x, series["values"])
+        self.line.set_color(series.get("color", LINE_COLOR))
+        if numeric:
+            self.ax.xaxis.set_major_locator(ticker.AutoLocator())
+            self.ax.xaxis.set_major_formatter(ticker.ScalarFormatter())
+        else:
+            self.ax.set_xticks(x, labels)
+        self.ax.set_title(spec["title"])
+        self.ax.set_xlabel(spec["xlabel"])
+        self.ax.set_ylabel(spec["ylabel"])
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+
+class GroupedBarTemplate:
+    """Figure and axes built once; each render replaces only the bar artists."""
+
+    figsize = (14, 8)
+    group_width = 0.72
+
+    def __init__(self):
+        self.figure = mpl_figure.Figure(figsize=self.figsize, dpi=DEFAULT_DPI)
+        backend_agg.FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot()
+        self.figure.subplots_adjust(left=0.06, right=0.98, top=0.94, bottom=0.3)
+        self.containers = []
+        self.legend_key = None
+
+    def update(self, spec):
+        for container in self.containers:
+            container.remove()
+        self.containers = []
+
+        categories = spec["labels"]
+        series = spec["series"]
+        index = np.arange(len(categories))
+        bar_width = self.group_width / max(len(series), 1)
+        for i, s in enumerate(series):
+            self.containers.append(
+                self.ax.bar(index + i * bar_width, s["values"], bar_width, color=s.get("color"))
+            )
+
+        self.ax.set_xticks(index + bar_width * (len(series) - 1) / 2, categories, rotation=45, ha='right')
+        self.ax.set_title(spec["title"])
+        self.ax.set_xlabel(spec["xlabel"])
+        self.ax.set_ylabel(spec["ylabel"])
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+        # Legend handles are proxies, rebuilt only when the series change
+        legend_key = (tuple((s["label"], s.get("color")) for s in series), spec.get("legend_title"))
+        if legend_key != self.legend_key:
+            handles = [patches.Patch(color=s.get("color"), label=s["label"]) for s in series]
+            self.ax.legend(handles=handles, title=spec.get("legend_title"))
+            self.legend_key = legend_key
+
+
+TEMPLATES = {
+    "line": LineTemplate,
+    "grouped_bar": GroupedBarTemplate
+}
+
+# Figures are not thread-safe, so every thread keeps its own templates
+_local = threading.local()
+
+
+def _template(chart_type):
+    templates = getattr(_local, "templates", None)
+    if templates is None:
+        templates = _local.templates = {}
+    template = templates.get(chart_type)
+    if template is None:
+        template = templates[chart_type] = TEMPLATES[chart_type]()
+    return template
+
+
+def render_chart(spec, fmt="png"):
+    """
+    Render a chart spec with the object-oriented Agg API (no pyplot state).
+
+    Args:
+        spec (dict): A chart spec, e.g. from line_chart or grouped_bar_chart
+        fmt (str): 'png' or 'svg'
+
+    Returns:
+        bytes: The encoded image
+    """
+    template = _template(spec["type"])
+    template.update(spec)
+    buffer = io.BytesIO()
+    template.figure.savefig(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def build_figure(spec):
+    """Draw a spec on a new, caller-owned Figure (for callers that keep the figure)."""
+    template = TEMPLATES[spec["type"]]()
+    template.update(spec)
+    return template.figure
+
+
+def chart_json(spec, precision=2):
+    """
+    Compact series for client-side rendering (Chart.js style labels/datasets).
+
+    Args:
+        spec (dict): A chart spec
+        precision (int): Decimal places kept for values
+
+    Returns:
+        dict: {"type", "title", "labels", "datasets": [{"label", "data", "color"}]}
+    """
+    return {
+        "type": "bar" if spec["type"] == "grouped_bar" else "line",
+        "title": spec["title"],
+        "xlabel": spec["xlabel"],
+        "ylabel": spec["ylabel"],
+        "labels": spec["labels"],
+        "datasets": [
+            {"label": s["label"], "data": [round(float(v), precision) for v in s["values"]], "color": s.get("color")}
+            for s in spec["series"]
+        ]
+    }
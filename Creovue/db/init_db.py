@@ -1 +1,119 @@
 """Module: init_db.py."""
+# db/init_db.py
+
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from Creovue.app_secrets import creo_db_engine, creo_db_path
+
+logger = logging.getLogger('db')
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), 'schema.sql')
+
+
+class SQLiteDatabase:
+    """
+    Embedded SQLite database in WAL mode.
+
+    WAL lets every gunicorn worker read while one of them writes, so the
+    store needs no external service. Connections are per thread and are
+    reopened after a fork.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path=creo_db_path):
+        self.path = path
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def connect(self):
+        """Return this thread's connection, reopening it after a fork."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """Run the enclosed statements as one write transaction."""
+        conn = self.connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def init_schema(self):
+        with open(SCHEMA_PATH) as f:
+            self.connect().executescript(f.read())
+
+
+DB_ENGINES = {
+    "sqlite": SQLiteDatabase
+}
+
+_db = None
+_db_lock = threading.Lock()
+
+
+def get_db():
+    """
+    Return the configured process-wide database (CREO_DB_ENGINE).
+
+    The first call in a process creates the schema and backfills the daily
+    rollups of snapshots stored before the rollups existed.
+    """
+    global _db
+    created = False
+    if _db is None:
+        with _db_lock:
+            if _db is None:
+                engine = DB_ENGINES.get(creo_db_engine)
+                if engine is None:
+                    logger.warning(f"Unknown database engine '{creo_db_engine}', using sqlite")
+                    engine = SQLiteDatabase
+                db = engine()
+                db.init_schema()
+                _db = db
+                created = True
+    if created:
+        _backfill_rollups(_db)
+    return _db
+
+
+def _backfill_rollups(db):
+    """Rebuild the daily rollups if snapshots exist but no rollups were ever written."""
+    try:
+        conn = db.connect()
+        has_snapshots = conn.execute("SELECT 1 FROM trend_snapshots LIMIT 1").fetchone()
+        has_rollups = conn.execute("SELECT 1 FROM snapshot_daily LIMIT 1").fetchone()
+        if has_snapshots and not has_rollups:
+            from Creovue.db.trend_store import rebuild_daily_rollups
+            rebuild_daily_rollups()
+    except sqlite3.Error as e:
+        logger.warning(f"Could not backfill daily rollups: {e}")
+
+
+def init_db():
+    """Create the database schema and backfill rollups if needed."""
+    db = get_db()
+    logger.info(f"Initialised {db.name} database")
+    return db
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    init_db()
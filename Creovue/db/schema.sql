@@ -1 +1,66 @@
 -- SQL schema definition for Creovue
+
+-- One row per trending (mostPopular) snapshot fetched from the API
+CREATE TABLE IF NOT EXISTS trend_snapshots (
+    id INTEGER PRIMARY KEY,
+    region TEXT NOT NULL,
+    category_id TEXT NOT NULL DEFAULT '',  -- '' for the all-categories chart
+    fetched_at REAL NOT NULL,
+    video_count INTEGER NOT NULL,
+    payload BLOB NOT NULL,  -- zlib-compressed JSON of the raw videos.list items
+    UNIQUE (region, category_id, fetched_at)
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_fetched_at ON trend_snapshots (fetched_at);
+
+-- The videos of each snapshot, for per-video and per-channel history
+CREATE TABLE IF NOT EXISTS snapshot_videos (
+    snapshot_id INTEGER NOT NULL REFERENCES trend_snapshots (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    video_id TEXT NOT NULL,
+    channel_id TEXT,
+    category_id TEXT,
+    title TEXT,
+    views INTEGER NOT NULL DEFAULT 0,
+    likes INTEGER NOT NULL DEFAULT 0,
+    comments INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (snapshot_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_snapshot_videos_video ON snapshot_videos (video_id);
+CREATE INDEX IF NOT EXISTS idx_snapshot_videos_channel ON snapshot_videos (channel_id);
+
+-- Keyword totals of each snapshot (title words and tags)
+CREATE TABLE IF NOT EXISTS snapshot_keywords (
+    snapshot_id INTEGER NOT NULL REFERENCES trend_snapshots (id) ON DELETE CASCADE,
+    region TEXT NOT NULL,
+    category_id TEXT NOT NULL DEFAULT '',
+    keyword TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    videos INTEGER NOT NULL,
+    views INTEGER NOT NULL,
+    PRIMARY KEY (snapshot_id, keyword)
+);
+CREATE INDEX IF NOT EXISTS idx_snapshot_keywords_lookup ON snapshot_keywords (region, keyword, fetched_at);
+
+-- Daily rollups, updated incrementally as each snapshot is recorded, so a
+-- trend chart reads one row per day instead of scanning every snapshot
+CREATE TABLE IF NOT EXISTS snapshot_daily (
+    region TEXT NOT NULL,
+    category_id TEXT NOT NULL DEFAULT '',
+    day TEXT NOT NULL,  -- UTC date, YYYY-MM-DD
+    snapshots INTEGER NOT NULL,
+    videos INTEGER NOT NULL,
+    views INTEGER NOT NULL,
+    PRIMARY KEY (region, category_id, day)
+);
+
+CREATE TABLE IF NOT EXISTS keyword_daily (
+    region TEXT NOT NULL,
+    category_id TEXT NOT NULL DEFAULT '',
+    keyword TEXT NOT NULL,
+    day TEXT NOT NULL,
+    snapshots INTEGER NOT NULL,  -- Snapshots of the day the keyword appeared in
+    videos INTEGER NOT NULL,
+    views INTEGER NOT NULL,
+    PRIMARY KEY (region, category_id, keyword, day)
+);
+CREATE INDEX IF NOT EXISTS idx_keyword_daily_day ON keyword_daily (region, category_id, day);
@@ -0,0 +1,313 @@
+"""Module: trend_store.py."""
+# db/trend_store.py
+
+import json
+import logging
+import threading
+import zlib
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from time import time
+
+from Creovue.app_secrets import creo_db_retention_days
+from Creovue.db.init_db import get_db
+from Creovue.utils.data_helpers import video_keywords
+
+logger = logging.getLogger('db.trend_store')
+
+PRUNE_INTERVAL = 3600  # Seconds between retention sweeps in one process
+
+_last_prune = 0
+_prune_lock = threading.Lock()
+
+
+def _encode_items(items):
+    return zlib.compress(json.dumps(items, separators=(",", ":")).encode("utf-8"))
+
+
+def _decode_items(payload):
+    return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+
+def _day(timestamp):
+    """UTC date bucket of an epoch timestamp, as YYYY-MM-DD."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%d")
+
+
+def _stat(item, name):
+    return int(item.get('statistics', {}).get(name, 0))
+
+
+def record_snapshot(snapshot):
+    """
+    Persist a trending snapshot with its videos and keyword totals.
+
+    All rows are written in a single transaction with batched inserts.
+    Recording the same region/category/fetched_at twice is a no-op.
+
+    Args:
+        snapshot (dict): As returned by get_region_snapshot
+
+    Returns:
+        int or None: The snapshot ID, or None if it was already stored
+    """
+    region = snapshot["region"]
+    category_id = snapshot.get("category_id") or ""
+    fetched_at = snapshot["fetched_at"]
+    items = snapshot["items"]
+
+    videos = []
+    keyword_stats = defaultdict(lambda: [0, 0])
+    for position, item in enumerate(items):
+        snippet = item.get('snippet', {})
+        views = _stat(item, 'viewCount')
+        videos.append((
+            position, item.get('id'), snippet.get('channelId'), snippet.get('categoryId'),
+            snippet.get('title'), views, _stat(item, 'likeCount'), _stat(item, 'commentCount')
+        ))
+        if 'title' in snippet:
+            for keyword in video_keywords(item):
+                keyword_stats[keyword][0] += 1
+                keyword_stats[keyword][1] += views
+
+    with get_db().transaction() as conn:
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO trend_snapshots (region, category_id, fetched_at, video_count, payload) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (region, category_id, fetched_at, len(items), _encode_items(items))
+        )
+        if cursor.rowcount == 0:
+            return None
+        snapshot_id = cursor.lastrowid
+        conn.executemany(
+            "INSERT INTO snapshot_videos (snapshot_id, position, video_id, channel_id, category_id, title, views, likes, comments) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(snapshot_id,) + video for video in videos]
+        )
+        conn.executemany(
+            "INSERT INTO snapshot_keywords (snapshot_id, region, category_id, keyword, fetched_at, videos, views) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(snapshot_id, region, category_id, keyword, fetched_at, count, views)
+             for keyword, (count, views) in keyword_stats.items()]
+        )
+        _update_rollups(conn, region, category_id, _day(fetched_at), videos, keyword_stats)
+
+    logger.info(f"Stored snapshot {snapshot_id} for {region}/{category_id or 'all'}: "
+                f"{len(videos)} videos, {len(keyword_stats)} keywords")
+    _maybe_prune()
+    return snapshot_id
+
+
+def _update_rollups(conn, region, category_id, day, videos, keyword_stats):
+    """Fold one snapshot into the daily rollups of its region/category."""
+    conn.execute(
+        "INSERT INTO snapshot_daily (region, category_id, day, snapshots, videos, views) VALUES (?, ?, ?, 1, ?, ?) "
+        "ON CONFLICT (region, category_id, day) DO UPDATE SET "
+        "snapshots = snapshots + 1, videos = videos + excluded.videos, views = views + excluded.views",
+        (region, category_id, day, len(videos), sum(video[5] for video in videos))
+    )
+    conn.executemany(
+        "INSERT INTO keyword_daily (region, category_id, keyword, day, snapshots, videos, views) VALUES (?, ?, ?, ?, 1, ?, ?) "
+        "ON CONFLICT (region, category_id, keyword, day) DO UPDATE SET "
+        "snapshots = snapshots + 1, videos = videos + excluded.videos, views = views + excluded.views",
+        [(region, category_id, keyword, day, count, views) for keyword, (count, views) in keyword_stats.items()]
+    )
+
+
+def rebuild_daily_rollups():
+    """Recompute the daily rollups from the stored snapshots (e.g. after an upgrade)."""
+    with get_db().transaction() as conn:
+        conn.execute("DELETE FROM snapshot_daily")
+        conn.execute("DELETE FROM keyword_daily")
+        snapshots = conn.execute("SELECT id, region, category_id, fetched_at FROM trend_snapshots").fetchall()
+        for snapshot_id, region, category_id, fetched_at in snapshots:
+            videos = conn.execute(
+                "SELECT position, video_id, channel_id, category_id, title, views FROM snapshot_videos WHERE snapshot_id = ?",
+                (snapshot_id,)
+            ).fetchall()
+            keyword_stats = {
+                keyword: (count, views) for keyword, count, views in conn.execute(
+                    "SELECT keyword, videos, views FROM snapshot_keywords WHERE snapshot_id = ?", (snapshot_id,)
+                )
+            }
+            _update_rollups(conn, region, category_id, _day(fetched_at), videos, keyword_stats)
+    logger.info(f"Rebuilt daily rollups from {len(snapshots)} snapshots")
+    return len(snapshots)
+
+
+def load_latest_snapshot(region, category_id=None, max_age=None):
+    """
+    Read the most recent stored snapshot of a region/category.
+
+    Args:
+        region (str): ISO region code
+        category_id (str, optional): YouTube category ID
+        max_age (float, optional): Ignore snapshots older than this many seconds
+
+    Returns:
+        dict or None: {"region", "category_id", "fetched_at", "items"}
+    """
+    since = time() - max_age if max_age is not None else 0
+    row = get_db().connect().execute(
+        "SELECT fetched_at, payload FROM trend_snapshots "
+        "WHERE region = ? AND category_id = ? AND fetched_at >= ? "
+        "ORDER BY fetched_at DESC LIMIT 1",
+        (region, category_id or "", since)
+    ).fetchone()
+    if row is None:
+        return None
+    return {
+        "region": region,
+        "category_id": category_id,
+        "fetched_at": row[0],
+        "items": _decode_items(row[1])
+    }
+
+
+def get_snapshots(region, category_id=None, since=None, until=None, limit=None):
+    """
+    List stored snapshots of a region/category in a time range, newest first.
+
+    Args:
+        region (str): ISO region code
+        category_id (str, optional): YouTube category ID
+        since (float, optional): Earliest fetched_at (epoch seconds)
+        until (float, optional): Latest fetched_at (epoch seconds)
+        limit (int, optional): Maximum number of snapshots
+
+    Returns:
+        list: [{"id", "fetched_at", "video_count"}, ...]
+    """
+    rows = get_db().connect().execute(
+        "SELECT id, fetched_at, video_count FROM trend_snapshots "
+        "WHERE region = ? AND category_id = ? AND fetched_at BETWEEN ? AND ? "
+        "ORDER BY fetched_at DESC LIMIT ?",
+        (region, category_id or "", since or 0, until or time(), limit or -1)
+    ).fetchall()
+    return [{"id": row[0], "fetched_at": row[1], "video_count": row[2]} for row in rows]
+
+
+def get_keyword_history(region, keyword, since=None, until=None, category_id=None):
+    """
+    Per-snapshot totals of a keyword in a region over a time range, oldest first.
+
+    Args:
+        region (str): ISO region code
+        keyword (str): Keyword (matched lower-cased)
+        since (float, optional): Earliest fetched_at (epoch seconds)
+        until (float, optional): Latest fetched_at (epoch seconds)
+        category_id (str, optional): YouTube category ID; all categories by default
+
+    Returns:
+        list: [{"fetched_at", "videos", "views"}, ...]
+    """
+    rows = get_db().connect().execute(
+        "SELECT fetched_at, videos, views FROM snapshot_keywords "
+        "WHERE region = ? AND keyword = ? AND fetched_at BETWEEN ? AND ? AND category_id = ? "
+        "ORDER BY fetched_at",
+        (region, keyword.lower(), since or 0, until or time(), category_id or "")
+    ).fetchall()
+    return [{"fetched_at": row[0], "videos": row[1], "views": row[2]} for row in rows]
+
+
+def get_keyword_daily_series(region, keyword, days=14, category_id=None):
+    """
+    Daily trend of a keyword in a region over the last `days` UTC days.
+
+    Reads the precomputed rollups, so the cost is one row per day however
+    many snapshots were recorded.
+
+    Args:
+        region (str): ISO region code
+        keyword (str): Keyword (matched lower-cased)
+        days (int): Number of days ending today
+        category_id (str, optional): YouTube category ID; all categories by default
+
+    Returns:
+        list: [{"day", "snapshots", "volume", "avg_views"}, ...] oldest first, one
+        entry per day. `volume` is the average number of trending videos
+        matching the keyword per snapshot; both values are None on days
+        without snapshots.
+    """
+    today = datetime.now(timezone.utc).date()
+    day_keys = [(today - timedelta(days=i)).strftime("%Y-%m-%d") for i in reversed(range(days))]
+    conn = get_db().connect()
+    params = (region, category_id or "", day_keys[0], day_keys[-1])
+    totals = dict(conn.execute(
+        "SELECT day, snapshots FROM snapshot_daily "
+        "WHERE region = ? AND category_id = ? AND day BETWEEN ? AND ?",
+        params
+    ).fetchall())
+    matches = {
+        day: (videos, views) for day, videos, views in conn.execute(
+            "SELECT day, videos, views FROM keyword_daily "
+            "WHERE region = ? AND category_id = ? AND keyword = ? AND day BETWEEN ? AND ?",
+            params[:2] + (keyword.lower(),) + params[2:]
+        )
+    }
+
+    series = []
+    for day in day_keys:
+        snapshots = totals.get(day, 0)
+        videos, views = matches.get(day, (0, 0))
+        series.append({
+            "day": day,
+            "snapshots": snapshots,
+            "volume": round(videos / snapshots, 2) if snapshots else None,
+            "avg_views": int(views / videos) if videos else (0 if snapshots else None)
+        })
+    return series
+
+
+def get_top_keyword(region, days=14, category_id=None):
+    """Keyword seen in the most trending videos of a region over the last `days` days, or None."""
+    since = (datetime.now(timezone.utc).date() - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+    row = get_db().connect().execute(
+        "SELECT keyword FROM keyword_daily WHERE region = ? AND category_id = ? AND day >= ? "
+        "GROUP BY keyword ORDER BY SUM(videos) DESC LIMIT 1",
+        (region, category_id or "", since)
+    ).fetchone()
+    return row[0] if row else None
+
+
+def get_video_history(video_id, since=None, until=None):
+    """
+    Trending appearances of a video, oldest first.
+
+    Returns:
+        list: [{"region", "category_id", "fetched_at", "position", "views", "likes", "comments"}, ...]
+    """
+    rows = get_db().connect().execute(
+        "SELECT s.region, s.category_id, s.fetched_at, v.position, v.views, v.likes, v.comments "
+        "FROM snapshot_videos v JOIN trend_snapshots s ON s.id = v.snapshot_id "
+        "WHERE v.video_id = ? AND s.fetched_at BETWEEN ? AND ? ORDER BY s.fetched_at",
+        (video_id, since or 0, until or time())
+    ).fetchall()
+    keys = ("region", "category_id", "fetched_at", "position", "views", "likes", "comments")
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def prune_snapshots(max_age_days=creo_db_retention_days):
+    """Delete snapshots (with their videos, keywords and daily rollups) older than max_age_days."""
+    cutoff = time() - max_age_days * 86400
+    with get_db().transaction() as conn:
+        deleted = conn.execute("DELETE FROM trend_snapshots WHERE fetched_at < ?", (cutoff,)).rowcount
+        conn.execute("DELETE FROM snapshot_daily WHERE day < ?", (_day(cutoff),))
+        conn.execute("DELETE FROM keyword_daily WHERE day < ?", (_day(cutoff),))
+    if deleted:
+        logger.info(f"Pruned {deleted} snapshots older than {max_age_days} days")
+    return deleted
+
+
+def _maybe_prune():
+    global _last_prune
+    if not creo_db_retention_days:
+        return
+    with _prune_lock:
+        if time() - _last_prune < PRUNE_INTERVAL:
+            return
+        _last_prune = time()
+    try:
+        prune_snapshots()
+    except Exception as e:
+        logger.warning(f"Snapshot retention sweep failed: {e}")
@@ -1,10 +1,11 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from pytrends.request import TrendReq
+from Creovue.utils.lazy import lazy_import
+
+# sklearn and pytrends are slow to import; load them on first use
+sklearn_text = lazy_import("sklearn.feature_extraction.text")
+pytrends_request = lazy_import("pytrends.request")
 
 #from tensorflow.keras.applications.resnet50 import ResNet50, preprocess_input
 #from tensorflow.keras.preprocessing import image
-import numpy as np
-
 #model = ResNet50(weights='imagenet', include_top=False)
 
 #def thumbnail_score(img_path):
@@ -20,12 +21,12 @@ import numpy as np
         send_alert(keyword)"""
 
 def extract_keywords(texts):
-    vectorizer = TfidfVectorizer(stop_words='english')
+    vectorizer = sklearn_text.TfidfVectorizer(stop_words='english')
     tfidf_matrix = vectorizer.fit_transform(texts)
     return vectorizer.get_feature_names_out()
 
 def get_trending_topics(keyword):
-    pytrends = TrendReq()
+    pytrends = pytrends_request.TrendReq()
     pytrends.build_payload([keyword], timeframe='now 7-d')
     return pytrends.related_queries()
 
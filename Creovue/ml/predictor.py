@@ -1,13 +1,10 @@
 """Module: predictor.py."""
 # ml/predictor.py
-import numpy as np
+from Creovue.utils.lazy import lazy_import
 
-import matplotlib
-matplotlib.use('Agg')  # Set non-interactive backend before importing pyplot
-import matplotlib.pyplot as plt
-import io
-import base64
-import numpy as np
+from Creovue.charts import line_chart, render_on_pool, data_uri
+
+np = lazy_import("numpy")
 
 def sudden_spike(view_history, threshold=1.5):
     if len(view_history) < 3:
@@ -22,19 +19,5 @@ def sudden_spike(view_history, threshold=1.5):
 
 
 def generate_plot(x_values, y_values, title='Channel Growth', xlabel='Days', ylabel='Views'):
-    plt.figure(figsize=(8, 4))
-    plt.plot(x_values, y_values, marker='o', linestyle='-')
-    plt.title(title)
-    plt.xlabel(xlabel)
-    plt.ylabel(ylabel)
-    plt.grid(True)
-
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png')
-    buffer.seek(0)
-    plot_data = base64.b64encode(buffer.read()).decode('utf-8')
-    buffer.close()
-    plt.close()
-
-    return f"data:image/png;base64,{plot_data}"
-
+    spec = line_chart(x_values, y_values, title=title, xlabel=xlabel, ylabel=ylabel)
+    return data_uri(render_on_pool(spec))
@@ -0,0 +1,139 @@
+"""Module: scoring.py."""
+# ml/scoring.py
+from Creovue.utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# Score formulas take per-keyword arrays (video counts, total views, average
+# views) and return one score per keyword. Register more with @score_formula.
+SCORE_FORMULAS = {}
+
+
+def score_formula(name):
+    """Register a keyword score formula under `name`."""
+    def register(func):
+        SCORE_FORMULAS[name] = func
+        return func
+    return register
+
+
+@score_formula("trend")
+def trend_score(counts, views, avg_views):
+    # Combined frequency and views
+    return np.floor(counts * avg_views / 10000)
+
+
+@score_formula("volume")
+def volume_score(counts, views, avg_views):
+    return counts.astype(np.float64)
+
+
+@score_formula("reach")
+def reach_score(counts, views, avg_views):
+    # Favours keywords whose few videos draw large audiences
+    return np.floor(avg_views * np.log1p(counts))
+
+
+def _formula(formula):
+    if callable(formula):
+        return formula
+    try:
+        return SCORE_FORMULAS[formula]
+    except KeyError:
+        raise ValueError(f"Unknown score formula '{formula}'")
+
+
+def top_k(scores, k):
+    """
+    Indices of the `k` highest scores, best first.
+
+    Uses a partial selection (O(n)) and only sorts the k winners; ties keep
+    their original order.
+    """
+    n = len(scores)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < n:
+        # Everything above the k-th best score, then the earliest ties at it
+        kth = -np.partition(-scores, k - 1)[k - 1]
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[:k - len(above)]
+        candidates = np.concatenate((above, ties))
+    else:
+        candidates = np.arange(n)
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order]
+
+
+def _to_arrays(keyword_stats):
+    if not keyword_stats:
+        return [], np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    names, counts, views = zip(*keyword_stats)
+    return names, np.array(counts, dtype=np.int64), np.array(views, dtype=np.int64)
+
+
+def _rows(names, counts, avg_views, scores, indices):
+    # Convert only the selected entries back to Python numbers
+    selected = zip(
+        indices.tolist(), counts[indices].tolist(),
+        avg_views[indices].astype(np.int64).tolist(), scores[indices].astype(np.int64).tolist()
+    )
+    return [
+        {
+            "name": names[i],
+            "volume": count * 100,  # Weighted volume
+            "avg_views": avg,
+            "videos_count": count,
+            "trend_score": score
+        }
+        for i, count, avg, score in selected
+    ]
+
+
+def rank_keywords(keyword_stats, max_results, formula="trend"):
+    """
+    Score keywords in bulk and return the top `max_results`.
+
+    Args:
+        keyword_stats (list): [(keyword, video_count, total_views), ...]
+        max_results (int): Number of keywords to return
+        formula (str or callable): Name in SCORE_FORMULAS or a formula function
+
+    Returns:
+        list: [{"name", "volume", "avg_views", "videos_count", "trend_score"}, ...]
+    """
+    names, counts, views = _to_arrays(keyword_stats)
+    avg_views = views / np.maximum(counts, 1)
+    scores = _formula(formula)(counts, views, avg_views)
+    return _rows(names, counts, avg_views, scores, top_k(scores, max_results))
+
+
+def rank_many(stats_by_key, max_results, formula="trend"):
+    """
+    Rank the keywords of many regions in one vectorised pass.
+
+    All keyword totals are concatenated so the formula runs once over every
+    region; only the top-k selection is done per region.
+
+    Args:
+        stats_by_key (dict): {key: [(keyword, video_count, total_views), ...]}
+        max_results (int): Number of keywords per region
+        formula (str or callable): Name in SCORE_FORMULAS or a formula function
+
+    Returns:
+        dict: {key: ranked list as returned by rank_keywords}
+    """
+    keys = list(stats_by_key)
+    sizes = [len(stats_by_key[key]) for key in keys]
+    names, counts, views = _to_arrays([stat for key in keys for stat in stats_by_key[key]])
+    avg_views = views / np.maximum(counts, 1)
+    scores = _formula(formula)(counts, views, avg_views)
+
+    ranked = {}
+    start = 0
+    for key, size in zip(keys, sizes):
+        end = start + size
+        indices = top_k(scores[start:end], max_results) + start
+        ranked[key] = _rows(names, counts, avg_views, scores, indices)
+        start = end
+    return ranked
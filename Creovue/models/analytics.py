@@ -5,14 +5,17 @@
 import time
 
 from Creovue.utils.yt_api import fetch_youtube_analytics
-from Creovue.ml.predictor import generate_plot, sudden_spike
+from Creovue.ml.predictor import sudden_spike
+from Creovue.charts import line_chart, chart_url
 
 def process_channel_analytics(channel_id):
     # Fetch actual stats with simulated daily views
     full_data = fetch_youtube_analytics(channel_id, days=7)
 
     view_history = full_data["daily_views"]
-    plot_url = generate_plot(list(range(len(view_history))), view_history)
+    # Served from the chart cache; an unchanged history is never re-rendered
+    plot_url = chart_url(line_chart(list(range(len(view_history))), view_history,
+                                    title='Channel Growth', xlabel='Days', ylabel='Views'))
     spike = sudden_spike(view_history)
 
     return {
@@ -0,0 +1,184 @@
+"""Module: catalog.py."""
+# models/catalog.py
+
+import json
+import logging
+import os
+import threading
+from time import time
+
+import requests
+
+from Creovue.app_secrets import creo_catalog_dir
+from Creovue.utils.decorators import cached
+from Creovue.utils.lazy import lazy_import
+from Creovue.utils.transport import youtube_get
+
+logger = logging.getLogger('trends.catalog')
+
+pycountry = lazy_import("pycountry")
+
+CATEGORY_TTL = 7 * 86400  # YouTube's category list changes very rarely
+
+# Custom name mappings to match original entries and common usage
+REGION_NAME_OVERRIDES = {
+    "GB": "United Kingdom",
+    "US": "United States",
+    "KR": "South Korea",
+    "KP": "North Korea",
+    "TW": "Taiwan",
+    "MK": "North Macedonia",
+    # Add other custom mappings here if needed
+}
+
+TRENDING_REGIONS = [
+    {"code": "GB", "name": "United Kingdom"},
+    {"code": "US", "name": "United States"},
+    {"code": "CA", "name": "Canada"},
+    {"code": "AU", "name": "Australia"},
+    {"code": "DE", "name": "Germany"},
+    {"code": "FR", "name": "France"},
+    {"code": "JP", "name": "Japan"},
+    {"code": "IN", "name": "India"},
+    {"code": "BR", "name": "Brazil"},
+    {"code": "KR", "name": "South Korea"}
+]
+
+_regions = None
+_region_codes = None
+_regions_lock = threading.Lock()
+
+
+def get_all_regions():
+    """
+    Get list of available regions with localised names.
+
+    Built from pycountry once per process; every caller shares the same list,
+    so treat it as read-only.
+    """
+    global _regions, _region_codes
+    if _regions is None:
+        with _regions_lock:
+            if _regions is None:
+                regions = [
+                    {"code": country.alpha_2, "name": REGION_NAME_OVERRIDES.get(country.alpha_2, country.name)}
+                    for country in pycountry.countries
+                ]
+                _region_codes = frozenset(region["code"] for region in regions)
+                _regions = regions
+    return _regions
+
+
+def is_known_region(code):
+    """Return True if `code` is an ISO 3166 alpha-2 region code."""
+    get_all_regions()
+    return code in _region_codes
+
+
+def get_trending_regions():
+    """Get list of featured regions with localised names"""
+    return TRENDING_REGIONS
+
+
+def _category_path(region):
+    return os.path.join(creo_catalog_dir, f"categories_{region}.json")
+
+
+def _load_categories(region, max_age=None):
+    """Read a persisted category map; None if absent, unreadable or older than max_age."""
+    try:
+        with open(_category_path(region)) as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if max_age is not None and time() - stored.get("fetched_at", 0) > max_age:
+        return None
+    return stored.get("categories")
+
+
+def _save_categories(region, categories):
+    """Persist a category map atomically so other workers never read a partial file."""
+    try:
+        os.makedirs(creo_catalog_dir, exist_ok=True)
+        path = _category_path(region)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"fetched_at": time(), "categories": categories}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not persist categories for {region}: {e}")
+
+
+def _fetch_categories(region):
+    """Retrieve the video categories of a region from the YouTube Data API v3."""
+    params = {
+        "part": "snippet",
+        "regionCode": region
+    }
+    try:
+        response = youtube_get("videoCategories", params)
+        response.raise_for_status()
+        data = response.json()
+    except requests.exceptions.RequestException as e:
+        raise Exception(f"Failed to connect to YouTube API: {str(e)}")
+
+    if "error" in data:
+        raise Exception(f"YouTube API Error: {data['error']['message']}")
+
+    return {
+        item["id"]: {
+            "title": item["snippet"]["title"],
+            "assignable": bool(item["snippet"].get("assignable"))
+        }
+        for item in data.get("items", [])
+    }
+
+
+@cached(expiry_seconds=CATEGORY_TTL, stale_while_revalidate=86400)
+def get_category_map(region):
+    """
+    Get the video categories of a region, keyed by category ID.
+
+    Cached in memory and persisted to disk, so restarts and sibling workers
+    reuse the last fetch instead of calling videoCategories again. If the API
+    is unreachable, an expired copy on disk is served rather than nothing.
+
+    Args:
+        region (str): ISO region code
+
+    Returns:
+        dict: {category_id: {"title": str, "assignable": bool}}
+    """
+    categories = _load_categories(region, max_age=CATEGORY_TTL)
+    if categories is not None:
+        return categories
+
+    try:
+        categories = _fetch_categories(region)
+    except Exception as e:
+        categories = _load_categories(region)
+        if categories is None:
+            raise
+        logger.warning(f"Serving stale categories for {region}: {e}")
+        return categories
+
+    _save_categories(region, categories)
+    return categories
+
+
+def get_category_names(region, assignable_only=False):
+    """
+    Map category IDs to titles for a region.
+
+    Args:
+        region (str): ISO region code
+        assignable_only (bool): Only include categories videos can be assigned to
+
+    Returns:
+        dict: {category_id: title}
+    """
+    return {
+        cat_id: info["title"]
+        for cat_id, info in get_category_map(region).items()
+        if info["assignable"] or not assignable_only
+    }
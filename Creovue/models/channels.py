@@ -0,0 +1,138 @@
+"""Module: channels.py."""
+# models/channels.py
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+from Creovue.app_secrets import creo_channel_ttl, creo_channel_batch_window
+from Creovue.utils.cache import get_cache
+from Creovue.utils.youtube_client import get_youtube_client, execute
+
+logger = logging.getLogger('trends.channels')
+
+# Superset of the parts any caller reads, so one cached item serves them all
+CHANNEL_PARTS = "snippet,statistics,brandingSettings"
+CHANNELS_PER_CALL = 50  # channels.list accepts at most 50 IDs
+LOOKUP_TIMEOUT = 30
+
+
+def _cache_key(channel_id):
+    return f"channels:{channel_id}"
+
+
+class ChannelBatcher:
+    """
+    Coalesces channel lookups from concurrent requests into few API calls.
+
+    The first caller in a window waits `window` seconds for others to add
+    their IDs, then fetches everything pending in 50-ID channels.list calls.
+    IDs already being fetched are joined rather than requested again.
+    """
+
+    def __init__(self, window=creo_channel_batch_window):
+        self.window = window
+        self._lock = threading.Lock()
+        self._pending = {}   # channel_id -> Future, waiting for the next flush
+        self._inflight = {}  # channel_id -> Future, being fetched right now
+        self._flush_scheduled = False
+
+    def request(self, channel_ids):
+        """
+        Queue channel IDs for the next batch.
+
+        Returns:
+            dict: {channel_id: Future resolving to the raw channel item or None}
+        """
+        futures = {}
+        leader = False
+        with self._lock:
+            for cid in channel_ids:
+                future = self._inflight.get(cid) or self._pending.get(cid)
+                if future is None:
+                    future = self._pending[cid] = Future()
+                futures[cid] = future
+            if self._pending and not self._flush_scheduled:
+                self._flush_scheduled = leader = True
+
+        if leader:
+            time.sleep(self.window)
+            self._flush()
+        return futures
+
+    def _flush(self):
+        with self._lock:
+            batch = self._pending
+            self._pending = {}
+            self._flush_scheduled = False
+            self._inflight.update(batch)
+
+        ids = list(batch)
+        cache = get_cache()
+        try:
+            youtube = get_youtube_client()
+            for i in range(0, len(ids), CHANNELS_PER_CALL):
+                chunk = ids[i:i + CHANNELS_PER_CALL]
+                try:
+                    response = execute(youtube.channels().list(
+                        part=CHANNEL_PARTS,
+                        id=",".join(chunk),
+                        maxResults=CHANNELS_PER_CALL
+                    ))
+                except Exception as e:
+                    for cid in chunk:
+                        batch[cid].set_exception(e)
+                    continue
+                found = {item["id"]: item for item in response.get("items", [])}
+                for cid in chunk:
+                    item = found.get(cid)
+                    if item is not None:
+                        cache.set(_cache_key(cid), item, creo_channel_ttl)
+                    batch[cid].set_result(item)
+            logger.info(f"Fetched {len(ids)} channels in {(len(ids) + CHANNELS_PER_CALL - 1) // CHANNELS_PER_CALL} call(s)")
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            with self._lock:
+                for cid in ids:
+                    self._inflight.pop(cid, None)
+
+
+_batcher = ChannelBatcher()
+
+
+def get_channels(channel_ids):
+    """
+    Look up channel metadata, serving cached channels and batching the rest.
+
+    Args:
+        channel_ids (iterable): YouTube channel IDs (duplicates are ignored)
+
+    Returns:
+        dict: {channel_id: raw channels.list item} for every channel found
+    """
+    cache = get_cache()
+    results = {}
+    misses = []
+    for cid in dict.fromkeys(channel_ids):
+        entry = cache.get(_cache_key(cid))
+        if entry is not None:
+            results[cid] = entry[0]
+        else:
+            misses.append(cid)
+
+    if misses:
+        for cid, future in _batcher.request(misses).items():
+            item = future.result(timeout=LOOKUP_TIMEOUT)
+            if item is not None:
+                results[cid] = item
+
+    return results
+
+
+def get_channel(channel_id):
+    """Look up a single channel; returns the raw channels.list item or None."""
+    return get_channels([channel_id]).get(channel_id)
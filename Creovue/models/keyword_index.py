@@ -0,0 +1,169 @@
+"""Module: keyword_index.py."""
+# models/keyword_index.py
+
+import sys
+import threading
+from collections import OrderedDict
+
+from Creovue.app_secrets import creo_keyword_index_max
+from Creovue.utils.data_helpers import video_keywords
+
+
+def _views(item):
+    return int(item['statistics'].get('viewCount', 0))
+
+
+class KeywordIndex:
+    """
+    Inverted index of keyword -> (video count, total views, video IDs).
+
+    `update` diffs a new trending snapshot against the indexed one: keywords
+    are extracted only for videos that entered the set, postings are removed
+    for videos that left it, and videos that stayed only adjust view totals.
+    Keyword and video ID strings are interned, so the same keyword shared by
+    many regions is stored once.
+    """
+
+    __slots__ = ("version", "_videos", "_postings", "_lock")
+
+    def __init__(self):
+        self.version = None
+        self._videos = {}    # video_id -> [keywords tuple, views]
+        self._postings = {}  # keyword -> [views, set of video IDs]
+        self._lock = threading.Lock()
+
+    def update(self, items, version=None):
+        """
+        Bring the index in line with a snapshot's videos.
+
+        Args:
+            items (list): Raw videos.list items
+            version (optional): Snapshot identity (e.g. fetched_at); a repeat is a no-op
+
+        Returns:
+            int: Number of videos that entered or left the index
+        """
+        with self._lock:
+            return self._update(items, version)
+
+    def update_stats(self, items, version=None, min_count=1):
+        """
+        Update the index and read its keyword totals under one lock.
+
+        A concurrent update (e.g. from an older snapshot of the same region)
+        cannot land in between, so the totals describe exactly `items`.
+
+        Returns:
+            list: As keyword_stats
+        """
+        with self._lock:
+            self._update(items, version)
+            return self._stats(min_count)
+
+    def _update(self, items, version):
+        if version is not None and version == self.version:
+            return 0
+        current = {item['id']: item for item in items}
+        left = [vid for vid in self._videos if vid not in current]
+        for vid in left:
+            self._remove(vid)
+
+        entered = 0
+        for vid, item in current.items():
+            views = _views(item)
+            entry = self._videos.get(vid)
+            if entry is None:
+                self._add(sys.intern(vid), item, views)
+                entered += 1
+            elif entry[1] != views:
+                delta = views - entry[1]
+                entry[1] = views
+                for keyword in entry[0]:
+                    self._postings[keyword][0] += delta
+
+        self.version = version
+        return entered + len(left)
+
+    def _add(self, vid, item, views):
+        keywords = tuple(sys.intern(keyword) for keyword in video_keywords(item))
+        self._videos[vid] = [keywords, views]
+        for keyword in keywords:
+            posting = self._postings.get(keyword)
+            if posting is None:
+                posting = self._postings[keyword] = [0, set()]
+            posting[0] += views
+            posting[1].add(vid)
+
+    def _remove(self, vid):
+        keywords, views = self._videos.pop(vid)
+        for keyword in keywords:
+            posting = self._postings[keyword]
+            posting[1].discard(vid)
+            if posting[1]:
+                posting[0] -= views
+            else:
+                del self._postings[keyword]
+
+    def keyword_stats(self, min_count=1):
+        """
+        Totals of every indexed keyword seen in at least `min_count` videos.
+
+        Returns:
+            list: [(keyword, video_count, total_views), ...]
+        """
+        with self._lock:
+            return self._stats(min_count)
+
+    def _stats(self, min_count):
+        return [
+            (keyword, len(video_ids), views)
+            for keyword, (views, video_ids) in self._postings.items()
+            if len(video_ids) >= min_count
+        ]
+
+    def videos_for(self, keyword):
+        """IDs of the indexed videos that carry `keyword`."""
+        with self._lock:
+            posting = self._postings.get(keyword.lower())
+            return set(posting[1]) if posting else set()
+
+    def __len__(self):
+        return len(self._videos)
+
+
+_indexes = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_keyword_index(region, category_id=None):
+    """
+    Return the process-wide keyword index of a region/category.
+
+    At most CREO_KEYWORD_INDEX_MAX indexes are kept; the least recently used
+    one is dropped and rebuilt from its next snapshot if needed again.
+    """
+    key = (region, category_id or "")
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = KeywordIndex()
+            while len(_indexes) > creo_keyword_index_max:
+                _indexes.popitem(last=False)
+        else:
+            _indexes.move_to_end(key)
+        return index
+
+
+def snapshot_keyword_stats(snapshot, min_count=1):
+    """
+    Update the keyword index of a snapshot's region/category and return its totals.
+
+    Args:
+        snapshot (dict): As returned by get_region_snapshot
+        min_count (int): Only keywords seen in at least this many videos
+
+    Returns:
+        list: [(keyword, video_count, total_views), ...] for this snapshot
+    """
+    index = get_keyword_index(snapshot["region"], snapshot.get("category_id"))
+    return index.update_stats(snapshot["items"], version=snapshot["fetched_at"], min_count=min_count)
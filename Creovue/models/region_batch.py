@@ -0,0 +1,149 @@
+"""Module: region_batch.py."""
+# models/region_batch.py
+
+import logging
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from time import time
+
+from Creovue.app_secrets import creo_batch_timeout, creo_batch_workers
+from Creovue.ml.scoring import rank_many
+from Creovue.models.keyword_index import snapshot_keyword_stats
+from Creovue.models.snapshot import get_region_snapshot
+from Creovue.utils.quota import get_quota_ledger
+
+logger = logging.getLogger('trends.region_batch')
+
+TOP_VIDEOS = 5
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+
+def get_batch_executor():
+    """
+    Return this process's batch fetch pool, creating it on first use (and again after a fork).
+
+    Batches get their own small pool rather than the shared fan-out pool, so
+    a large batch queues behind itself instead of taking every worker that
+    interactive /api/trend_data requests need.
+    """
+    global _executor, _executor_pid
+    if _executor is None or _executor_pid != os.getpid():
+        with _executor_lock:
+            if _executor is None or _executor_pid != os.getpid():
+                _executor = ThreadPoolExecutor(max_workers=creo_batch_workers, thread_name_prefix="creo-batch")
+                _executor_pid = os.getpid()
+    return _executor
+
+
+def plan_region_batch(pairs):
+    """
+    Split region/category pairs by what serving them would cost.
+
+    Pairs with a fresh cached snapshot are free. Every other pair needs one
+    videos.list call; those are admitted while the interactive quota budget
+    lasts, and the rest fall back to a stale cached snapshot or are skipped.
+
+    Args:
+        pairs (list): [(region, category_id or None), ...]
+
+    Returns:
+        (list, dict, list): Pairs to serve live, {pair: stale snapshot}, skipped pairs
+    """
+    ledger = get_quota_ledger()
+    budget = int(ledger.remaining() - ledger.degrade_floor)
+    now = time()
+
+    live, stale, skipped = [], {}, []
+    for pair in pairs:
+        entry = get_region_snapshot.peek(*pair)
+        if entry is not None and now - entry[1] < get_region_snapshot.expiry_seconds:
+            live.append(pair)
+        elif budget > 0:
+            budget -= 1
+            live.append(pair)
+        elif entry is not None:
+            stale[pair] = entry[0]
+        else:
+            skipped.append(pair)
+    return live, stale, skipped
+
+
+def summarise_snapshot(snapshot, trending_keywords):
+    """Compact per-region view of a snapshot for comparison dashboards."""
+    return {
+        "region": snapshot["region"],
+        "category_id": snapshot["category_id"],
+        "fetched_at": snapshot["fetched_at"],
+        "video_count": len(snapshot["items"]),
+        "trending_keywords": trending_keywords,
+        "top_videos": [
+            {
+                "id": item["id"],
+                "title": item["snippet"]["title"],
+                "channel": item["snippet"].get("channelTitle"),
+                "views": int(item.get("statistics", {}).get("viewCount", 0))
+            }
+            for item in snapshot["items"][:TOP_VIDEOS]
+        ]
+    }
+
+
+def _summaries(snapshots, keywords, status):
+    """Summarise {pair: snapshot}, ranking every pair's keywords in one vectorised pass."""
+    ranked = rank_many(
+        {pair: snapshot_keyword_stats(snapshot, min_count=2) for pair, snapshot in snapshots.items()},
+        keywords
+    )
+    for pair, snapshot in snapshots.items():
+        yield dict(summarise_snapshot(snapshot, ranked[pair]), status=status)
+
+
+def iter_region_batch(pairs, keywords=10, timeout=creo_batch_timeout):
+    """
+    Fetch many region/category snapshots concurrently, yielding as they complete.
+
+    Fetches run on the batch pool (see get_batch_executor) under one overall
+    deadline and within the quota budget (see plan_region_batch). Snapshots
+    that finish together have their keywords ranked together.
+
+    Args:
+        pairs (list): [(region, category_id or None), ...]
+        keywords (int): Trending keywords to include per pair
+        timeout (float): Seconds until unfinished pairs are reported as timed out
+
+    Yields:
+        dict: A summary with "status" ('ok' or 'stale'), or the pair with
+        "status" 'skipped', 'error' or 'timeout'
+    """
+    live, stale, skipped = plan_region_batch(pairs)
+
+    yield from _summaries(stale, keywords, "stale")
+    for region, category_id in skipped:
+        yield {"region": region, "category_id": category_id, "status": "skipped", "error": "Quota budget exhausted"}
+
+    executor = get_batch_executor()
+    futures = {executor.submit(get_region_snapshot, *pair): pair for pair in live}
+    pending = set(futures)
+    deadline = time() + timeout
+    while pending:
+        done, pending = wait(pending, timeout=max(0, deadline - time()), return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        snapshots = {}
+        for future in done:
+            region, category_id = futures[future]
+            try:
+                snapshots[(region, category_id)] = future.result()
+            except Exception as e:
+                logger.error(f"Batch fetch of {region}/{category_id or 'all'} failed: {e}")
+                yield {"region": region, "category_id": category_id, "status": "error", "error": str(e)}
+        yield from _summaries(snapshots, keywords, "ok")
+
+    for future in pending:
+        future.cancel()
+        region, category_id = futures[future]
+        yield {"region": region, "category_id": category_id, "status": "timeout"}
@@ -4,13 +4,17 @@ Provides comprehensive SEO keyword recommendations and optimisation tips for con
 with support for YouTube, Google trends, and competitor analysis.
 """
 
-from youtubesearchpython import Suggestions, VideosSearch
-from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
 import string
 import re
 from collections import Counter
 import logging
 
+from Creovue.utils.lazy import lazy_import
+
+# Loaded on the first SEO request rather than at app start-up
+youtubesearchpython = lazy_import("youtubesearchpython")
+sklearn_text = lazy_import("sklearn.feature_extraction.text")
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -48,7 +52,7 @@ def filter_stopwords(words, custom_stopwords=None):
     if not words:
         return []
         
-    stopwords = set(ENGLISH_STOP_WORDS)
+    stopwords = set(sklearn_text.ENGLISH_STOP_WORDS)
     if custom_stopwords:
         stopwords.update(custom_stopwords)
     
@@ -100,7 +104,7 @@ def analyze_competition(keyword, max_results=5):
         return {"title_patterns": [], "avg_duration": 0}
     
     try:
-        search = VideosSearch(clean, limit=max_results)
+        search = youtubesearchpython.VideosSearch(clean, limit=max_results)
         results = search.result().get('result', [])
         
         # Extract titles for pattern analysis
@@ -111,7 +115,7 @@ def analyze_competition(keyword, max_results=5):
         
         # Find common patterns excluding stopwords
         common_words = [word for word, count in word_counts.most_common(10) 
-                       if word not in ENGLISH_STOP_WORDS and len(word) > 3]
+                       if word not in sklearn_text.ENGLISH_STOP_WORDS and len(word) > 3]
         
         # Calculate average duration if available
         durations = []
@@ -248,7 +252,7 @@ def get_seo_recommendations(keyword, include_competition=True, debug=False):
     
     try:
         # Get YouTube suggestions
-        suggestions = Suggestions().get(clean)
+        suggestions = youtubesearchpython.Suggestions().get(clean)
         raw_keywords = suggestions.get('result', [])
 
         if debug:
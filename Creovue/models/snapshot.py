@@ -0,0 +1,94 @@
+"""Module: snapshot.py."""
+# models/snapshot.py
+import logging
+from time import time
+
+from Creovue.app_secrets import creo_db_record_snapshots
+from Creovue.db.trend_store import record_snapshot, load_latest_snapshot
+from Creovue.utils.youtube_client import get_youtube_client, execute
+from Creovue.utils.decorators import cached
+
+logger = logging.getLogger('trends.snapshot')
+
+# One superset page covers every field the trends aggregators read
+SNAPSHOT_PARTS = "snippet,statistics,contentDetails"
+SNAPSHOT_MAX_RESULTS = 50  # mostPopular caps a page at 50 videos
+SNAPSHOT_TTL = 1800  # Shortest TTL of any aggregator built on top of it
+# No stale-while-revalidate here: aggregators revalidate in the background and
+# must recompute from a fresh snapshot, not from the stale one they replace.
+STORE_REUSE_AGE = 300  # A snapshot another worker stored this recently is reused
+
+
+@cached(expiry_seconds=SNAPSHOT_TTL)
+def get_region_snapshot(region, category_id=None):
+    """
+    Fetch the trending ("mostPopular") snapshot for a region/category.
+
+    All trends aggregators are computed from this in-memory page, so a
+    dashboard load costs a single videos.list call per region instead of
+    one call per aggregator. Each fetched snapshot is also recorded in the
+    local trend store, and one stored by another worker within the last few
+    minutes is reused instead of calling the API again.
+
+    Args:
+        region (str): ISO region code (e.g. 'US', 'NG', 'IN')
+        category_id (str, optional): YouTube category ID to filter by
+
+    Returns:
+        dict: {"region", "category_id", "fetched_at", "items"}
+    """
+    if creo_db_record_snapshots:
+        try:
+            stored = load_latest_snapshot(region, category_id, max_age=STORE_REUSE_AGE)
+        except Exception as e:
+            logger.warning(f"Could not read stored snapshot for {region}/{category_id or 'all'}: {e}")
+            stored = None
+        if stored is not None:
+            return stored
+
+    youtube = get_youtube_client()
+
+    params = {
+        "part": SNAPSHOT_PARTS,
+        "chart": "mostPopular",
+        "regionCode": region,
+        "maxResults": SNAPSHOT_MAX_RESULTS
+    }
+
+    if category_id:
+        params["videoCategoryId"] = category_id
+
+    response = execute(youtube.videos().list(**params))
+    items = response.get('items', [])
+    logger.info(f"Fetched trending snapshot for {region}/{category_id or 'all'}: {len(items)} videos")
+
+    snapshot = {
+        "region": region,
+        "category_id": category_id,
+        "fetched_at": time(),
+        "items": items
+    }
+
+    if creo_db_record_snapshots:
+        try:
+            record_snapshot(snapshot)
+        except Exception as e:
+            logger.warning(f"Could not store snapshot for {region}/{category_id or 'all'}: {e}")
+
+    return snapshot
+
+
+def get_snapshot_items(region, category_id=None, limit=None):
+    """
+    Return the trending video items of a snapshot, optionally truncated.
+
+    Args:
+        region (str): ISO region code
+        category_id (str, optional): YouTube category ID to filter by
+        limit (int, optional): Only return the first `limit` videos
+
+    Returns:
+        list: Raw videos.list items
+    """
+    items = get_region_snapshot(region, category_id)["items"]
+    return items[:limit] if limit else items
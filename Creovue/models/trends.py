@@ -1,30 +1,27 @@
 # trends.py (Production-ready)
-import requests
-from googleapiclient.discovery import build
 from datetime import datetime, timedelta
 import random
 import re
 import logging
 import functools
 from threading import Timer
-from time import time
 import os
-import io
-import base64
 
 from collections import defaultdict
-import random
-from Creovue.utils.youtube_client import get_youtube_client
+from Creovue.utils.quota import QuotaExceeded
 from Creovue.utils.decorators import cached, handle_api_error
+from Creovue.utils.cache import get_cache
+from Creovue.utils.geo import resolve_default_region
+from Creovue.models.snapshot import get_region_snapshot, get_snapshot_items
+from Creovue.models.keyword_index import KeywordIndex, snapshot_keyword_stats
+from Creovue.ml.scoring import rank_keywords
+from Creovue.charts import grouped_bar_chart, render_on_pool, build_figure, data_uri, chart_url
+from Creovue.models.catalog import get_all_regions, get_trending_regions, get_category_names
+from Creovue.models.channels import get_channels
+from Creovue.db.trend_store import get_keyword_daily_series, get_top_keyword
 
-from youtubesearchpython import Suggestions
-
-import pycountry, geocoder
-import matplotlib.pyplot as plt
-import numpy as np
 
 from collections import Counter, defaultdict
-from Creovue.app_secrets import creo_api_key, creo_base_url
 # models/trends.py
 
 # Setup logging
@@ -42,15 +39,6 @@ YOUTUBE_API_VERSION = "v3"
 CACHE_DURATION = 3600  # Cache for 1 hour
 
 
-# trends.py (Enhanced Production-ready)
-# Cache storage
-_trend_cache = {}
-_cache_timestamps = {}
-
-
-def get_youtube_client():
-    return build(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, developerKey=creo_api_key)
-
 def sanitize_text(text):
     """Remove special characters and common stop words"""
     # Basic stopwords list
@@ -61,111 +49,6 @@ def sanitize_text(text):
     words = [word for word in text.split() if word not in stopwords and len(word) > 2]
     return words
 
-def fetch_trending_keywords(region="US"):
-    youtube = get_youtube_client()
-    try:
-        response = youtube.videos().list(
-            part="snippet",
-            chart="mostPopular",
-            regionCode=region,
-            maxResults=50  # Increased to get better keyword data
-        ).execute()
-
-        keywords = []
-        for item in response['items']:
-            title = item['snippet']['title']
-            description = item['snippet'].get('description', '')
-            
-            # Extract keywords from title and description
-            keywords.extend(sanitize_text(title))
-            keywords.extend(sanitize_text(description))
-
-        # Count and return top 10 keywords
-        counter = Counter(keywords)
-        common = counter.most_common(10)
-        return [{"name": word, "volume": count * 10} for word, count in common]
-    except Exception as e:
-        print(f"Error fetching trending keywords: {e}")
-        return [{"name": f"Sample {i}", "volume": random.randint(50, 500)} for i in range(1, 11)]
-
-def fetch_top_channels(region="US"):
-    youtube = get_youtube_client()
-    try:
-        response = youtube.videos().list(
-            part="snippet",
-            chart="mostPopular",
-            regionCode=region,
-            maxResults=20  # Increased to get more diverse channels
-        ).execute()
-
-        channel_ids = list(set(item['snippet']['channelId'] for item in response['items']))
-        channels_data = []
-
-        for cid in channel_ids[:5]:
-            channel = youtube.channels().list(part="snippet,statistics", id=cid).execute()
-            if channel['items']:
-                info = channel['items'][0]
-                subscriber_count = int(info['statistics'].get('subscriberCount', 0))
-                # Format subscriber count nicely
-                if subscriber_count >= 1000000:
-                    subscribers = f"{subscriber_count / 1000000:.1f}M"
-                else:
-                    subscribers = f"{subscriber_count // 1000}K"
-                    
-                channels_data.append({
-                    "name": info['snippet']['title'],
-                    "subscribers": subscribers,
-                    "thumbnail": info['snippet'].get('thumbnails', {}).get('default', {}).get('url', '')
-                })
-        return channels_data
-    except Exception as e:
-        print(f"Error fetching top channels: {e}")
-        return [{"name": f"Channel {i}", "subscribers": f"{random.randint(100, 999)}K", 
-                "thumbnail": ""} for i in range(1, 6)]
-
-def get_trend_chart_data():
-    # Simulate a trend chart over 7 days using top keyword frequency
-    labels = [(datetime.now() - timedelta(days=i)).strftime("%a") for i in reversed(range(7))]
-    values = [random.randint(10, 50) for i in range(7)]  # Fixed variable name error
-    
-    # Add a second dataset for comparison
-    values2 = [random.randint(5, 45) for i in range(7)]
-    
-    return {
-        "labels": labels, 
-        "values": values,
-        "values2": values2
-    }
-
-def cached(expiry_seconds=CACHE_DURATION):
-    """Decorator for caching API results"""
-    def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            cache_key = f"{func.__name__}:{str(args)}:{str(kwargs)}"
-            current_time = time()
-            
-            # Return cached result if valid
-            if cache_key in _trend_cache and current_time - _cache_timestamps.get(cache_key, 0) < expiry_seconds:
-                logger.info(f"Using cached data for {func.__name__}")
-                return _trend_cache[cache_key]
-            
-            # Get fresh data
-            result = func(*args, **kwargs)
-            _trend_cache[cache_key] = result
-            _cache_timestamps[cache_key] = current_time
-            return result
-        return wrapper
-    return decorator
-
-def get_youtube_client():
-    """Get authenticated YouTube API client"""
-    try:
-        return build(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, developerKey=creo_api_key)
-    except Exception as e:
-        logger.error(f"Failed to create YouTube API client: {e}")
-        raise
-
 def handle_api_error(func):
     """Decorator to handle API errors gracefully"""
     @functools.wraps(func)
@@ -173,34 +56,23 @@ def handle_api_error(func):
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            logger.error(f"API error in {func.__name__}: {e}")
+            if isinstance(e, QuotaExceeded):
+                logger.warning(f"Quota exhausted in {func.__name__} with nothing cached: {e}")
+            else:
+                logger.error(f"API error in {func.__name__}: {e}")
             # Return sensible defaults based on function
             if "keywords" in func.__name__:
                 return []
             elif "channels" in func.__name__:
                 return []
             elif "chart" in func.__name__:
-                return {"labels": [], "values": []}
+                return {"labels": [], "datasets": []}
             else:
                 return None
     return wrapper
 
-def extract_keywords_from_title(title):
-    """Extract meaningful keywords from title"""
-    # Remove special characters and lowercase
-    cleaned = re.sub(r'[^\w\s]', ' ', title.lower())
-    
-    # Filter out common words and short terms
-    common_words = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", 
-                   "with", "by", "of", "from", "as", "is", "are", "was", "were", "be", 
-                   "this", "that", "it", "what", "when", "where", "how", "why", "who",
-                   "video", "new", "top", "best", "vs", "you", "your", "i", "we", "they"}
-    
-    keywords = [word for word in cleaned.split() if word not in common_words and len(word) > 2]
-    return keywords
-
-@cached(expiry_seconds=3600)  # Cache for 1 hour
 @handle_api_error
+@cached(expiry_seconds=3600, stale_while_revalidate=3600)  # Cache for 1 hour, serve stale for 1 more
 def fetch_top_channels(region="GB", category_id=None, max_results=10):
     """
     Fetch top channels with detailed metrics
@@ -213,27 +85,15 @@ def fetch_top_channels(region="GB", category_id=None, max_results=10):
     Returns:
         list: Channel data with detailed metrics
     """
-    youtube = get_youtube_client()
-    
-    # Get trending videos first
-    params = {
-        "part": "snippet",
-        "chart": "mostPopular",
-        "regionCode": region,
-        "maxResults": 50  # Get more videos to find unique channels
-    }
-    
-    if category_id:
-        params["videoCategoryId"] = category_id
-        
-    response = youtube.videos().list(**params).execute()
+    # Trending videos come from the shared region snapshot
+    items = get_snapshot_items(region, category_id)
     
     # Count channel occurrences and collect unique IDs
     channel_counts = Counter()
     channel_ids = set()
     channel_videos = defaultdict(list)
     
-    for item in response.get('items', []):
+    for item in items:
         channel_id = item['snippet']['channelId']
         channel_title = item['snippet']['channelTitle']
         video_id = item['id']
@@ -246,37 +106,33 @@ def fetch_top_channels(region="GB", category_id=None, max_results=10):
     top_channel_ids = [cid for cid, _ in channel_counts.most_common(max_results)]
     channels_data = []
     
-    # Batch request channel details
-    if top_channel_ids:
-        for i in range(0, len(top_channel_ids), 50):  # Process in batches of 50
-            batch_ids = top_channel_ids[i:i+50]
-            channels_response = youtube.channels().list(
-                part="snippet,statistics,brandingSettings",
-                id=",".join(batch_ids)
-            ).execute()
-            
-            for info in channels_response.get('items', []):
-                cid = info['id']
-                stats = info.get('statistics', {})
-                branding = info.get('brandingSettings', {}).get('channel', {})
-                
-                # Format large numbers with K/M/B suffix
-                subs = int(stats.get('subscriberCount', 0))
-                views = int(stats.get('viewCount', 0))
-                
-                channels_data.append({
-                    "id": cid,
-                    "name": info['snippet']['title'],
-                    "description": branding.get('description', ''),
-                    "thumbnail": info['snippet']['thumbnails'].get('default', {}).get('url', ''),
-                    "subscribers": format_number(subs),
-                    "subscribers_raw": subs,
-                    "views": format_number(views),
-                    "video_count": stats.get('videoCount', 0),
-                    "country": info['snippet'].get('country', ''),
-                    "trending_videos": len(channel_videos[cid]),
-                    "category": get_channel_category(branding.get('keywords', ''))
-                })
+    # Channel details come from the shared channel service, which batches
+    # and caches lookups across regions and concurrent requests
+    channel_items = get_channels(top_channel_ids)
+    for cid in top_channel_ids:
+        info = channel_items.get(cid)
+        if info is None:
+            continue
+        stats = info.get('statistics', {})
+        branding = info.get('brandingSettings', {}).get('channel', {})
+        
+        # Format large numbers with K/M/B suffix
+        subs = int(stats.get('subscriberCount', 0))
+        views = int(stats.get('viewCount', 0))
+        
+        channels_data.append({
+            "id": cid,
+            "name": info['snippet']['title'],
+            "description": branding.get('description', ''),
+            "thumbnail": info['snippet']['thumbnails'].get('default', {}).get('url', ''),
+            "subscribers": format_number(subs),
+            "subscribers_raw": subs,
+            "views": format_number(views),
+            "video_count": stats.get('videoCount', 0),
+            "country": info['snippet'].get('country', ''),
+            "trending_videos": len(channel_videos[cid]),
+            "category": get_channel_category(branding.get('keywords', ''))
+        })
     
     # Sort by trending score and subscriber count
     channels_data.sort(key=lambda x: (x["trending_videos"], x["subscribers_raw"]), reverse=True)
@@ -322,77 +178,56 @@ def get_channel_category(keywords_str):
         return category_scores.most_common(1)[0][0]
     return "General"
 
-@cached(expiry_seconds=3600)  # Cache for 1 hour
 @handle_api_error
+@cached(expiry_seconds=1800)  # New snapshots arrive at most every 30 minutes
 def get_trend_chart_data(days=14, region="GB", keyword=None):
     """
     Get historical trend data for charting
     
+    Built from the daily rollups of stored trending snapshots, so the cost is
+    one row per day. Days before the first stored snapshot are left empty.
+    
     Args:
         days (int): Number of days to include
         region (str): Country code
-        keyword (str, optional): Specific keyword to track
+        keyword (str, optional): Specific keyword to track (default: the
+            region's most frequent trending keyword over the period)
         
     Returns:
         dict: Chart data with labels and datasets
     """
-    # In a production environment, you would pull this from a database
-    # where you've been storing daily trend data
-    # For now, we'll generate realistic simulated data
-    
-    labels = [(datetime.now() - timedelta(days=i)).strftime("%d %b") for i in reversed(range(days))]
-    
-    # Create multiple datasets for different metrics
-    datasets = []
-    
-    # Keyword volume dataset - create realistic trend pattern
-    base_value = random.randint(20, 40)
-    values = []
-    
-    # Generate realistic trending pattern with some randomness but following a trend
-    trend_direction = random.choice([1, -1])  # 1 = upward trend, -1 = downward trend
-    
-    for i in range(days):
-        # Add day of week pattern (weekends higher than weekdays)
-        day_of_week = (datetime.now() - timedelta(days=days-i-1)).weekday()
-        weekend_boost = 10 if day_of_week >= 5 else 0
-        
-        # Add trend direction
-        trend_factor = (i / days) * 15 * trend_direction
-        
-        # Add randomness
-        noise = random.randint(-5, 5)
-        
-        value = max(5, int(base_value + weekend_boost + trend_factor + noise))
-        values.append(value)
-    
-    datasets.append({
-        "label": f"{'Keyword Volume' if not keyword else f'{keyword} Volume'}",
-        "data": values,
-        "backgroundColor": "rgba(54, 162, 235, 0.5)",
-        "borderColor": "rgba(54, 162, 235, 1)",
-        "borderWidth": 1,
-        "tension": 0.4  # Smooth line
-    })
-    
-    # Engagement dataset (different pattern)
-    engagement_values = [int(v * random.uniform(0.8, 1.2)) for v in values]
-    datasets.append({
-        "label": "Viewer Engagement",
-        "data": engagement_values,
-        "backgroundColor": "rgba(255, 99, 132, 0.5)",
-        "borderColor": "rgba(255, 99, 132, 1)",
-        "borderWidth": 1,
-        "tension": 0.4
-    })
+    if not keyword:
+        keyword = get_top_keyword(region, days)
+    series = get_keyword_daily_series(region, keyword, days) if keyword else []
+
+    labels = [datetime.strptime(point["day"], "%Y-%m-%d").strftime("%d %b") for point in series]
+    datasets = [
+        {
+            "label": f"{keyword} Volume" if keyword else "Keyword Volume",
+            "data": [point["volume"] for point in series],
+            "backgroundColor": "rgba(54, 162, 235, 0.5)",
+            "borderColor": "rgba(54, 162, 235, 1)",
+            "borderWidth": 1,
+            "tension": 0.4  # Smooth line
+        },
+        {
+            "label": "Average Views",
+            "data": [point["avg_views"] for point in series],
+            "backgroundColor": "rgba(255, 99, 132, 0.5)",
+            "borderColor": "rgba(255, 99, 132, 1)",
+            "borderWidth": 1,
+            "tension": 0.4
+        }
+    ]
     
     return {
         "labels": labels,
-        "datasets": datasets
+        "datasets": datasets,
+        "keyword": keyword
     }
 
-@cached(expiry_seconds=43200)  # Cache for 12 hours
 @handle_api_error
+@cached(expiry_seconds=43200)  # Cache for 12 hours
 def get_related_keywords(keyword, max_results=10):
     """Find related keywords for a given seed keyword"""
     try:
@@ -442,43 +277,6 @@ def get_related_keywords(keyword, max_results=10):
         return []
 
 
-def get_trending_regions():
-    """Get list of available regions with localised names"""
-    # Custom name mappings to match original entries and common usage
-    custom_names = {
-        "GB": "United Kingdom",
-        "US": "United States",
-        "KR": "South Korea",
-        "KP": "North Korea",
-        "TW": "Taiwan",
-        "MK": "North Macedonia",
-        # Add other custom mappings here if needed
-    }
-    
-    regions = []
-    for country in pycountry.countries:
-        code = country.alpha_2
-        name = custom_names.get(code, country.name)
-        regions.append({"code": code, "name": name})
-    print(regions)
-    return regions
-
-def get_trending_regions():
-    """Get list of available regions with localised names"""
-    return [
-        {"code": "GB", "name": "United Kingdom"},
-        {"code": "US", "name": "United States"},
-        {"code": "CA", "name": "Canada"},
-        {"code": "AU", "name": "Australia"},
-        {"code": "DE", "name": "Germany"},
-        {"code": "FR", "name": "France"},
-        {"code": "JP", "name": "Japan"},
-        {"code": "IN", "name": "India"},
-        {"code": "BR", "name": "Brazil"},
-        {"code": "KR", "name": "South Korea"}
-    ]
-
-
 # URL and route utility functions
 def generate_trend_api_url(base_url, region="GB", category=None, keyword=None):
     """Generate API URL with optional parameters"""
@@ -491,9 +289,7 @@ def generate_trend_api_url(base_url, region="GB", category=None, keyword=None):
 
 def clear_trend_cache():
     """Clear all cached trend data"""
-    global _trend_cache, _cache_timestamps
-    _trend_cache = {}
-    _cache_timestamps = {}
+    get_cache().clear()
     logger.info("Trend cache cleared")
     return True
 
@@ -508,66 +304,19 @@ def get_category_distribution_(region="US"):
 
 
 
-def get_all_regions():
-    """Get list of available regions with localised names"""
-    # Custom name mappings to match original entries and common usage
-    custom_names = {
-        "GB": "United Kingdom",
-        "US": "United States",
-        "KR": "South Korea",
-        "KP": "North Korea",
-        "TW": "Taiwan",
-        "MK": "North Macedonia",
-        # Add other custom mappings here if needed
-    }
-    
-    regions = []
-    for country in pycountry.countries:
-        code = country.alpha_2
-        name = custom_names.get(code, country.name)
-        regions.append({"code": code, "name": name})
-    
-    return regions
-
 # Default region
 def get_default_region():
-    """Determine the default region using geolocation, fallback to 'US'."""
-    try:
-        # Get location based on IP
-        location = geocoder.ip('me')
-        if location and location.country:
-            return location.country.upper()
-    except Exception as e:
-        print(f"Geolocation failed: {e}")
-    return "US"  # Default fallback
+    """Return the default region, resolved once per process (no network I/O after startup)."""
+    return resolve_default_region()
 
 def get_available_categories(api_key, region_code="US"):
-    """Retrieve available YouTube video categories using the YouTube Data API v3."""
-    url = f"{creo_base_url}/videoCategories"
-    
-    params = {
-        "part": "snippet",
-        "regionCode": region_code,
-        "key": api_key
-    }
-    try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        if "error" in data:
-            error_msg = data["error"]["message"]
-            raise Exception(f"YouTube API Error: {error_msg}")
-        
-        categories = []
-        for item in data.get("items", []):
-            if item["snippet"].get("assignable"):
-                categories.append(item["snippet"]["title"])
-        
-        return sorted(categories)
-    
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"Failed to connect to YouTube API: {str(e)}")
+    """
+    Retrieve the assignable YouTube video category titles for a region.
+
+    Served from the shared category catalog; `api_key` is kept for existing
+    callers, the catalog always uses the configured key.
+    """
+    return sorted(get_category_names(region_code, assignable_only=True).values())
     
 
 def get_trending_keywords(region, category):
@@ -664,34 +413,19 @@ def get_trending_keywords(region, category):
     return keyword_list, timestamp
 
 
-@cached(expiry_seconds=86400)  # Cache for 1 day
 @handle_api_error
+@cached(expiry_seconds=86400, stale_while_revalidate=43200)  # Cache for 1 day, serve stale for 12 hours
 def get_category_distribution(region):
     """Get the distribution of video categories in trending content"""
-    youtube = get_youtube_client()
+    # Category names come from the shared catalog
+    category_names = get_category_names(region)
     
-    # First, get category list
-    categories_response = youtube.videoCategories().list(
-        part="snippet",
-        regionCode=region
-    ).execute()
-    
-    category_names = {
-        item['id']: item['snippet']['title'] 
-        for item in categories_response.get('items', [])
-    }
-    
-    # Get trending videos with category info
-    videos_response = youtube.videos().list(
-        part="snippet",
-        chart="mostPopular",
-        regionCode=region,
-        maxResults=50
-    ).execute()
+    # Trending videos with category info come from the shared snapshot
+    items = get_snapshot_items(region)
     
     # Count categories
     category_counts = Counter()
-    for item in videos_response.get('items', []):
+    for item in items:
         category_id = item['snippet']['categoryId']
         category_counts[category_id] += 1
     
@@ -707,8 +441,8 @@ def get_category_distribution(region):
     
     return results
 
-@cached(expiry_seconds=86400)
 @handle_api_error
+@cached(expiry_seconds=86400, stale_while_revalidate=43200)
 def get_category_age_distribution(region):
     """
     Simulate age distribution of viewers for trending video categories.
@@ -717,27 +451,11 @@ def get_category_age_distribution(region):
     Returns:
         dict: {category_name: {age_group: view_count}}
     """
-    youtube = get_youtube_client()
-
-    # 1. Get category names
-    categories_response = youtube.videoCategories().list(
-        part="snippet",
-        regionCode=region
-    ).execute()
-
-    category_names = {
-        item['id']: item['snippet']['title']
-        for item in categories_response.get('items', [])
-        if item['snippet'].get('assignable')  # only actual video categories
-    }
+    # 1. Get category names (only actual video categories) from the shared catalog
+    category_names = get_category_names(region, assignable_only=True)
 
-    # 2. Get trending videos
-    videos_response = youtube.videos().list(
-        part="snippet,statistics",
-        chart="mostPopular",
-        regionCode=region,
-        maxResults=50
-    ).execute()
+    # 2. Trending videos come from the shared snapshot
+    items = get_snapshot_items(region)
 
     
     AGE_GROUPS = ["13-17", "18-24", "25-34", "35-44", "45-54", "55+"]
@@ -759,7 +477,7 @@ def get_category_age_distribution(region):
     #})
 
     # 4. Process each video
-    for video in videos_response.get('items', []):
+    for video in items:
         stats = video.get('statistics', {})
         cat_id = video['snippet'].get('categoryId')
         view_count = int(stats.get('viewCount', 0))
@@ -776,50 +494,54 @@ def get_category_age_distribution(region):
 
         category_age_data[cat_name]["total_views"] += view_count
 
-    return category_age_data
+    # Plain dicts so the result can be stored by any cache backend
+    return {name: dict(ages) for name, ages in category_age_data.items()}
 
-def visualise_category_age_distribution(region):
+AGE_GROUP_COLORS = ['#66c2a5', '#fc8d62', '#8da0cb', '#e78ac3', '#a6d854', '#ffd92f']
+
+def category_age_chart(region):
     """
-    Create a visualisation of the age distribution for each category.
+    Build the chart spec of the age distribution for each category.
 
     Args:
         region (str): Region code (e.g. 'US', 'NG')
     Returns:
-        matplotlib.figure.Figure: A horizontal bar chart figure
+        dict: A grouped bar chart spec (see Creovue.charts)
     """
     data = get_category_age_distribution(region)
 
     categories = list(data.keys())
     age_groups = ["13-17", "18-24", "25-34", "35-44", "45-54", "55+"]
 
-    # Prepare chart canvas
-    fig, ax = plt.subplots(figsize=(14, 8))
-
-    # Bar settings
-    bar_width = 0.12
-    index = np.arange(len(categories))
-    colors = ['#66c2a5', '#fc8d62', '#8da0cb', '#e78ac3', '#a6d854', '#ffd92f']
-
-    # Loop through each age group to plot
+    # One series of view percentages per age group
+    series = []
     for i, age_group in enumerate(age_groups):
         values = []
         for category in categories:
-            total_views = data[category].get("total_views", 1)  # avoid div-by-zero
+            total_views = data[category].get("total_views", 1) or 1  # avoid div-by-zero
             count = data[category].get(age_group, 0)
             percent = (count / total_views) * 100
             values.append(round(percent, 2))
-        ax.bar(index + i * bar_width, values, bar_width, label=age_group, color=colors[i])
+        series.append({"label": age_group, "values": values, "color": AGE_GROUP_COLORS[i]})
 
-    # Labels and formatting
-    ax.set_xlabel("Categories")
-    ax.set_ylabel("View Percentage (%)")
-    ax.set_title(f"Age Distribution by YouTube Category in {region}")
-    ax.set_xticks(index + bar_width * (len(age_groups) - 1) / 2)
-    ax.set_xticklabels(categories, rotation=45, ha='right')
-    ax.legend(title="Age Group")
+    return grouped_bar_chart(
+        categories, series,
+        title=f"Age Distribution by YouTube Category in {region}",
+        xlabel="Categories",
+        ylabel="View Percentage (%)",
+        legend_title="Age Group"
+    )
 
-    plt.tight_layout()
-    return fig
+def visualise_category_age_distribution(region):
+    """
+    Create a visualisation of the age distribution for each category.
+
+    Args:
+        region (str): Region code (e.g. 'US', 'NG')
+    Returns:
+        matplotlib.figure.Figure: A grouped bar chart figure owned by the caller
+    """
+    return build_figure(category_age_chart(region))
 
 def visualise_category_age_distribution_base64(region):
     """
@@ -830,45 +552,23 @@ def visualise_category_age_distribution_base64(region):
     Returns:
         str: base64-encoded PNG image as data URI
     """
-    data = get_category_age_distribution(region)
-    categories = list(data.keys())
-    age_groups = ["13-17", "18-24", "25-34", "35-44", "45-54", "55+"]
-    colors = ['#66c2a5', '#fc8d62', '#8da0cb', '#e78ac3', '#a6d854', '#ffd92f']
-
-    fig, ax = plt.subplots(figsize=(14, 8))
-    bar_width = 0.12
-    index = np.arange(len(categories))
-
-    for i, age_group in enumerate(age_groups):
-        values = []
-        for category in categories:
-            total_views = data[category].get("total_views", 1)
-            count = data[category].get(age_group, 0)
-            percent = (count / total_views) * 100
-            values.append(round(percent, 2))
-        ax.bar(index + i * bar_width, values, bar_width, label=age_group, color=colors[i])
+    return data_uri(render_on_pool(category_age_chart(region)))
 
-    ax.set_xlabel("Categories")
-    ax.set_ylabel("View Percentage (%)")
-    ax.set_title(f"Age Distribution by YouTube Category in {region}")
-    ax.set_xticks(index + bar_width * (len(age_groups) - 1) / 2)
-    ax.set_xticklabels(categories, rotation=45, ha='right')
-    ax.legend(title="Age Group")
-
-    plt.tight_layout()
+def visualise_category_age_distribution_url(region):
+    """
+    URL of the cached PNG of the age distribution bar chart by YouTube category.
 
-    # Convert plot to base64 image
-    buf = io.BytesIO()
-    fig.savefig(buf, format='png', bbox_inches='tight')
-    buf.seek(0)
-    base64_img = base64.b64encode(buf.read()).decode('utf-8')
-    plt.close(fig)  # Clean up
-    return f"data:image/png;base64,{base64_img}"
+    Args:
+        region (str): e.g. 'US', 'NG'
+    Returns:
+        str: /charts/<hash>.png, rendered only when the data changed
+    """
+    return chart_url(category_age_chart(region))
 
 
 # Simulated top channels
-@cached(expiry_seconds=86400)
 @handle_api_error
+@cached(expiry_seconds=86400, stale_while_revalidate=43200)
 def get_top_channels(region):
     """
     Get top channels from trending videos in the specified region.
@@ -879,56 +579,42 @@ def get_top_channels(region):
     Returns:
         (list of dict, str): List of channel info + timestamp
     """
-    youtube = get_youtube_client()
-
-    # Step 1: Get trending videos
-    video_resp = youtube.videos().list(
-        part="snippet",
-        chart="mostPopular",
-        regionCode=region,
-        maxResults=25
-    ).execute()
+    # Step 1: Trending videos come from the shared snapshot
+    items = get_snapshot_items(region, limit=25)
 
     # Step 2: Extract unique channel IDs
     channel_map = {}
-    for item in video_resp.get("items", []):
+    for item in items:
         snippet = item.get("snippet", {})
         channel_id = snippet.get("channelId")
         channel_title = snippet.get("channelTitle")
         if channel_id and channel_id not in channel_map:
             channel_map[channel_id] = channel_title
 
-    # Step 3: Get channel stats
+    # Step 3: Get channel stats from the shared, batched channel service
     channel_ids = list(channel_map.keys())
     channels_data = []
-    
-    for i in range(0, len(channel_ids), 50):  # YouTube API allows 50 IDs max per call
-        ids_chunk = channel_ids[i:i + 50]
-        chan_resp = youtube.channels().list(
-            part="snippet,statistics",
-            id=",".join(ids_chunk)
-        ).execute()
-
-        for chan in chan_resp.get("items", []):
-            name = chan["snippet"]["title"]
-            subs = chan["statistics"].get("subscriberCount", "0")
-            avatar = chan["snippet"]["thumbnails"]["default"]["url"]
-            published = chan["snippet"].get("publishedAt", "")
-
-            # Estimate age in years from creation date
-            try:
-                created_date = datetime.strptime(published, "%Y-%m-%dT%H:%M:%SZ")
-                years = max(1, int((datetime.utcnow() - created_date).days // 365))
-                age_label = f"{years}+ yrs"
-            except:
-                age_label = "N/A"
-
-            channels_data.append({
-                "name": name,
-                "subscribers": f"{int(subs):,}",
-                "avatar_url": avatar,
-                "channel_age": age_label
-            })
+
+    for chan in get_channels(channel_ids).values():
+        name = chan["snippet"]["title"]
+        subs = chan["statistics"].get("subscriberCount", "0")
+        avatar = chan["snippet"]["thumbnails"]["default"]["url"]
+        published = chan["snippet"].get("publishedAt", "")
+
+        # Estimate age in years from creation date
+        try:
+            created_date = datetime.strptime(published, "%Y-%m-%dT%H:%M:%SZ")
+            years = max(1, int((datetime.utcnow() - created_date).days // 365))
+            age_label = f"{years}+ yrs"
+        except:
+            age_label = "N/A"
+
+        channels_data.append({
+            "name": name,
+            "subscribers": f"{int(subs):,}",
+            "avatar_url": avatar,
+            "channel_age": age_label
+        })
 
     # Sort by subscriber count descending (if available)
     def sort_key(c):
@@ -943,9 +629,9 @@ def get_top_channels(region):
     return sorted_channels , timestamp
 
 
-@cached(expiry_seconds=1800)  # Cache for 30 minutes
 @handle_api_error
-def fetch_trending_keywords(region, category_id=None, max_results=50):
+@cached(expiry_seconds=1800, stale_while_revalidate=1800)  # Cache for 30 minutes, serve stale for 30 more
+def fetch_trending_keywords(region, category_id=None, max_results=50, score_formula="trend"):
     """
     Fetch trending keywords with improved analysis and categorisation
     
@@ -953,68 +639,24 @@ def fetch_trending_keywords(region, category_id=None, max_results=50):
         region (str): Country code (default: GB for United Kingdom)
         category_id (str, optional): YouTube category ID to filter by
         max_results (int): Number of videos to analyse
+        score_formula (str): Ranking formula, a name in ml.scoring.SCORE_FORMULAS
         
     Returns:
         list: Keyword data with volume and trend indicators
     """
-    youtube = get_youtube_client()
-    
-    # Build request parameters
-    params = {
-        "part": "snippet,statistics,contentDetails",
-        "chart": "mostPopular",
-        "regionCode": region,
-        "maxResults": max_results
-    }
-    
-    if category_id:
-        params["videoCategoryId"] = category_id
-        
-    response = youtube.videos().list(**params).execute()
-    
-    # Extract and process keywords
-    all_keywords = []
-    keyword_stats = defaultdict(lambda: {"count": 0, "views": 0, "videos": []})
-    
-    for item in response.get('items', []):
-        video_id = item['id']
-        title = item['snippet']['title']
-        description = item['snippet'].get('description', '')
-        tags = item['snippet'].get('tags', [])
-        view_count = int(item['statistics'].get('viewCount', 0))
-        
-        # Extract keywords from title
-        title_keywords = extract_keywords_from_title(title)
-        all_keywords.extend(title_keywords)
-        
-        # Process all keywords including tags
-        for keyword in set(title_keywords + tags):
-            keyword = keyword.lower()
-            if len(keyword) > 2:  # Skip very short keywords
-                keyword_stats[keyword]["count"] += 1
-                keyword_stats[keyword]["views"] += view_count
-                keyword_stats[keyword]["videos"].append({
-                    "id": video_id,
-                    "title": title,
-                    "views": view_count
-                })
-    
-    # Calculate keyword metrics and rank
-    result = []
-    for keyword, data in keyword_stats.items():
-        if data["count"] > 1:  # Only include keywords that appear multiple times
-            avg_views = data["views"] / data["count"]
-            result.append({
-                "name": keyword,
-                "volume": data["count"] * 100,  # Weighted volume
-                "avg_views": int(avg_views),
-                "videos_count": data["count"],
-                "trend_score": int((data["count"] * avg_views) / 10000)  # Trend score formula
-            })
+    # Trending videos come from the shared region snapshot; its keyword index
+    # is updated only for the videos that changed since the last snapshot
+    snapshot = get_region_snapshot(region, category_id)
+    if max_results < len(snapshot["items"]):
+        index = KeywordIndex()
+        index.update(snapshot["items"][:max_results])
+        keyword_stats = index.keyword_stats(min_count=2)
+    else:
+        # Read in the same locked update, so a concurrent update cannot swap the snapshot
+        keyword_stats = snapshot_keyword_stats(snapshot, min_count=2)
     
-    # Sort by trend score (combined frequency and views)
-    result.sort(key=lambda x: x["trend_score"], reverse=True)
-    return result[:max_results]  # Return top 15 keywords
+    # Score keywords that appear multiple times in bulk and keep the top ones
+    return rank_keywords(keyword_stats, max_results, formula=score_formula)
 
 
 
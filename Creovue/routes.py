@@ -1,16 +1,35 @@
 
 import datetime
+import json
 import time
+from functools import partial
 from .logic import extract_keywords
 
-from flask import Flask, render_template, request, jsonify
-from .models.analytics import get_channel_stats, process_channel_analytics, fetch_youtube_analytics, generate_plot
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
+from .models.analytics import get_channel_stats, process_channel_analytics, fetch_youtube_analytics
 
-from Creovue.models.trends import fetch_trending_keywords, fetch_top_channels, get_all_regions, get_available_categories, get_category_age_distribution, get_default_region, get_top_channels, get_trend_chart_data, get_trending_keywords, visualise_category_age_distribution_base64
+from Creovue.models.trends import fetch_trending_keywords, fetch_top_channels, get_all_regions, get_available_categories, get_category_age_distribution, get_default_region, get_top_channels, get_trend_chart_data, get_trending_keywords
 from .models.seo import get_seo_recommendations
 
 from .app_secets import creo_channel_id, creo_api_key, creo_mock_view_history
 
+from .utils.concurrency import fan_out
+from .utils.geo import get_request_region
+from .utils.cache import cache_stats
+from .scheduler import scheduler_stats
+from .utils.transport import get_http_metrics
+from .utils.quota import get_quota_ledger
+from .utils.lazy import import_report
+from .utils.warmup import is_ready, warmup_report
+from .models.catalog import get_category_map, is_known_region
+from .models.snapshot import get_region_snapshot
+from .utils.http_cache import apply_cache_headers, cache_validators, is_not_modified, not_modified
+from .charts import MIMETYPES as CHART_MIMETYPES, RenderQueueFull, chart_json, get_chart_store, get_render_pool, load_chart, render_on_pool
+from .models.trends import category_age_chart, visualise_category_age_distribution_url
+from .models.region_batch import iter_region_batch
+from .utils.payload import InvalidPage, iter_json, parse_fields, project, shape_payload
+from .app_secrets import creo_batch_max_items
+
 from . import app
 from Creovue.models.trends  import (
     fetch_trending_keywords, 
@@ -70,7 +89,7 @@ def trends():
 @app.route("/trends")
 def trends():
     regions = get_all_regions()
-    default_region = get_default_region()
+    default_region = get_request_region(request)
     #print("default_region: ", default_region); #time.sleep(300)
     categories = get_available_categories(creo_api_key, default_region)
 
@@ -98,43 +117,239 @@ def trends():
         #channel_age=channel_age
     )
 
+def _json_response(payload):
+    """jsonify the payload, or stream it in encoded chunks when ?stream=1"""
+    if request.args.get("stream") == "1":
+        return Response(iter_json(payload), mimetype="application/json")
+    return jsonify(payload)
+
+# Sections of /api/trend_data and the fan-out tasks each one needs
+TREND_DATA_SECTIONS = {
+    "trending_keywords": ("trending_keywords",),
+    "keyword_age": ("categories",),
+    "category_distribution": ("category_distribution",),
+    "category_age": ("category_age",),
+    "top_channels": ("top_channels",),
+}
+
 @app.route('/api/trend_data')
 def trend_data():
-    region = request.args.get("region", get_default_region())
+    """
+    Trend data for one region
+
+    Query parameters:
+    - region: Country code (default: the visitor's region)
+    - fields: Comma-separated (dotted) fields to return, e.g. trending_keywords.name,top_channels;
+      sections left out are not computed
+    - limit / cursor: Page every list by `limit` items; pass back `next_cursor` for the next page
+    - stream: '1' to stream the encoded JSON in chunks
+    """
+    default_region = get_request_region(request)
+    region = request.args.get("region", default_region)
     category = request.args.get("category", None)
-
-    default_region = get_default_region()
-    categories = get_available_categories(creo_api_key, default_region)
+    fields = parse_fields(request.args.get("fields"))
 
     #trending_keywords, keyword_age = get_trending_keywords(region, category)
     #category_distribution, category_age = get_category_distribution(region)
     #top_channels, channel_age = get_top_channels(region)
 
-    trending_keywords, keyword_age = get_trending_keywords(region, categories); 
-    trending_keywords = fetch_trending_keywords(region)
-    category_distribution = get_category_distribution(region)
-    category_age_distribution = get_category_age_distribution(region)
-    top_channels, channel_data_age = get_top_channels(region)
-    
-    return jsonify({
-        "trending_keywords": trending_keywords,
-        "keyword_age": keyword_age,
-        "category_distribution": category_distribution,
-        "category_age": category_age_distribution,
-        "top_channels": top_channels,
-        #"channel_age": channel_age
+    tasks = {
+        "categories": partial(get_available_categories, creo_api_key, default_region),
+        "trending_keywords": partial(fetch_trending_keywords, region),
+        "category_distribution": partial(get_category_distribution, region),
+        "category_age": partial(get_category_age_distribution, region),
+        "top_channels": partial(get_top_channels, region),
+    }
+    if fields is not None:
+        # Only compute the sections the client asked for
+        needed = {task for section in fields for task in TREND_DATA_SECTIONS.get(section, ())}
+        tasks = {name: task for name, task in tasks.items() if name in needed}
+
+    # The cache entries the response is built from; unchanged entries mean an unchanged response
+    cache_sources = {
+        "categories": (get_category_map, (default_region,)),
+        "trending_keywords": (fetch_trending_keywords, (region,)),
+        "category_distribution": (get_category_distribution, (region,)),
+        "category_age": (get_category_age_distribution, (region,)),
+        "top_channels": (get_top_channels, (region,)),
+    }
+    cache_sources = [(get_region_snapshot, (region, None))] + [cache_sources[name] for name in tasks]
+    validators = cache_validators(request, cache_sources)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+
+    # Independent API-bound fetches run concurrently; latency is the slowest call
+    results, incomplete = fan_out(tasks, defaults={
+        "categories": [],
+        "trending_keywords": [],
+        "category_distribution": [],
+        "category_age": {},
+        "top_channels": ([], None),
+    })
+
+    payload = {}
+    if "categories" in results:
+        _keywords, payload["keyword_age"] = get_trending_keywords(region, results["categories"])
+    if "trending_keywords" in results:
+        payload["trending_keywords"] = results["trending_keywords"]
+    if "category_distribution" in results:
+        payload["category_distribution"] = results["category_distribution"]
+    if "category_age" in results:
+        payload["category_age"] = results["category_age"]
+    if "top_channels" in results:
+        top_channels, channel_data_age = results["top_channels"] or ([], None)
+        payload["top_channels"] = top_channels
+    payload["incomplete"] = incomplete
+
+    try:
+        payload = shape_payload(payload, request.args)
+    except InvalidPage as e:
+        return jsonify({"error": str(e)}), 400
+    if incomplete:
+        return apply_cache_headers(_json_response(payload), None)
+    return apply_cache_headers(_json_response(payload), validators or cache_validators(request, cache_sources))
+
+def _list_param(name):
+    """Read a list parameter from a JSON body (list) or the query string (comma-separated)."""
+    body = request.get_json(silent=True) or {}
+    value = body.get(name, request.args.get(name, ""))
+    if isinstance(value, str):
+        value = value.split(",")
+    return [str(v).strip() for v in value if str(v).strip()]
+
+@app.route('/api/trend_data/batch', methods=['GET', 'POST'])
+def trend_data_batch():
+    """
+    Trend summaries for many regions/categories in one request
+
+    Query parameters (or a JSON body with the same keys, as lists):
+    - regions: Comma-separated region codes (required)
+    - categories: Comma-separated category IDs (optional, default: all categories)
+    - keywords: Trending keywords per region (default: 10)
+    - fields: Comma-separated (dotted) fields to keep in each result, e.g. trending_keywords.name
+    - format: 'ndjson' to stream one line per region as it completes
+      (also selected by Accept: application/x-ndjson)
+    """
+    regions = list(dict.fromkeys(r.upper() for r in _list_param("regions")))
+    categories = _list_param("categories") or [None]
+    keywords = request.args.get("keywords", 10, type=int)
+
+    if not regions:
+        return jsonify({"error": "regions parameter is required"}), 400
+    unknown = [r for r in regions if not is_known_region(r)]
+    if unknown:
+        return jsonify({"error": f"Unknown regions: {', '.join(unknown)}"}), 400
+    pairs = [(region, category) for region in regions for category in categories]
+    if len(pairs) > creo_batch_max_items:
+        return jsonify({"error": f"At most {creo_batch_max_items} region/category pairs per request"}), 400
+
+    fields = parse_fields(request.args.get("fields"))
+    if fields is not None:
+        fields = dict(fields, region={}, category_id={}, status={})
+    results = (project(result, fields) for result in iter_region_batch(pairs, keywords=keywords))
+
+    if request.args.get("format") == "ndjson" or request.accept_mimetypes.best == "application/x-ndjson":
+        lines = (json.dumps(result) + "\n" for result in results)
+        # Headers go out before any region is fetched, and one may still fail or
+        # refresh mid-stream, so streamed batches are never validated or cached
+        return apply_cache_headers(Response(stream_with_context(lines), mimetype="application/x-ndjson"), None)
+
+    cache_sources = [(func, pair) for pair in pairs for func in (get_region_snapshot, fetch_trending_keywords)]
+    validators = cache_validators(request, cache_sources)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+
+    results = list(results)
+    response = _json_response({
+        "results": results,
+        "incomplete": [
+            {"region": r["region"], "category_id": r["category_id"], "status": r["status"]}
+            for r in results if r["status"] != "ok"
+        ]
     })
+    if any(r["status"] != "ok" for r in results):
+        return apply_cache_headers(response, None)
+    return apply_cache_headers(response, validators or cache_validators(request, cache_sources))
+
+@app.route('/api/cache_stats')
+def cache_stats_api():
+    """Report size and hit/miss/eviction counters of the shared cache"""
+    return jsonify(cache_stats())
+
+@app.route('/api/scheduler_stats')
+def scheduler_stats_api():
+    """Report last-run stats of the background trend warmer"""
+    return jsonify(scheduler_stats())
+
+@app.route('/api/http_metrics')
+def http_metrics_api():
+    """Report per-endpoint latency of outbound YouTube REST calls"""
+    return jsonify(get_http_metrics())
+
+@app.route('/api/quota')
+def quota_api():
+    """Report remaining YouTube Data API quota and today's spend per endpoint"""
+    return jsonify(get_quota_ledger().report())
+
+@app.route('/api/import_report')
+def import_report_api():
+    """Report app import time against its budget and when heavy libraries were loaded"""
+    return jsonify(import_report())
+
+@app.route('/readyz')
+def readyz():
+    """Readiness probe: 503 until warm-up has finished, so no traffic reaches a cold worker"""
+    response = jsonify(warmup_report())
+    if not is_ready():
+        response.status_code = 503
+        response.headers["Retry-After"] = "1"
+    response.cache_control.no_store = True
+    return response
 
 @app.route("/category/age-visual")
 def category_age_visual():
     regions = get_all_regions()
-    default_region = get_default_region()
+    default_region = get_request_region(request)
     #print("default_region: ", default_region); #time.sleep(300)
     categories = get_available_categories(creo_api_key, default_region)
 
     region = request.args.get("region", default_region)
-    plot_img = visualise_category_age_distribution_base64(default_region)
-    return render_template("age_visual.html", plot_img=plot_img, region=default_region)
+
+    # format=json|svg hands the chart to the client instead of rendering a PNG page
+    chart_format = request.args.get("format")
+    if chart_format == "json":
+        return jsonify(chart_json(category_age_chart(region)))
+    if chart_format == "svg":
+        return Response(render_on_pool(category_age_chart(region), fmt="svg"), mimetype="image/svg+xml")
+
+    plot_img = visualise_category_age_distribution_url(region)
+    return render_template("age_visual.html", plot_img=plot_img, region=region)
+
+@app.route("/charts/<chart_hash>.<fmt>")
+def chart_image(chart_hash, fmt):
+    """Serve a rendered chart by content hash; the URL changes whenever the chart does"""
+    image = load_chart(chart_hash, fmt)
+    if image is None:
+        return jsonify({"error": "Unknown chart"}), 404
+    response = Response(image, mimetype=CHART_MIMETYPES[fmt])
+    response.set_etag(chart_hash)
+    response.cache_control.public = True
+    response.cache_control.max_age = 365 * 86400
+    response.cache_control.immutable = True
+    return response.make_conditional(request)
+
+@app.route('/api/chart_stats')
+def chart_stats_api():
+    """Report hit counters of the rendered chart cache and the render pool's load"""
+    return jsonify(dict(get_chart_store().stats(), pool=get_render_pool().stats()))
+
+@app.errorhandler(RenderQueueFull)
+def render_queue_full(e):
+    """Shed load while the chart render pool is saturated"""
+    response = jsonify({"error": str(e)})
+    response.status_code = 503
+    response.headers["Retry-After"] = "2"
+    return response
 
 @app.route('/analytics')
 def analytics():
@@ -1 +1,41 @@
 """Init file."""
+# scheduler/__init__.py
+
+import atexit
+import logging
+import threading
+
+from Creovue import app_secrets
+
+logger = logging.getLogger('scheduler')
+
+_warmer = None
+_warmer_lock = threading.Lock()
+
+
+def start_scheduler():
+    """Start the background trend warmer once per process, if enabled."""
+    global _warmer
+    if not app_secrets.creo_scheduler_enabled:
+        logger.info("Scheduler disabled (CREO_SCHEDULER_ENABLED=0)")
+        return None
+    with _warmer_lock:
+        if _warmer is None:
+            from Creovue.scheduler.trend_monitor import TrendWarmer
+            _warmer = TrendWarmer()
+            atexit.register(stop_scheduler)
+        _warmer.start()
+    return _warmer
+
+
+def stop_scheduler():
+    """Stop the background trend warmer and release its host-wide lock."""
+    if _warmer is not None:
+        _warmer.stop()
+
+
+def scheduler_stats():
+    """Return last-run stats of the trend warmer."""
+    if _warmer is None:
+        return {"enabled": app_secrets.creo_scheduler_enabled, "running": False}
+    return dict(_warmer.stats(), enabled=app_secrets.creo_scheduler_enabled, running=True)
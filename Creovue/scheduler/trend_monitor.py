@@ -1 +1,227 @@
 """Module: trend_monitor.py."""
+# scheduler/trend_monitor.py
+
+import fcntl
+import logging
+import random
+import threading
+from datetime import date
+from time import time
+
+from Creovue.app_secrets import (
+    creo_warm_regions,
+    creo_warm_categories,
+    creo_warm_interval,
+    creo_warm_jitter,
+    creo_warm_quota_budget,
+    creo_warm_lock_path
+)
+from Creovue.utils.cache import get_cache
+from Creovue.utils.quota import ENDPOINT_COSTS, QuotaExceeded, BACKGROUND, quota_priority
+from Creovue.models.catalog import get_category_map
+from Creovue.models.snapshot import get_region_snapshot
+from Creovue.models.trends import (
+    fetch_trending_keywords,
+    get_category_distribution,
+    get_category_age_distribution,
+    get_top_channels
+)
+
+logger = logging.getLogger('scheduler.trends')
+
+# YouTube Data API units spent when each function recomputes. The snapshot and
+# category catalog they read are warmed first, so aggregators that only read
+# those cost nothing; get_top_channels looks up at most 25 channels, one
+# batched channels.list call.
+SNAPSHOT_COST = ENDPOINT_COSTS["videos.list"]
+CATALOG_COST = ENDPOINT_COSTS["videoCategories.list"]
+# Only aggregators that registered routes read (/trends, /api/trend_data)
+REGION_AGGREGATORS = [
+    (fetch_trending_keywords, 0),
+    (get_category_distribution, 0),
+    (get_category_age_distribution, 0),
+    (get_top_channels, ENDPOINT_COSTS["channels.list"]),
+]
+
+
+class TrendWarmer:
+    """
+    Periodically pre-warms trend snapshots and aggregates for hot regions.
+
+    With a shared cache backend (sqlite), only one process per host warms at
+    a time (an flock on a lock file), so several gunicorn workers can all
+    start a warmer without duplicating calls. With the per-process memory
+    backend a leader's results would be invisible to its siblings, so every
+    process warms its own cache instead.
+    Entries are only refreshed when they would otherwise expire before the
+    next run, never beyond the warmer's daily budget, and always at background
+    quota priority so interactive requests keep their reserve.
+    """
+
+    def __init__(self, regions=creo_warm_regions, categories=creo_warm_categories,
+                 interval=creo_warm_interval, jitter=creo_warm_jitter,
+                 quota_budget=creo_warm_quota_budget, lock_path=creo_warm_lock_path):
+        self.regions = regions
+        self.categories = categories
+        self.interval = interval
+        self.jitter = jitter
+        self.quota_budget = quota_budget
+        self.lock_path = lock_path
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock_file = None
+        self._budget_day = date.today()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "runs": 0,
+            "is_leader": False,
+            "last_run_started": None,
+            "last_run_finished": None,
+            "last_run_seconds": None,
+            "last_run_warmed": 0,
+            "last_run_skipped": 0,
+            "last_run_errors": 0,
+            "units_spent_today": 0,
+            "quota_budget": quota_budget,
+            "next_run_at": None
+        }
+
+    def start(self):
+        """Start the warmer thread (no-op if already running)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="creo-trend-warmer", daemon=True)
+        self._thread.start()
+        logger.info(f"Trend warmer started for regions {self.regions}")
+        if not self._shared_cache():
+            logger.warning(
+                "Trend warmer is warming a per-process memory cache; every worker warms "
+                "and spends quota separately. Set CREO_CACHE_BACKEND=sqlite to share one warmer."
+            )
+
+    def stop(self, timeout=10):
+        """Signal the warmer to stop and wait for the current run to finish."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+        self._release_leadership()
+        logger.info("Trend warmer stopped")
+
+    def stats(self):
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _next_delay(self):
+        """Interval with +/- jitter so workers on many hosts don't fire in lockstep."""
+        return self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            if self._acquire_leadership():
+                self.run_once()
+            delay = self._next_delay()
+            with self._stats_lock:
+                self._stats["next_run_at"] = time() + delay
+            self._stop.wait(delay)
+
+    @staticmethod
+    def _shared_cache():
+        """True if warmed entries are visible to every worker on the host."""
+        return get_cache().name != "memory"
+
+    def _acquire_leadership(self):
+        """Take the host-wide warmer lock; returns True if this process holds it."""
+        if not self._shared_cache():
+            # Nothing to elect: a leader could only warm its own memory cache
+            with self._stats_lock:
+                self._stats["is_leader"] = True
+            return True
+        if self._lock_file is None:
+            try:
+                lock_file = open(self.lock_path, "a")
+            except OSError as e:
+                logger.error(f"Cannot open warmer lock {self.lock_path}: {e}")
+                return False
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                self._lock_file = lock_file
+            except OSError:
+                lock_file.close()
+        with self._stats_lock:
+            self._stats["is_leader"] = self._lock_file is not None
+        return self._lock_file is not None
+
+    def _release_leadership(self):
+        if self._lock_file is not None:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _spend(self, units):
+        """Reserve quota units from today's budget; returns False if it would be exceeded."""
+        with self._stats_lock:
+            if self._budget_day != date.today():
+                self._budget_day = date.today()
+                self._stats["units_spent_today"] = 0
+            if self._stats["units_spent_today"] + units > self.quota_budget:
+                return False
+            self._stats["units_spent_today"] += units
+            return True
+
+    def _needs_warming(self, func, *args):
+        """True if the cached entry is missing or would expire before the next run."""
+        entry = func.peek(*args)
+        if entry is None:
+            return True
+        age = time() - entry[1]
+        return age + self.interval * (1 + self.jitter) >= func.expiry_seconds
+
+    def _targets(self):
+        """Yield (func, args, cost) for everything this run may warm, snapshots and catalog first."""
+        for region in self.regions:
+            yield get_region_snapshot, (region, None), SNAPSHOT_COST
+            for category_id in self.categories:
+                yield get_region_snapshot, (region, category_id), SNAPSHOT_COST
+            yield get_category_map, (region,), CATALOG_COST
+            for func, cost in REGION_AGGREGATORS:
+                yield func, (region,), cost
+
+    def run_once(self):
+        """Warm every configured target that is due. Returns the run's stats."""
+        started = time()
+        warmed = skipped = errors = 0
+
+        for func, args, cost in self._targets():
+            if self._stop.is_set():
+                break
+            if not self._needs_warming(func, *args):
+                continue
+            if not self._spend(cost):
+                skipped += 1
+                continue
+            try:
+                with quota_priority(BACKGROUND):
+                    func.refresh(*args)
+                warmed += 1
+            except QuotaExceeded as e:
+                skipped += 1
+                logger.info(f"Stopped warming, quota reserve reached: {e}")
+                break
+            except Exception as e:
+                errors += 1
+                logger.error(f"Failed to warm {func.__name__}{args}: {e}")
+
+        finished = time()
+        with self._stats_lock:
+            self._stats.update({
+                "runs": self._stats["runs"] + 1,
+                "last_run_started": started,
+                "last_run_finished": finished,
+                "last_run_seconds": round(finished - started, 3),
+                "last_run_warmed": warmed,
+                "last_run_skipped": skipped,
+                "last_run_errors": errors
+            })
+        logger.info(f"Trend warm run: {warmed} warmed, {skipped} over budget, {errors} errors")
+        return self.stats()
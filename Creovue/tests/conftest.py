@@ -0,0 +1,38 @@
+"""Module: conftest.py."""
+# tests/conftest.py
+
+import os
+
+# No warm-up or trend warmer in tests: they would call the live YouTube API and
+# write the quota and trend databases. Set for any process spawned by a test...
+os.environ["CREO_SCHEDULER_ENABLED"] = "0"
+os.environ["CREO_WARMUP_ENABLED"] = "0"
+
+import pytest
+
+from Creovue import app_secrets
+from Creovue.utils import decorators, quota
+from Creovue.utils.cache import MemoryCache
+from Creovue.utils.quota import QuotaLedger
+
+# ...and switched off directly here, since pytest imports the Creovue package
+# (and so app_secrets) before this file
+app_secrets.creo_scheduler_enabled = False
+app_secrets.creo_warmup_enabled = False
+
+
+@pytest.fixture
+def memory_cache(monkeypatch):
+    """Give @cached functions a private in-memory backend that never degrades to stale data."""
+    cache = MemoryCache(max_entries=1000, max_bytes=10 * 1024 * 1024)
+    monkeypatch.setattr(decorators, "get_cache", lambda: cache)
+    monkeypatch.setattr(decorators, "should_degrade", lambda: False)
+    return cache
+
+
+@pytest.fixture
+def quota_ledger(tmp_path, monkeypatch):
+    """Make get_quota_ledger() return a fresh ledger in a temporary database."""
+    ledger = QuotaLedger(path=str(tmp_path / "quota.sqlite3"), daily_limit=10000)
+    monkeypatch.setattr(quota, "_ledger", ledger)
+    return ledger
@@ -0,0 +1,83 @@
+"""Module: test_cache.py."""
+# tests/test_cache.py
+
+import time
+
+import pytest
+
+from Creovue.utils.cache import MemoryCache, SQLiteCache, make_cache_key
+from Creovue.utils.decorators import cached
+
+
+def _region_call(region, category_id=None, *extra, **options):
+    pass
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCache(max_entries=3, max_bytes=10 * 1024)
+    return SQLiteCache(path=str(tmp_path / "cache.sqlite3"), max_entries=3, max_bytes=10 * 1024)
+
+
+def test_cache_key_binds_defaults_and_keywords():
+    key = make_cache_key(_region_call, ("US",), {})
+    assert make_cache_key(_region_call, ("US", None), {}) == key
+    assert make_cache_key(_region_call, (), {"region": "US"}) == key
+    assert make_cache_key(_region_call, ("US", "10"), {}) != key
+    assert make_cache_key(_region_call, ("US",), {"a": 1, "b": 2}) == make_cache_key(_region_call, ("US",), {"b": 2, "a": 1})
+
+
+def test_cache_key_differs_per_function():
+    def other(region, category_id=None):
+        pass
+    assert make_cache_key(other, ("US",), {}) != make_cache_key(_region_call, ("US",), {})
+
+
+def test_backends_store_and_expire_entries(backend):
+    backend.set("k", {"a": 1}, 0.05)
+    value, stored_at = backend.get("k")
+    assert value == {"a": 1}
+    assert stored_at <= time.time()
+    time.sleep(0.1)
+    assert backend.get("k") is None
+
+
+def test_backends_evict_least_recently_used(backend):
+    for key in "abc":
+        backend.set(key, key, 60)
+    if backend.name == "sqlite":
+        time.sleep(0.01)
+        backend.TOUCH_INTERVAL = 0  # Record every access
+    backend.get("a")
+    backend.set("d", "d", 60)
+
+    assert backend.get("b") is None
+    assert [backend.get(key)[0] for key in "acd"] == ["a", "c", "d"]
+    assert backend.stats()["evictions"] >= 1
+
+
+def test_backends_are_bounded_in_bytes(backend):
+    backend.set("big", "x" * 20 * 1024, 60)
+    assert backend.get("big") is None
+    assert backend.stats()["bytes"] <= 10 * 1024
+
+
+def test_sqlite_entries_are_shared_between_workers(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    SQLiteCache(path=path).set("k", [1, 2, 3], 60)
+    assert SQLiteCache(path=path).get("k")[0] == [1, 2, 3]
+
+
+def test_cached_decorator_stores_results(memory_cache):
+    calls = []
+
+    @cached(expiry_seconds=60)
+    def double(x):
+        calls.append(x)
+        return x * 2
+
+    assert double(2) == double(2) == 4
+    assert double(3) == 6
+    assert calls == [2, 3]
+    assert memory_cache.stats()["entries"] == 2
@@ -0,0 +1,90 @@
+"""Module: test_channels.py."""
+# tests/test_channels.py
+
+import threading
+
+import pytest
+
+from Creovue.models import channels
+from Creovue.models.channels import ChannelBatcher, get_channel, get_channels
+from Creovue.utils.cache import MemoryCache
+
+
+class FakeYouTube:
+    """channels().list(...) returns its arguments; execute() records them and answers."""
+
+    def __init__(self, missing=()):
+        self.calls = []
+        self.missing = set(missing)
+        self.lock = threading.Lock()
+
+    def channels(self):
+        return self
+
+    def list(self, **params):
+        return params
+
+    def execute(self, params):
+        ids = params["id"].split(",")
+        with self.lock:
+            self.calls.append(ids)
+        return {"items": [{"id": cid, "snippet": {"title": cid.upper()}}
+                          for cid in ids if cid not in self.missing]}
+
+
+@pytest.fixture
+def youtube(monkeypatch):
+    fake = FakeYouTube(missing={"gone"})
+    cache = MemoryCache(max_entries=1000, max_bytes=10 * 1024 * 1024)
+    monkeypatch.setattr(channels, "get_youtube_client", lambda: fake)
+    monkeypatch.setattr(channels, "execute", fake.execute)
+    monkeypatch.setattr(channels, "get_cache", lambda: cache)
+    monkeypatch.setattr(channels, "_batcher", ChannelBatcher(window=0.1))
+    return fake
+
+
+def test_lookups_are_split_into_50_id_calls(youtube):
+    ids = [f"c{i}" for i in range(120)]
+    found = get_channels(ids + ids[:10])
+
+    assert set(found) == set(ids)
+    assert [len(call) for call in youtube.calls] == [50, 50, 20]
+
+
+def test_concurrent_lookups_share_one_call(youtube):
+    results = []
+    threads = [threading.Thread(target=lambda i=i: results.append(get_channels([f"c{i}", "shared"])))
+               for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(youtube.calls) == 1
+    assert sorted(youtube.calls[0]) == sorted([f"c{i}" for i in range(8)] + ["shared"])
+    assert all(result["shared"]["snippet"]["title"] == "SHARED" for result in results)
+
+
+def test_cached_channels_need_no_call(youtube):
+    get_channels(["a", "b"])
+    assert get_channels(["b", "a"]).keys() == {"a", "b"}
+    assert get_channel("a")["id"] == "a"
+    assert len(youtube.calls) == 1
+
+
+def test_missing_channels_are_left_out_and_not_cached(youtube):
+    assert get_channels(["a", "gone"]).keys() == {"a"}
+    assert get_channel("gone") is None
+    assert youtube.calls == [["a", "gone"], ["gone"]]
+
+
+def test_api_errors_reach_every_caller(youtube, monkeypatch):
+    def failing(params):
+        raise RuntimeError("API down")
+    monkeypatch.setattr(channels, "execute", failing)
+
+    with pytest.raises(RuntimeError, match="API down"):
+        get_channels(["a", "b"])
+    # Nothing is left in flight, so the next lookup tries again
+    monkeypatch.setattr(channels, "execute", youtube.execute)
+    assert get_channels(["a"]).keys() == {"a"}
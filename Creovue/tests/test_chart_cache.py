@@ -0,0 +1,135 @@
+"""Module: test_chart_cache.py."""
+# tests/test_chart_cache.py
+
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from Creovue import app
+from Creovue.charts import RenderQueueFull, cache as chart_cache, chart_hash, chart_url, line_chart
+from Creovue.charts.cache import ChartStore, cached_chart, load_chart
+
+SPEC = line_chart([1, 2, 3], [4, 5, 6], title="Views")
+
+
+class FakePool:
+    """Render pool stand-in that returns fixed bytes, optionally held until released."""
+
+    def __init__(self):
+        self.renders = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def submit(self, spec, fmt="png", wait=None):
+        self.renders += 1
+        future = Future()
+
+        def finish():
+            self.release.wait()
+            future.set_result(f"{spec['title']}.{fmt}".encode("utf-8"))
+
+        threading.Thread(target=finish, daemon=True).start()
+        return future
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = ChartStore(memory_bytes=1024, directory=str(tmp_path / "charts"), disk_bytes=10 * 1024)
+    monkeypatch.setattr(chart_cache, "_store", store)
+    return store
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = FakePool()
+    monkeypatch.setattr(chart_cache, "get_render_pool", lambda: pool)
+    return pool
+
+
+def test_hash_depends_on_data_and_format():
+    assert chart_hash(SPEC) == chart_hash(dict(SPEC))
+    assert chart_hash(SPEC, "svg") != chart_hash(SPEC)
+    assert chart_hash(line_chart([1, 2, 3], [4, 5, 7], title="Views")) != chart_hash(SPEC)
+
+
+def test_store_serves_from_memory_then_disk(store, tmp_path):
+    store.put("a" * 32, "png", b"image")
+    assert store.get("a" * 32) == b"image"
+    assert store.stats()["memory_hits"] == 1
+
+    # A sibling worker only shares the disk tier
+    sibling = ChartStore(directory=store.directory)
+    assert sibling.get("a" * 32) == b"image"
+    assert sibling.stats()["disk_hits"] == 1
+
+
+def test_memory_tier_is_bounded_in_bytes(store):
+    for i in range(10):
+        store.put(f"{i:032x}", "png", b"x" * 300)
+    stats = store.stats()
+    assert stats["memory_bytes"] <= 1024
+    assert stats["memory_entries"] == 3
+
+
+def test_prune_trims_the_disk_tier(store):
+    for i in range(5):
+        store.put(f"{i:032x}", "png", b"x" * 4096)
+    store.prune()
+    assert sum(1 for i in range(5) if ChartStore(directory=store.directory).get(f"{i:032x}")) == 2
+
+
+def test_concurrent_requests_share_one_render(store, pool):
+    pool.release.clear()
+    keys = []
+    threads = [threading.Thread(target=lambda: keys.append(cached_chart(SPEC))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    pool.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert keys == [chart_hash(SPEC)] * 8
+    assert pool.renders == 1
+    assert store.stats()["renders"] == 1
+    assert load_chart(keys[0]) == b"Views.png"
+
+
+def test_waiting_past_the_render_timeout_sheds_load(store, pool, monkeypatch):
+    monkeypatch.setattr(chart_cache, "creo_render_timeout", 0.1)
+    pool.release.clear()
+    errors = []
+
+    def request():
+        try:
+            cached_chart(SPEC)
+        except RenderQueueFull as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=request)
+    leader.start()
+    while not chart_cache._inflight:
+        time.sleep(0.005)
+    request()
+    leader.join()
+    pool.release.set()
+
+    assert len(errors) == 2  # The waiter and the leader both give up, neither with a bare TimeoutError
+
+
+def test_chart_route_serves_immutable_images(store, pool):
+    with app.test_request_context():
+        url = chart_url(SPEC)
+    client = app.test_client()
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.mimetype == "image/png"
+    assert response.cache_control.immutable
+    assert client.get(url, headers={"If-None-Match": response.headers["ETag"]}).status_code == 304
+
+
+@pytest.mark.parametrize("path", ["/charts/" + "0" * 32 + ".png", "/charts/not-a-hash.png", "/charts/" + "0" * 32 + ".gif"])
+def test_unknown_or_malformed_charts_are_404(store, path):
+    assert app.test_client().get(path).status_code == 404
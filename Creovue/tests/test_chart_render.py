@@ -0,0 +1,75 @@
+"""Module: test_chart_render.py."""
+# tests/test_chart_render.py
+
+import threading
+
+import pytest
+
+from Creovue.charts import render
+from Creovue.charts.render import build_figure, chart_json, grouped_bar_chart, line_chart, render_chart
+
+PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+
+def bars(series_count=2, categories=("Music", "Gaming", "News")):
+    series = [{"label": f"{i}-{i + 9}", "values": [i + 1] * len(categories), "color": f"C{i}"}
+              for i in range(series_count)]
+    return grouped_bar_chart(list(categories), series, title="Ages", legend_title="Age")
+
+
+@pytest.mark.parametrize("spec", [line_chart([1, 2, 3], [4, 5, 6], title="Views"),
+                                  line_chart(["Mon", "Tue"], [1, 2]),
+                                  bars()])
+def test_specs_render_to_png_and_svg(spec):
+    assert render_chart(spec).startswith(PNG_MAGIC)
+    assert b"<svg" in render_chart(spec, fmt="svg")
+
+
+def test_templates_are_reused_within_a_thread():
+    render_chart(line_chart([1, 2], [3, 4]))
+    template = render._template("line")
+    render_chart(line_chart([1, 2, 3], [3, 4, 5]))
+
+    assert render._template("line") is template
+    assert list(template.line.get_xdata()) == [1, 2, 3]
+
+
+def test_bar_renders_replace_the_previous_bars():
+    render_chart(bars(series_count=3))
+    render_chart(bars(series_count=2))
+
+    template = render._template("grouped_bar")
+    assert len(template.ax.patches) == 2 * 3
+    assert [text.get_text() for text in template.ax.get_legend().get_texts()] == ["0-9", "1-10"]
+
+
+def test_threads_render_on_their_own_templates():
+    templates = []
+    results = []
+
+    def draw(n):
+        results.append(render_chart(line_chart(range(n), range(n))))
+        templates.append(render._template("line"))
+
+    threads = [threading.Thread(target=draw, args=(n,)) for n in range(2, 6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(template) for template in templates}) == 4
+    assert all(result.startswith(PNG_MAGIC) for result in results)
+
+
+def test_build_figure_returns_a_new_figure_each_time():
+    spec = line_chart([1, 2], [3, 4])
+    assert build_figure(spec) is not build_figure(spec)
+
+
+def test_chart_json_keeps_the_series():
+    data = chart_json(line_chart(["a", "b"], [1.234, 2], title="Views", ylabel="views"))
+    assert data == {
+        "type": "line", "title": "Views", "xlabel": "", "ylabel": "views", "labels": ["a", "b"],
+        "datasets": [{"label": "views", "data": [1.23, 2.0], "color": render.LINE_COLOR}]
+    }
+    assert chart_json(bars())["type"] == "bar"
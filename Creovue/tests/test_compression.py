@@ -0,0 +1,112 @@
+"""Module: test_compression.py."""
+# tests/test_compression.py
+
+import gzip
+import json
+import os
+
+import pytest
+from flask import Flask, Response, jsonify, url_for
+
+from Creovue.utils import compression
+from Creovue.utils.assets import build_assets, init_assets
+from Creovue.utils.compression import init_compression
+
+BODY = {"rows": ["trending keyword"] * 200}
+needs_brotli = pytest.mark.skipif(compression.brotli is None, reason="brotli is not installed")
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    static = tmp_path / "static"
+    (static / "css").mkdir(parents=True)
+    (static / "css" / "site.css").write_text("body { color: #333; }\n" * 200)
+    (static / "img.png").write_bytes(b"\x89PNG fake")
+    (static / "design.psd").write_bytes(b"source file")
+    return static
+
+
+@pytest.fixture
+def client(static_dir):
+    build_assets(str(static_dir))
+    app = Flask(__name__, static_folder=str(static_dir))
+    init_compression(app)
+    init_assets(app)
+
+    @app.route("/data")
+    def data():
+        response = jsonify(BODY)
+        response.set_etag("v1")
+        return response
+
+    @app.route("/small")
+    def small():
+        return jsonify({"ok": True})
+
+    @app.route("/stream")
+    def stream():
+        return Response((json.dumps(BODY) for _ in range(1)), mimetype="application/json")
+
+    @app.route("/css-url")
+    def css_url():
+        return url_for("static", filename="css/site.css")
+
+    return app.test_client()
+
+
+def test_gzip_body_round_trips(client):
+    response = client.get("/data", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert json.loads(gzip.decompress(response.data)) == BODY
+    # Encoded bytes differ from the original, so the validator is weakened
+    assert response.headers["ETag"] == 'W/"v1"'
+
+
+@needs_brotli
+def test_brotli_is_preferred_when_accepted(client):
+    response = client.get("/data", headers={"Accept-Encoding": "gzip, br"})
+    assert response.headers["Content-Encoding"] == "br"
+    assert json.loads(compression.brotli.decompress(response.data)) == BODY
+
+
+@pytest.mark.parametrize("path", ["/small", "/stream"])
+def test_small_and_streamed_bodies_are_sent_as_is(client, path):
+    response = client.get(path, headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+
+
+def test_identity_when_nothing_is_accepted(client):
+    response = client.get("/data", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in response.headers
+    assert response.get_json() == BODY
+
+
+def test_build_fingerprints_and_precompresses(static_dir):
+    manifest = build_assets(str(static_dir))
+
+    assert set(manifest) == {"css/site.css", "img.png"}
+    hashed = static_dir / "dist" / manifest["css/site.css"]
+    assert hashed.read_bytes() == (static_dir / "css" / "site.css").read_bytes()
+    assert os.path.exists(f"{hashed}.gz")
+    assert not os.path.exists(static_dir / "dist" / f"{manifest['img.png']}.gz")
+    # Same content, same name
+    assert build_assets(str(static_dir)) == manifest
+
+
+def test_static_urls_point_at_immutable_hashed_copies(client):
+    url = client.get("/css-url").get_data(as_text=True)
+    assert url.startswith("/static/dist/css/site.") and url.endswith(".css")
+
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.mimetype == "text/css"
+    assert response.cache_control.immutable
+    assert gzip.decompress(response.data).startswith(b"body")
+    response.close()
+
+
+def test_unbuilt_files_are_served_as_before(client):
+    response = client.get("/static/design.psd")
+    assert response.status_code == 200
+    response.close()
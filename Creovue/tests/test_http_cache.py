@@ -0,0 +1,74 @@
+"""Module: test_http_cache.py."""
+# tests/test_http_cache.py
+
+import pytest
+from flask import Flask, jsonify, request
+
+from Creovue.utils.decorators import cached
+from Creovue.utils.http_cache import apply_cache_headers, cache_validators, is_not_modified, not_modified
+
+_calls = []
+
+
+@cached(expiry_seconds=300)
+def _trend(region):
+    _calls.append(region)
+    return {"region": region, "version": len(_calls)}
+
+
+@pytest.fixture
+def client(memory_cache):
+    app = Flask(__name__)
+
+    @app.route("/trend")
+    def trend():
+        sources = [(_trend, ("US",))]
+        validators = cache_validators(request, sources)
+        if is_not_modified(request, validators):
+            return not_modified(validators)
+        response = jsonify(_trend("US"))
+        return apply_cache_headers(response, validators or cache_validators(request, sources))
+
+    return app.test_client()
+
+
+def test_validators_need_every_source_cached(memory_cache):
+    app = Flask(__name__)
+    with app.test_request_context("/trend"):
+        assert cache_validators(request, [(_trend, ("GB",))]) is None
+        _trend("GB")
+        assert cache_validators(request, [(_trend, ("GB",))])["etag"]
+
+
+def test_matching_etag_gets_304(client):
+    first = client.get("/trend")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert "max-age" in first.headers["Cache-Control"]
+
+    repeat = client.get("/trend", headers={"If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.data == b""
+    assert repeat.headers["ETag"] == etag
+
+
+def test_weak_etag_from_compression_still_matches(client):
+    etag = client.get("/trend").headers["ETag"]
+    assert client.get("/trend", headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+
+
+def test_refreshed_entry_changes_the_etag(client):
+    etag = client.get("/trend").headers["ETag"]
+    _trend.refresh("US")
+    response = client.get("/trend", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_if_modified_since(client):
+    last_modified = client.get("/trend").headers["Last-Modified"]
+    assert client.get("/trend", headers={"If-Modified-Since": last_modified}).status_code == 304
+
+
+def test_query_arguments_are_part_of_the_etag(client):
+    assert client.get("/trend").headers["ETag"] != client.get("/trend?fields=region").headers["ETag"]
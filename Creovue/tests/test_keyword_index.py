@@ -0,0 +1,94 @@
+"""Module: test_keyword_index.py."""
+# tests/test_keyword_index.py
+
+import random
+import threading
+
+from Creovue.models.keyword_index import KeywordIndex, get_keyword_index, snapshot_keyword_stats
+
+WORDS = "music live news game love song best official video trailer remix highlights".split()
+
+
+def _video(rnd, video_id):
+    return {
+        "id": video_id,
+        "snippet": {"title": " ".join(rnd.sample(WORDS, 3)), "tags": rnd.sample(WORDS, 2)},
+        "statistics": {"viewCount": str(rnd.randint(0, 10 ** 6))}
+    }
+
+
+def _snapshot(rnd, previous):
+    """Keep some of the previous videos (with new view counts), drop some and add new ones."""
+    kept = [dict(item, statistics={"viewCount": str(rnd.randint(0, 10 ** 6))})
+            for item in previous if rnd.random() < 0.7]
+    added = [_video(rnd, f"v{rnd.randrange(10 ** 9)}") for _ in range(rnd.randint(0, 15))]
+    return kept + added
+
+
+def _stats(index, min_count=1):
+    return sorted(index.keyword_stats(min_count=min_count))
+
+
+def test_incremental_updates_match_a_rebuilt_index():
+    rnd = random.Random(7)
+    incremental = KeywordIndex()
+    items = []
+    for version in range(40):
+        items = _snapshot(rnd, items)
+        incremental.update(items, version=version)
+
+        rebuilt = KeywordIndex()
+        rebuilt.update(items)
+        assert _stats(incremental) == _stats(rebuilt)
+        assert _stats(incremental, min_count=2) == _stats(rebuilt, min_count=2)
+        assert len(incremental) == len(rebuilt)
+
+
+def test_repeated_version_is_a_no_op():
+    rnd = random.Random(1)
+    items = [_video(rnd, f"v{i}") for i in range(10)]
+    index = KeywordIndex()
+    assert index.update(items, version=1) == 10
+    assert index.update(items, version=1) == 0
+
+
+def test_videos_for_tracks_entries_and_exits():
+    index = KeywordIndex()
+    first = {"id": "a", "snippet": {"title": "Live music"}, "statistics": {"viewCount": "10"}}
+    second = {"id": "b", "snippet": {"title": "Music news"}, "statistics": {"viewCount": "5"}}
+    index.update([first, second])
+    assert index.videos_for("Music") == {"a", "b"}
+
+    index.update([second])
+    assert index.videos_for("music") == {"b"}
+    assert index.videos_for("live") == set()
+    assert dict((k, (c, v)) for k, c, v in index.keyword_stats())["music"] == (1, 5)
+
+
+
+def test_update_between_index_and_read_waits_for_the_read(monkeypatch):
+    rnd = random.Random(5)
+    older = {"region": "ZZ", "category_id": None, "fetched_at": 1.0,
+             "items": [_video(rnd, f"old{i}") for i in range(30)]}
+    newer_items = [_video(rnd, f"new{i}") for i in range(30)]
+    expected = KeywordIndex()
+    expected.update(older["items"])
+
+    index = get_keyword_index("ZZ")
+    apply_update = KeywordIndex._update
+    others = []
+
+    def update_then_start_another(self, items, version):
+        changed = apply_update(self, items, version)
+        if not others:
+            others.append(threading.Thread(target=index.update, args=(newer_items,), kwargs={"version": 2.0}))
+            others[0].start()
+            others[0].join(0.2)  # Held off by the index lock until the stats are read
+        return changed
+
+    monkeypatch.setattr(KeywordIndex, "_update", update_then_start_another)
+    stats = snapshot_keyword_stats(older, min_count=2)
+    others[0].join()
+
+    assert sorted(stats) == _stats(expected, min_count=2)
+    assert index.version == 2.0
@@ -0,0 +1,70 @@
+"""Module: test_lazy.py."""
+# tests/test_lazy.py
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import Creovue
+from Creovue import app
+from Creovue.utils import lazy
+from Creovue.utils.lazy import HEAVY_MODULES, LazyModule, import_report, lazy_import, preload
+
+MODULE = "creo_lazy_probe"
+
+
+@pytest.fixture
+def probe(tmp_path, monkeypatch):
+    """A small importable module, not imported yet."""
+    (tmp_path / f"{MODULE}.py").write_text("VALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(lazy, "_proxies", {})
+    monkeypatch.setattr(lazy, "_import_times", {})
+    yield MODULE
+    sys.modules.pop(MODULE, None)
+
+
+def test_module_is_imported_on_first_use(probe):
+    module = lazy_import(probe)
+    assert isinstance(module, LazyModule)
+    assert probe not in sys.modules
+    assert probe not in import_report()["deferred"]
+
+    assert module.VALUE == 42
+    assert probe in sys.modules
+    assert import_report()["deferred"][probe]["seconds"] >= 0
+    with pytest.raises(AttributeError):
+        module.missing
+
+
+def test_importers_share_one_proxy(probe):
+    first, second = lazy_import(probe), lazy_import(probe)
+    assert first is second
+    assert first.VALUE == 42
+    assert second.__dict__["_lazy_loaded"]
+
+
+def test_loaded_modules_are_returned_as_is(probe):
+    assert lazy_import("json") is json
+    assert preload(probe) is sys.modules[probe]
+    assert lazy_import(probe) is sys.modules[probe]
+
+
+def test_importing_the_app_loads_no_heavy_modules():
+    code = (
+        "import sys, Creovue.routes\n"
+        f"print(','.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))\n"
+    )
+    root = os.path.dirname(os.path.dirname(Creovue.__file__))
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
+
+
+def test_import_report_route():
+    report = app.test_client().get("/api/import_report").get_json()
+    assert report.keys() == {"boot_seconds", "budget", "over_budget", "eager_heavy", "loaded_heavy", "deferred"}
+    assert report["boot_seconds"] is not None
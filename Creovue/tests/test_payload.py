@@ -0,0 +1,79 @@
+"""Module: test_payload.py."""
+# tests/test_payload.py
+
+import json
+
+import pytest
+from werkzeug.datastructures import MultiDict
+
+from Creovue.utils.payload import (
+    InvalidCursor,
+    InvalidPage,
+    decode_cursor,
+    encode_cursor,
+    iter_json,
+    parse_fields,
+    project,
+    shape_payload
+)
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(40)) == 40
+    assert decode_cursor(None) == 0
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "e30", encode_cursor(3)[:-2], "eyJvIjogLTJ9"])
+def test_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor)
+
+
+def test_negative_offsets_cannot_be_encoded():
+    with pytest.raises(ValueError):
+        encode_cursor(-2)
+
+
+@pytest.mark.parametrize("limit", ["0", "-2", "abc", "1.5"])
+def test_non_positive_limits_are_rejected(limit):
+    with pytest.raises(InvalidPage):
+        shape_payload({"a": [1, 2, 3]}, MultiDict({"limit": limit}))
+
+
+def test_empty_limit_means_no_paging():
+    assert shape_payload({"a": [1, 2, 3]}, MultiDict({"limit": ""})) == {"a": [1, 2, 3]}
+
+
+def test_pages_walk_every_list_to_the_end():
+    payload = {"a": list(range(5)), "b": list(range(2)), "incomplete": ["c"]}
+    first = shape_payload(payload, MultiDict({"limit": "2"}))
+    assert first["a"] == [0, 1] and first["b"] == [0, 1]
+    second = shape_payload(payload, MultiDict({"limit": "2", "cursor": first["next_cursor"]}))
+    assert second["a"] == [2, 3] and second["b"] == []
+    third = shape_payload(payload, MultiDict({"limit": "2", "cursor": second["next_cursor"]}))
+    assert third["a"] == [4] and third["next_cursor"] is None
+    # The incomplete marker describes the response and is never paged
+    assert first["incomplete"] == second["incomplete"] == third["incomplete"] == ["c"]
+
+
+def test_parse_fields_builds_a_tree():
+    assert parse_fields("a.x,a.y,b") == {"a": {"x": {}, "y": {}}, "b": {}}
+    assert parse_fields("") is None
+
+
+def test_project_applies_to_list_elements():
+    value = {"a": [{"x": 1, "y": 2, "z": 3}], "b": 4}
+    assert project(value, {"a": {"x": {}}}) == {"a": [{"x": 1}]}
+
+
+def test_fields_keep_control_keys():
+    payload = {"top_channels": [], "trending_keywords": [{"name": "x"}], "incomplete": ["top_channels"]}
+    shaped = shape_payload(payload, MultiDict({"fields": "top_channels", "limit": "1"}))
+    assert shaped == {"top_channels": [], "incomplete": ["top_channels"], "next_cursor": None}
+
+
+def test_iter_json_matches_json_dumps():
+    value = {"rows": [{"n": i, "s": "x" * 50} for i in range(500)]}
+    chunks = list(iter_json(value, chunk_size=1024))
+    assert len(chunks) > 1
+    assert json.loads("".join(chunks)) == value
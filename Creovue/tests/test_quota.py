@@ -0,0 +1,99 @@
+"""Module: test_quota.py."""
+# tests/test_quota.py
+
+import pytest
+
+from Creovue.utils import decorators
+from Creovue.utils.decorators import cached
+from Creovue.utils.quota import BACKGROUND, INTERACTIVE, QuotaExceeded, QuotaLedger, current_priority, quota_priority
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    # 100 units a day: background calls keep 20 in reserve, degrade below 5
+    return QuotaLedger(path=str(tmp_path / "quota.sqlite3"), daily_limit=100,
+                       background_reserve=0.2, degrade_fraction=0.05)
+
+
+def test_calls_are_charged_by_endpoint_cost(ledger):
+    assert ledger.acquire("videos.list", api_key="k") == pytest.approx(99, abs=0.01)
+    assert ledger.acquire("search.list", api_key="other", priority=INTERACTIVE) == pytest.approx(0, abs=0.01)
+    report = ledger.report(api_key="k")
+    assert report["spent_today"]["videos.list"] == {INTERACTIVE: 1}
+    assert report["spent_today"]["search.list"] == {INTERACTIVE: 100}
+
+
+def test_background_calls_keep_the_interactive_reserve(ledger):
+    for _ in range(80):
+        ledger.acquire("videos.list", api_key="k", priority=BACKGROUND)
+    with pytest.raises(QuotaExceeded):
+        ledger.acquire("videos.list", api_key="k", priority=BACKGROUND)
+    # Interactive requests can still spend the reserve
+    ledger.acquire("videos.list", api_key="k", priority=INTERACTIVE)
+
+
+def test_interactive_calls_stop_at_zero(ledger):
+    ledger.acquire("search.list", api_key="k")
+    with pytest.raises(QuotaExceeded):
+        ledger.acquire("search.list", api_key="k")
+    assert ledger.report(api_key="k")["spent_today"]["search.list"] == {INTERACTIVE: 100}
+
+
+def test_ledger_is_shared_between_workers(ledger):
+    ledger.acquire("search.list", api_key="k")
+    sibling = QuotaLedger(path=ledger.path, daily_limit=100)
+    assert sibling.remaining(api_key="k") < 1
+
+
+def test_should_degrade_near_the_floor(ledger):
+    assert not ledger.should_degrade(api_key="k")
+    for _ in range(96):
+        ledger.acquire("videos.list", api_key="k")
+    assert ledger.should_degrade(api_key="k", priority=INTERACTIVE)
+    assert ledger.report(api_key="k")["degraded"]
+
+
+def test_quota_priority_is_per_thread_and_restored():
+    assert current_priority() == INTERACTIVE
+    with quota_priority(BACKGROUND):
+        assert current_priority() == BACKGROUND
+    assert current_priority() == INTERACTIVE
+
+
+def test_cached_serves_expired_data_when_quota_runs_out(memory_cache, monkeypatch):
+    outcomes = iter(["cached", QuotaExceeded("out of quota")])
+
+    @cached(expiry_seconds=0.01)
+    def fetch():
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert fetch() == "cached"
+    monkeypatch.setattr(decorators.time, "time", lambda: memory_cache.get(fetch.cache_key())[1] + 1)
+    assert fetch() == "cached"
+
+
+def test_cached_degrades_to_expired_data_without_calling(memory_cache, monkeypatch):
+    calls = []
+
+    @cached(expiry_seconds=0.01)
+    def fetch():
+        calls.append(1)
+        return len(calls)
+
+    fetch()
+    monkeypatch.setattr(decorators.time, "time", lambda: memory_cache.get(fetch.cache_key())[1] + 1)
+    monkeypatch.setattr(decorators, "should_degrade", lambda: True)
+    assert fetch() == 1
+    assert calls == [1]
+
+
+def test_misses_still_fail_when_quota_runs_out(memory_cache):
+    @cached(expiry_seconds=60)
+    def fetch():
+        raise QuotaExceeded("out of quota")
+
+    with pytest.raises(QuotaExceeded):
+        fetch()
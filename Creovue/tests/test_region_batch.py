@@ -0,0 +1,125 @@
+"""Module: test_region_batch.py."""
+# tests/test_region_batch.py
+
+import json
+import time
+
+import pytest
+
+from Creovue import app
+from Creovue.models import region_batch
+from Creovue.models.region_batch import iter_region_batch, plan_region_batch
+from Creovue.utils import cache as cache_module, quota
+from Creovue.utils.decorators import cached
+from Creovue.utils.quota import QuotaLedger
+
+
+def _snapshot(region, category_id=None):
+    return {
+        "region": region,
+        "category_id": category_id,
+        "fetched_at": time.time(),
+        "items": [
+            {
+                "id": f"{region}{i}",
+                "snippet": {"title": f"Live music {region} news {i % 3}", "channelTitle": "Channel"},
+                "statistics": {"viewCount": str(1000 * (i + 1))}
+            }
+            for i in range(8)
+        ]
+    }
+
+
+class FakeSnapshots:
+    """A cached stand-in for get_region_snapshot that records its calls."""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.calls = []
+        self.failing = set()
+        self.delays = {}
+
+        @cached(expiry_seconds=1800)
+        def get_region_snapshot(region, category_id=None):
+            self.calls.append((region, category_id))
+            time.sleep(self.delays.get(region, 0))
+            if region in self.failing:
+                raise RuntimeError("API down")
+            return _snapshot(region, category_id)
+
+        self.func = get_region_snapshot
+
+    def store(self, pair, age):
+        """Cache a snapshot of `pair` as if it had been fetched `age` seconds ago."""
+        stored_at = time.time() - age
+        with pytest.MonkeyPatch.context() as patch:
+            patch.setattr(cache_module, "time", lambda: stored_at)
+            self.cache.set(self.func.cache_key(*pair), _snapshot(*pair), age + 3600)
+
+
+@pytest.fixture
+def snapshots(memory_cache, quota_ledger, monkeypatch):
+    fake = FakeSnapshots(memory_cache)
+    monkeypatch.setattr(region_batch, "get_region_snapshot", fake.func)
+    return fake
+
+
+def test_plan_spends_budget_only_on_uncached_pairs(snapshots, tmp_path, monkeypatch):
+    # 4 units with a floor of 2 leaves a budget of 2 live fetches
+    monkeypatch.setattr(quota, "_ledger", QuotaLedger(path=str(tmp_path / "small.sqlite3"),
+                                                      daily_limit=4, degrade_fraction=0.5))
+    snapshots.store(("US", None), age=10)
+    snapshots.store(("GB", None), age=4000)
+
+    live, stale, skipped = plan_region_batch([("US", None), ("IN", None), ("NG", None), ("GB", None), ("FR", None)])
+
+    assert live == [("US", None), ("IN", None), ("NG", None)]
+    assert list(stale) == [("GB", None)]
+    assert skipped == [("FR", None)]
+
+
+def test_batch_yields_every_pair_with_its_status(snapshots):
+    snapshots.failing.add("NG")
+    results = list(iter_region_batch([("US", None), ("NG", None), ("IN", "10")], keywords=3))
+
+    by_region = {r["region"]: r for r in results}
+    assert by_region["US"]["status"] == "ok"
+    assert by_region["IN"]["category_id"] == "10"
+    assert by_region["NG"] == {"region": "NG", "category_id": None, "status": "error", "error": "API down"}
+    assert len(by_region["US"]["trending_keywords"]) == 3
+    assert len(by_region["US"]["top_videos"]) == region_batch.TOP_VIDEOS
+
+
+def test_batch_keywords_match_single_region_ranking(snapshots):
+    from Creovue.ml.scoring import rank_keywords
+    from Creovue.models.keyword_index import KeywordIndex
+
+    result = next(iter_region_batch([("US", None)], keywords=5))
+    index = KeywordIndex()
+    index.update(snapshots.func("US")["items"])
+    assert result["trending_keywords"] == rank_keywords(index.keyword_stats(min_count=2), 5)
+
+
+def test_unfinished_pairs_time_out(snapshots):
+    snapshots.delays["US"] = 0.5
+    results = list(iter_region_batch([("US", None), ("GB", None)], timeout=0.2))
+    assert {r["region"]: r["status"] for r in results} == {"US": "timeout", "GB": "ok"}
+
+
+def test_ndjson_streams_one_uncached_line_per_pair(snapshots):
+    response = app.test_client().get("/api/trend_data/batch?regions=US,GB&format=ndjson&fields=video_count")
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    # Sent before any region was fetched, so the response must not be cached or validated
+    assert "ETag" not in response.headers
+    assert response.cache_control.no_cache
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert sorted(line["region"] for line in lines) == ["GB", "US"]
+    assert all(set(line) == {"region", "category_id", "status", "video_count"} for line in lines)
+
+
+def test_batch_rejects_unknown_regions(snapshots):
+    response = app.test_client().get("/api/trend_data/batch?regions=US,XX")
+    assert response.status_code == 400
+    assert "XX" in response.get_json()["error"]
@@ -0,0 +1,91 @@
+"""Module: test_render_pool.py."""
+# tests/test_render_pool.py
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from Creovue import app, routes
+from Creovue.charts import RenderQueueFull, line_chart, pool as pool_module
+from Creovue.charts.pool import RenderPool, get_render_pool, render_on_pool
+
+SPEC = line_chart([1, 2, 3], [4, 5, 6], title="Views")
+
+
+def _wait_idle(pool, timeout=5):
+    # Slots are freed by a done-callback, just after result() returns
+    deadline = time.monotonic() + timeout
+    while pool.stats()["pending"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def gate(monkeypatch):
+    """Hold every render until the event is set."""
+    release = threading.Event()
+
+    def held_render(spec, fmt):
+        release.wait(5)
+        return fmt.encode("utf-8")
+    monkeypatch.setattr(pool_module, "render_chart", held_render)
+    yield release
+    release.set()
+
+
+@pytest.fixture
+def pool():
+    pool = RenderPool(workers=1, queue_size=1, wait=0)
+    yield pool
+    pool.shutdown()
+
+
+def test_full_queue_rejects_at_once(pool, gate):
+    running, queued = pool.submit(SPEC), pool.submit(SPEC)
+    with pytest.raises(RenderQueueFull):
+        pool.submit(SPEC)
+    assert pool.stats() == {"workers": 1, "capacity": 2, "pending": 2, "completed": 0, "rejected": 1}
+
+    gate.set()
+    assert running.result(5) == queued.result(5) == b"png"
+    _wait_idle(pool)
+    assert pool.submit(SPEC, fmt="svg").result(5) == b"svg"
+    assert pool.stats()["completed"] == 3
+
+
+def test_waiting_submissions_take_the_next_free_slot(pool, gate):
+    pool.submit(SPEC)
+    pool.submit(SPEC)
+    threading.Timer(0.1, gate.set).start()
+    assert pool.submit(SPEC, wait=5).result(5) == b"png"
+    assert pool.stats()["rejected"] == 0
+
+
+def test_async_renders_fail_fast(gate):
+    pool = RenderPool(workers=1, queue_size=0, wait=5)
+    running = pool.submit(SPEC)
+
+    with pytest.raises(RenderQueueFull):
+        asyncio.run(pool.render_async(SPEC))
+    gate.set()
+    running.result(5)
+    _wait_idle(pool)
+    assert asyncio.run(pool.render_async(SPEC)) == b"png"
+    pool.shutdown()
+
+
+def test_render_on_pool_returns_the_image():
+    assert render_on_pool(SPEC).startswith(b"\x89PNG")
+    assert get_render_pool() is get_render_pool()
+
+
+def test_saturated_pool_answers_503(monkeypatch):
+    def saturated(chart_hash, fmt):
+        raise RenderQueueFull("Chart render queue full (2 renders pending)")
+    monkeypatch.setattr(routes, "load_chart", saturated)
+
+    response = app.test_client().get("/charts/" + "0" * 32 + ".png")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "2"
+    assert "queue full" in response.get_json()["error"]
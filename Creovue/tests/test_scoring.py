@@ -0,0 +1,50 @@
+"""Module: test_scoring.py."""
+# tests/test_scoring.py
+
+import random
+
+import pytest
+
+from Creovue.ml.scoring import rank_keywords, rank_many
+
+
+def _sorted_ranking(keyword_stats, max_results):
+    """The per-keyword loop and stable sort that rank_keywords replaced."""
+    result = []
+    for keyword, count, views in keyword_stats:
+        avg_views = views / count
+        result.append({
+            "name": keyword,
+            "volume": count * 100,
+            "avg_views": int(avg_views),
+            "videos_count": count,
+            "trend_score": int((count * avg_views) / 10000)
+        })
+    result.sort(key=lambda x: x["trend_score"], reverse=True)
+    return result[:max_results]
+
+
+def _random_stats(rnd, size):
+    # Few distinct view totals, so many scores tie
+    return [(f"kw{i}", rnd.randint(1, 6), rnd.choice([0, 5000, 20000, 10 ** 5, 10 ** 6]))
+            for i in range(size)]
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_rank_keywords_matches_the_stable_sort(seed):
+    rnd = random.Random(seed)
+    stats = _random_stats(rnd, rnd.randint(0, 80))
+    max_results = rnd.randint(1, 60)
+    assert rank_keywords(stats, max_results) == _sorted_ranking(stats, max_results)
+
+
+def test_rank_many_matches_rank_keywords_per_key():
+    rnd = random.Random(3)
+    stats_by_key = {("US", None): _random_stats(rnd, 40), ("GB", "10"): [], ("IN", None): _random_stats(rnd, 7)}
+    ranked = rank_many(stats_by_key, 10)
+    assert ranked == {key: rank_keywords(stats, 10) for key, stats in stats_by_key.items()}
+
+
+def test_unknown_formula_is_rejected():
+    with pytest.raises(ValueError):
+        rank_keywords([("a", 2, 10)], 5, formula="nope")
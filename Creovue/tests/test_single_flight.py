@@ -0,0 +1,132 @@
+"""Module: test_single_flight.py."""
+# tests/test_single_flight.py
+
+import multiprocessing
+import threading
+import time
+
+from Creovue.utils import decorators
+from Creovue.utils.cache import SQLiteCache
+from Creovue.utils.decorators import cached
+
+
+def _run_concurrently(target, count):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_misses_compute_once(memory_cache):
+    calls = []
+
+    @cached(expiry_seconds=60)
+    def slow_double(x):
+        calls.append(x)
+        time.sleep(0.2)
+        return x * 2
+
+    results = []
+    _run_concurrently(lambda: results.append(slow_double(21)), 8)
+
+    assert results == [42] * 8
+    assert calls == [21]
+
+
+def test_concurrent_misses_share_the_error(memory_cache):
+    calls = []
+
+    @cached(expiry_seconds=60)
+    def failing():
+        calls.append(1)
+        time.sleep(0.2)
+        raise RuntimeError("API down")
+
+    errors = []
+
+    def call():
+        try:
+            failing()
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    _run_concurrently(call, 5)
+
+    assert errors == ["API down"] * 5
+    assert len(calls) == 1
+
+
+def test_errors_are_not_cached(memory_cache):
+    outcomes = iter([RuntimeError("API down"), "ok"])
+
+    @cached(expiry_seconds=60)
+    def flaky():
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    try:
+        flaky()
+    except RuntimeError:
+        pass
+    assert flaky() == "ok"
+
+
+def test_sqlite_lease_excludes_other_workers(tmp_path):
+    path = str(tmp_path / "cache.db")
+    first, second = SQLiteCache(path=path), SQLiteCache(path=path)
+
+    token = first.acquire_lease("k", 10)
+    assert token is not None
+    assert second.acquire_lease("k", 10) is None
+    assert second.lease_held("k")
+
+    first.release_lease("k", token)
+    assert not second.lease_held("k")
+    assert second.acquire_lease("k", 10) is not None
+
+
+def test_abandoned_sqlite_lease_lapses(tmp_path):
+    path = str(tmp_path / "cache.db")
+    first, second = SQLiteCache(path=path), SQLiteCache(path=path)
+
+    assert first.acquire_lease("k", 0.05) is not None
+    time.sleep(0.1)
+    assert second.acquire_lease("k", 10) is not None
+
+
+@cached(expiry_seconds=60)
+def _shared_computation(log_path):
+    with open(log_path, "a") as f:
+        f.write("computed\n")
+    time.sleep(0.5)
+    return "result"
+
+
+def _compute_in_worker(cache_path, log_path, start, results):
+    cache = SQLiteCache(path=cache_path)
+    decorators.get_cache = lambda: cache
+    decorators.should_degrade = lambda: False
+    start.wait()
+    results.put(_shared_computation(log_path))
+
+
+def test_workers_sharing_sqlite_compute_once(tmp_path):
+    context = multiprocessing.get_context("spawn")
+    cache_path, log_path = str(tmp_path / "cache.db"), str(tmp_path / "calls.log")
+    SQLiteCache(path=cache_path)  # Create the schema before the workers race on it
+    start, results = context.Event(), context.Queue()
+    workers = [context.Process(target=_compute_in_worker, args=(cache_path, log_path, start, results))
+               for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    start.set()
+    outcomes = [results.get(timeout=60) for _ in workers]
+    for worker in workers:
+        worker.join(10)
+
+    assert outcomes == ["result", "result"]
+    with open(log_path) as f:
+        assert f.read().count("computed") == 1
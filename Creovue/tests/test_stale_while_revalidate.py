@@ -0,0 +1,112 @@
+"""Module: test_stale_while_revalidate.py."""
+# tests/test_stale_while_revalidate.py
+
+import threading
+import time
+
+import pytest
+
+from Creovue.utils import decorators
+from Creovue.utils.decorators import cached
+from Creovue.utils.quota import BACKGROUND, current_priority
+
+
+def _wait_for(condition, timeout=5):
+    # Monotonic: the tests move time.time() forward
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def later(monkeypatch):
+    """Move the decorator's clock `seconds` ahead of now."""
+    now = time.time()
+
+    def advance(seconds):
+        monkeypatch.setattr(decorators.time, "time", lambda: now + seconds)
+    return advance
+
+
+def test_stale_entry_is_served_while_refreshing(memory_cache, later):
+    calls = []
+    priorities = []
+
+    @cached(expiry_seconds=10, stale_while_revalidate=100)
+    def version():
+        calls.append(1)
+        priorities.append(current_priority())
+        return len(calls)
+
+    assert version() == 1
+    later(20)
+    # Expired but inside the window: the old value comes back at once
+    assert version() == 1
+    assert _wait_for(lambda: len(calls) == 2)
+    assert priorities[-1] == BACKGROUND
+    assert _wait_for(lambda: version() == 2)
+
+
+def test_stale_hits_schedule_one_refresh(memory_cache, later):
+    calls = []
+    release = threading.Event()
+
+    @cached(expiry_seconds=10, stale_while_revalidate=100)
+    def slow():
+        calls.append(1)
+        if len(calls) > 1:
+            release.wait(5)
+        return len(calls)
+
+    slow()
+    later(20)
+    assert [slow() for _ in range(10)] == [1] * 10
+    release.set()
+    assert _wait_for(lambda: not decorators._refreshing)
+    assert len(calls) == 2
+
+
+def test_failed_refresh_keeps_serving_stale(memory_cache, later):
+    outcomes = iter(["first", RuntimeError("API down")])
+
+    @cached(expiry_seconds=10, stale_while_revalidate=100)
+    def flaky():
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert flaky() == "first"
+    later(20)
+    assert flaky() == "first"
+    assert _wait_for(lambda: not decorators._refreshing)
+    assert flaky() == "first"
+
+
+def test_entry_past_the_stale_window_is_recomputed(memory_cache, later):
+    calls = []
+
+    @cached(expiry_seconds=10, stale_while_revalidate=100)
+    def version():
+        calls.append(1)
+        return len(calls)
+
+    assert version() == 1
+    later(200)
+    assert version() == 2
+
+
+def test_without_a_window_expired_entries_block(memory_cache, later):
+    calls = []
+
+    @cached(expiry_seconds=10)
+    def version():
+        calls.append(1)
+        return len(calls)
+
+    version()
+    later(20)
+    assert version() == 2
@@ -0,0 +1,153 @@
+"""Module: test_trend_monitor.py."""
+# tests/test_trend_monitor.py
+
+import pytest
+
+from Creovue import routes
+from Creovue.scheduler import trend_monitor
+from Creovue.scheduler.trend_monitor import REGION_AGGREGATORS, TrendWarmer
+from Creovue.utils import decorators
+from Creovue.utils.cache import SQLiteCache
+from Creovue.utils.decorators import cached
+from Creovue.utils.quota import BACKGROUND, current_priority
+
+
+class FakeTargets:
+    """Cached stand-ins for the snapshot, catalog and aggregators, recording each computation."""
+
+    def __init__(self):
+        self.calls = []
+        self.priorities = set()
+        self.snapshot = self._fake("snapshot", 1800)
+        self.catalog = self._fake("catalog", 7 * 86400)
+        self.aggregators = [(self._fake("keywords", 1800), 0), (self._fake("channels", 86400), 1)]
+
+    def _fake(self, name, expiry_seconds):
+        def compute(region, category_id=None):
+            self.calls.append((name, region, category_id))
+            self.priorities.add(current_priority())
+            return name
+        # Cache keys include the function's name
+        compute.__name__ = compute.__qualname__ = name
+        return cached(expiry_seconds=expiry_seconds)(compute)
+
+
+@pytest.fixture
+def targets(memory_cache, monkeypatch):
+    fake = FakeTargets()
+    monkeypatch.setattr(trend_monitor, "get_region_snapshot", fake.snapshot)
+    monkeypatch.setattr(trend_monitor, "get_category_map", fake.catalog)
+    monkeypatch.setattr(trend_monitor, "REGION_AGGREGATORS", fake.aggregators)
+    return fake
+
+
+def _warmer(tmp_path, **kwargs):
+    options = dict(regions=["US", "GB"], categories=["10"], interval=900, jitter=0.1,
+                   quota_budget=100, lock_path=str(tmp_path / "warmer.lock"))
+    options.update(kwargs)
+    return TrendWarmer(**options)
+
+
+def test_warms_snapshots_and_catalog_before_aggregators(targets, tmp_path):
+    stats = _warmer(tmp_path).run_once()
+
+    assert [call for call in targets.calls if call[1] == "US"] == [
+        ("snapshot", "US", None), ("snapshot", "US", "10"), ("catalog", "US", None),
+        ("keywords", "US", None), ("channels", "US", None)
+    ]
+    assert stats["last_run_warmed"] == 10
+    # Snapshots and catalogs cost one unit each, plus the channels aggregator
+    assert stats["units_spent_today"] == 2 * (2 + 1 + 1)
+    assert targets.priorities == {BACKGROUND}
+
+
+def test_fresh_entries_are_not_warmed_again(targets, tmp_path):
+    warmer = _warmer(tmp_path)
+    warmer.run_once()
+    targets.calls.clear()
+
+    stats = warmer.run_once()
+    assert targets.calls == []
+    assert stats["last_run_warmed"] == 0
+
+
+def test_daily_budget_is_never_exceeded(targets, tmp_path):
+    stats = _warmer(tmp_path, quota_budget=5).run_once()
+
+    assert stats["units_spent_today"] <= 5
+    assert stats["last_run_skipped"] > 0
+    assert ("snapshot", "GB", None) in targets.calls
+    # Free aggregators are still warmed once the budget is spent
+    assert ("keywords", "GB", None) in targets.calls
+
+
+def test_failing_target_is_counted_and_the_run_continues(targets, tmp_path, monkeypatch):
+    @cached(expiry_seconds=1800)
+    def broken(region, category_id=None):
+        raise RuntimeError("API down")
+
+    monkeypatch.setattr(trend_monitor, "REGION_AGGREGATORS", [(broken, 0)] + targets.aggregators)
+    stats = _warmer(tmp_path, regions=["US"], categories=[]).run_once()
+
+    assert stats["last_run_errors"] == 1
+    assert ("channels", "US", None) in targets.calls
+
+
+def test_memory_backend_makes_every_process_a_leader(memory_cache, tmp_path, monkeypatch):
+    monkeypatch.setattr(trend_monitor, "get_cache", lambda: memory_cache)
+    first, second = _warmer(tmp_path), _warmer(tmp_path)
+    assert first._acquire_leadership()
+    assert second._acquire_leadership()
+    assert second.stats()["is_leader"]
+
+
+def test_shared_backend_elects_one_leader_per_host(tmp_path, monkeypatch):
+    shared = SQLiteCache(path=str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(trend_monitor, "get_cache", lambda: shared)
+    first, second = _warmer(tmp_path), _warmer(tmp_path)
+
+    assert first._acquire_leadership()
+    assert not second._acquire_leadership()
+    assert not second.stats()["is_leader"]
+
+    first._release_leadership()
+    assert second._acquire_leadership()
+    second._release_leadership()
+
+
+def test_only_functions_read_by_routes_are_warmed():
+    for func, cost in REGION_AGGREGATORS:
+        assert getattr(routes, func.__name__, None) is func
+        assert cost >= 0
+    assert "fetch_top_channels" not in [func.__name__ for func, _ in REGION_AGGREGATORS]
+
+
+def test_refresh_recomputes_and_peek_never_computes(memory_cache):
+    calls = []
+
+    @cached(expiry_seconds=60)
+    def value(region, category_id=None):
+        calls.append(region)
+        return len(calls)
+
+    assert value.peek("US") is None
+    assert value("US") == 1
+    assert value.peek("US", None)[0] == 1
+    assert value.refresh("US") == 2
+    assert value(region="US") == 2
+    assert calls == ["US", "US"]
+
+
+def test_refresh_skips_a_key_another_worker_is_computing(tmp_path, monkeypatch):
+    shared = SQLiteCache(path=str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(decorators, "get_cache", lambda: shared)
+
+    @cached(expiry_seconds=60)
+    def value(region):
+        return "computed"
+
+    other = SQLiteCache(path=shared.path)
+    token = other.acquire_lease(value.cache_key("US"), 10)
+    assert value.refresh("US") is None
+    other.release_lease(value.cache_key("US"), token)
+    assert value.refresh("US") == "computed"
@@ -0,0 +1,159 @@
+"""Module: test_trend_store.py."""
+# tests/test_trend_store.py
+
+import time
+
+import pytest
+
+from Creovue.db import init_db, trend_store
+from Creovue.db.init_db import SQLiteDatabase
+from Creovue.db.trend_store import (
+    get_keyword_daily_series, get_snapshots, get_top_keyword, get_video_history, load_latest_snapshot,
+    prune_snapshots, rebuild_daily_rollups, record_snapshot
+)
+
+DAY = 86400
+
+
+def video(video_id, title, views, tags=()):
+    return {
+        "id": video_id,
+        "snippet": {"title": title, "channelId": "ch", "categoryId": "10", "tags": list(tags)},
+        "statistics": {"viewCount": str(views), "likeCount": "1", "commentCount": "0"}
+    }
+
+
+def snapshot(fetched_at, *items, region="US", category_id=None):
+    return {"region": region, "category_id": category_id, "fetched_at": fetched_at, "items": list(items)}
+
+
+def start_of_today():
+    return time.time() // DAY * DAY
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    database = SQLiteDatabase(path=str(tmp_path / "trends.db"))
+    database.init_schema()
+    monkeypatch.setattr(init_db, "_db", database)
+    # Only prune when a test asks for it
+    monkeypatch.setattr(trend_store, "_last_prune", time.time())
+    return database
+
+
+def test_snapshots_round_trip(db):
+    now = time.time()
+    items = [video("v1", "Guitar lesson", 100), video("v2", "Piano lesson", 50)]
+    record_snapshot(snapshot(now - 60, items[0]))
+    record_snapshot(snapshot(now, *items))
+
+    latest = load_latest_snapshot("US")
+    assert latest["fetched_at"] == now
+    assert latest["items"] == items
+    assert load_latest_snapshot("US", max_age=10)["fetched_at"] == now
+    assert load_latest_snapshot("GB") is None
+    assert [s["video_count"] for s in get_snapshots("US")] == [2, 1]
+
+
+def test_recording_twice_is_a_no_op(db):
+    now = time.time()
+    assert record_snapshot(snapshot(now, video("v1", "Guitar lesson", 100))) is not None
+    assert record_snapshot(snapshot(now, video("v1", "Guitar lesson", 100))) is None
+    assert len(get_snapshots("US")) == 1
+
+
+def test_categories_are_stored_apart(db):
+    now = time.time()
+    record_snapshot(snapshot(now, video("v1", "Guitar lesson", 100), category_id="10"))
+    assert load_latest_snapshot("US") is None
+    assert load_latest_snapshot("US", category_id="10")["items"][0]["id"] == "v1"
+
+
+def test_video_history_follows_a_video_across_snapshots(db):
+    now = time.time()
+    record_snapshot(snapshot(now - 60, video("v1", "Guitar lesson", 100)))
+    record_snapshot(snapshot(now, video("v2", "Piano", 5), video("v1", "Guitar lesson", 300)))
+
+    history = get_video_history("v1")
+    assert [(h["position"], h["views"]) for h in history] == [(0, 100), (1, 300)]
+
+
+def test_prune_drops_old_snapshots_with_their_rows(db):
+    now = time.time()
+    record_snapshot(snapshot(now - 10 * DAY, video("old", "Guitar lesson", 100)))
+    record_snapshot(snapshot(now, video("new", "Guitar lesson", 100)))
+
+    assert prune_snapshots(max_age_days=5) == 1
+    assert [s["fetched_at"] for s in get_snapshots("US")] == [now]
+    conn = db.connect()
+    assert conn.execute("SELECT video_id FROM snapshot_videos").fetchall() == [("new",)]
+    assert conn.execute("SELECT COUNT(*) FROM snapshot_keywords WHERE fetched_at < ?", (now,)).fetchone() == (0,)
+
+
+def test_recording_sweeps_expired_snapshots_once_an_hour(db, monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(trend_store, "creo_db_retention_days", 5)
+    monkeypatch.setattr(trend_store, "prune_snapshots", lambda: pruned.append(1))
+    pruned = []
+
+    record_snapshot(snapshot(now, video("v1", "Guitar lesson", 100)))
+    assert pruned == []
+    monkeypatch.setattr(trend_store, "_last_prune", now - trend_store.PRUNE_INTERVAL - 1)
+    record_snapshot(snapshot(now + 1, video("v1", "Guitar lesson", 100)))
+    record_snapshot(snapshot(now + 2, video("v1", "Guitar lesson", 100)))
+    assert pruned == [1]
+
+
+@pytest.fixture
+def two_days(db):
+    """Two snapshots today and one yesterday (UTC), all in the US."""
+    today = start_of_today()
+    record_snapshot(snapshot(today - DAY + 1, video("v1", "Guitar lesson", 100)))
+    record_snapshot(snapshot(today + 1, video("v1", "Guitar lesson", 300), video("v2", "Piano lesson", 100)))
+    record_snapshot(snapshot(today + 2, video("v2", "Piano lesson", 200, tags=["Guitar"])))
+    return db
+
+
+def test_daily_series_reads_the_rollups(two_days):
+    series = get_keyword_daily_series("US", "Guitar", days=3)
+
+    assert [day["snapshots"] for day in series] == [0, 1, 2]
+    assert series[0]["volume"] is None and series[0]["avg_views"] is None
+    assert series[1]["volume"] == 1 and series[1]["avg_views"] == 100
+    # Two matching videos over two snapshots
+    assert series[2]["volume"] == 1 and series[2]["avg_views"] == 250
+    assert get_keyword_daily_series("US", "violin", days=1) == [
+        {"day": series[2]["day"], "snapshots": 2, "volume": 0.0, "avg_views": 0}
+    ]
+
+
+def test_top_keyword_counts_videos_over_the_window(two_days):
+    assert get_top_keyword("US", days=1) == "lesson"
+    assert get_top_keyword("GB") is None
+
+
+def test_rebuild_matches_the_incremental_rollups(two_days):
+    conn = two_days.connect()
+    rollups = lambda: (conn.execute("SELECT * FROM snapshot_daily ORDER BY day").fetchall(),
+                       conn.execute("SELECT * FROM keyword_daily ORDER BY day, keyword").fetchall())
+    recorded = rollups()
+
+    assert rebuild_daily_rollups() == 3
+    assert rollups() == recorded
+
+
+def test_first_open_backfills_missing_rollups(two_days, monkeypatch):
+    conn = two_days.connect()
+    conn.execute("DELETE FROM snapshot_daily")
+    conn.execute("DELETE FROM keyword_daily")
+    monkeypatch.setattr(init_db, "_db", None)
+    monkeypatch.setattr(init_db, "creo_db_engine", "test")
+    monkeypatch.setitem(init_db.DB_ENGINES, "test", lambda: two_days)
+
+    init_db.get_db()
+    assert conn.execute("SELECT SUM(snapshots) FROM snapshot_daily").fetchone() == (3,)
+
+
+def test_prune_drops_old_rollups(two_days):
+    prune_snapshots(max_age_days=(time.time() - start_of_today()) / DAY)
+    assert [day["snapshots"] for day in get_keyword_daily_series("US", "guitar", days=2)] == [0, 2]
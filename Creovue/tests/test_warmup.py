@@ -0,0 +1,87 @@
+"""Module: test_warmup.py."""
+# tests/test_warmup.py
+
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import Creovue
+from Creovue import app, app_secrets
+from Creovue.utils import warmup
+from Creovue.utils.warmup import is_ready, start_warmup, warm_up, warmup_report
+
+
+@pytest.fixture
+def steps(monkeypatch):
+    """A cold process with two warm-up steps, the second of which fails."""
+    calls = []
+
+    def failing():
+        calls.append("failing")
+        raise RuntimeError("API down")
+
+    monkeypatch.setattr(warmup, "WARMUP_STEPS", [("first", lambda: calls.append("first")), ("failing", failing)])
+    monkeypatch.setattr(warmup, "_state", {"started": None, "finished": None, "steps": {}})
+    monkeypatch.setattr(warmup, "_ready", threading.Event())
+    monkeypatch.setattr(warmup, "_thread", None)
+    monkeypatch.setattr(app_secrets, "creo_warmup_enabled", True)
+    return calls
+
+
+def test_readyz_is_503_until_warm(steps):
+    client = app.test_client()
+
+    response = client.get("/readyz")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert response.cache_control.no_store
+
+    warm_up()
+    response = client.get("/readyz")
+    assert response.status_code == 200
+    assert response.get_json()["ready"]
+
+
+def test_failing_steps_are_recorded_without_blocking(steps):
+    report = warm_up()
+
+    assert steps == ["first", "failing"]
+    assert report["ready"] and is_ready()
+    assert report["steps"]["first"]["error"] is None
+    assert report["steps"]["failing"]["error"] == "API down"
+
+
+def test_warm_up_runs_once(steps):
+    warm_up()
+    warm_up()
+    assert steps == ["first", "failing"]
+
+
+def test_disabled_warm_up_is_ready_at_once(steps, monkeypatch):
+    monkeypatch.setattr(app_secrets, "creo_warmup_enabled", False)
+
+    assert warm_up()["ready"]
+    assert steps == []
+
+
+def test_start_warmup_runs_in_the_background(steps):
+    start_warmup()
+    warmup._thread.join(5)
+
+    assert is_ready()
+    assert warmup_report()["steps"].keys() == {"first", "failing"}
+
+
+def test_importing_the_app_starts_no_background_work():
+    code = (
+        "import threading, Creovue.routes\n"
+        "print(','.join(thread.name for thread in threading.enumerate() if thread is not threading.main_thread()))\n"
+    )
+    root = os.path.dirname(os.path.dirname(Creovue.__file__))
+    env = dict(os.environ, CREO_WARMUP_ENABLED="1", CREO_SCHEDULER_ENABLED="1")
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, env=env, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
@@ -0,0 +1,139 @@
+"""Module: assets.py."""
+# utils/assets.py
+
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import shutil
+
+from Creovue.app_secrets import creo_asset_max_age
+from Creovue.utils.compression import brotli, choose_encoding
+
+logger = logging.getLogger('assets')
+
+DIST_DIR = "dist"  # Under the app's static folder
+MANIFEST_NAME = "manifest.json"
+SKIP_EXTENSIONS = {".xcf", ".psd", ".map"}  # Source files that are never served
+PRECOMPRESS_EXTENSIONS = {".css", ".js", ".svg", ".json", ".txt", ".html"}
+HASH_LENGTH = 12
+
+
+def _fingerprint(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(65536), b""):
+            digest.update(block)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def build_assets(static_dir):
+    """
+    Copy static files to dist/ under content-hashed names, with .gz/.br siblings.
+
+    A file's name changes whenever its content does, so the copies can be
+    cached by browsers forever. Text assets are precompressed at the highest
+    levels once here instead of per request.
+
+    Args:
+        static_dir (str): The app's static folder
+
+    Returns:
+        dict: The manifest, {logical path: hashed path under dist/}
+    """
+    dist_dir = os.path.join(static_dir, DIST_DIR)
+    if os.path.isdir(dist_dir):
+        shutil.rmtree(dist_dir)
+
+    manifest = {}
+    for root, dirs, files in os.walk(static_dir):
+        dirs[:] = [d for d in dirs if os.path.join(root, d) != dist_dir]
+        for name in sorted(files):
+            stem, ext = os.path.splitext(name)
+            if ext.lower() in SKIP_EXTENSIONS:
+                continue
+            source = os.path.join(root, name)
+            logical = os.path.relpath(source, static_dir).replace(os.sep, "/")
+            hashed = os.path.join(os.path.dirname(logical), f"{stem}.{_fingerprint(source)}{ext}").replace(os.sep, "/")
+            target = os.path.join(dist_dir, hashed)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copyfile(source, target)
+
+            if ext.lower() in PRECOMPRESS_EXTENSIONS:
+                with open(source, "rb") as f:
+                    data = f.read()
+                with open(f"{target}.gz", "wb") as f:
+                    f.write(gzip.compress(data, compresslevel=9, mtime=0))
+                if brotli is not None:
+                    with open(f"{target}.br", "wb") as f:
+                        f.write(brotli.compress(data, quality=11))
+            manifest[logical] = hashed
+
+    with open(os.path.join(dist_dir, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    logger.info(f"Built {len(manifest)} assets into {dist_dir}")
+    return manifest
+
+
+def load_manifest(static_dir):
+    try:
+        with open(os.path.join(static_dir, DIST_DIR, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def init_assets(app):
+    """
+    Serve built assets under their hashed names with far-future caching.
+
+    url_for('static', filename=...) resolves to the hashed copy when one has
+    been built; the original file is served otherwise. Precompressed siblings
+    are sent to clients that accept them.
+    """
+    from flask import request, send_from_directory
+
+    manifest = load_manifest(app.static_folder)
+    dist_prefix = f"{DIST_DIR}/"
+    serve_original = app.view_functions["static"]
+
+    @app.url_defaults
+    def _hashed_static_url(endpoint, values):
+        if endpoint == "static" and values.get("filename") in manifest:
+            values["filename"] = dist_prefix + manifest[values["filename"]]
+
+    def static(filename):
+        if not filename.startswith(dist_prefix):
+            return serve_original(filename=filename)
+
+        dist_dir = os.path.join(app.static_folder, DIST_DIR)
+        relative = filename[len(dist_prefix):]
+        encoding = choose_encoding(request.accept_encodings)
+        suffix = {"br": ".br", "gzip": ".gz"}.get(encoding)
+        if suffix and os.path.isfile(os.path.join(dist_dir, relative + suffix)):
+            mimetype = mimetypes.guess_type(relative)[0] or "application/octet-stream"
+            response = send_from_directory(dist_dir, relative + suffix, mimetype=mimetype, max_age=creo_asset_max_age)
+            response.headers["Content-Encoding"] = encoding
+        else:
+            response = send_from_directory(dist_dir, relative, max_age=creo_asset_max_age)
+        response.vary.add("Accept-Encoding")
+        response.cache_control.immutable = True
+        return response
+
+    app.view_functions["static"] = static
+
+    @app.cli.command("build-assets")
+    def build_assets_command():
+        """Fingerprint and precompress the static assets."""
+        built = build_assets(app.static_folder)
+        print(f"Built {len(built)} assets into {os.path.join(app.static_folder, DIST_DIR)}")
+
+    if manifest:
+        logger.info(f"Serving {len(manifest)} fingerprinted assets")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    build_assets(os.path.join(os.path.dirname(os.path.dirname(__file__)), "static"))
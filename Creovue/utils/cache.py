@@ -0,0 +1,353 @@
+"""Module: cache.py."""
+# utils/cache.py
+
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import uuid
+from collections import OrderedDict
+from time import time
+
+from Creovue.app_secrets import (
+    creo_cache_backend,
+    creo_cache_path,
+    creo_cache_max_entries,
+    creo_cache_max_bytes
+)
+
+logger = logging.getLogger('cache')
+
+
+@functools.lru_cache(maxsize=None)
+def _signature(func):
+    try:
+        return inspect.signature(func)
+    except (TypeError, ValueError):
+        return None
+
+
+def _call_arguments(func, args, kwargs):
+    """
+    Normalise a call to its bound arguments with defaults applied.
+
+    f('US'), f('US', None) and f(region='US') all name the same call, so they
+    must share one cache entry.
+    """
+    signature = _signature(func)
+    if signature is None:
+        return (args, sorted(kwargs.items()))
+    try:
+        bound = signature.bind(*args, **kwargs)
+    except TypeError:
+        return (args, sorted(kwargs.items()))
+    bound.apply_defaults()
+    arguments = []
+    for name, value in bound.arguments.items():
+        if signature.parameters[name].kind is inspect.Parameter.VAR_KEYWORD:
+            value = sorted(value.items())
+        arguments.append((name, value))
+    return arguments
+
+
+def make_cache_key(func, args, kwargs):
+    """
+    Build a stable cache key for a function call.
+
+    Arguments are bound to the function's signature first, so positional,
+    keyword and defaulted spellings of the same call get the same key.
+
+    Args:
+        func (callable): The cached function
+        args (tuple): Positional arguments of the call
+        kwargs (dict): Keyword arguments of the call
+
+    Returns:
+        str: "<module>.<qualname>:<sha1 of the arguments>"
+    """
+    digest = hashlib.sha1(repr(_call_arguments(func, args, kwargs)).encode('utf-8')).hexdigest()
+    return f"{func.__module__}.{func.__qualname__}:{digest}"
+
+
+def _estimate_size(value):
+    """Approximate the memory footprint of a cached value in bytes."""
+    try:
+        return len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class MemoryCache:
+    """
+    In-process LRU cache with per-entry TTL and a memory ceiling.
+
+    Fast, but private to the worker process that owns it.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries=creo_cache_max_entries, max_bytes=creo_cache_max_bytes):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (value, stored_at, expires_at, size)
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return (value, stored_at) for a live entry, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, stored_at, expires_at, size = entry
+            if expires_at <= time():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value, stored_at
+
+    def set(self, key, value, ttl):
+        """Store a value for `ttl` seconds, evicting least recently used entries."""
+        size = _estimate_size(value)
+        now = time()
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, now, now + ttl, size)
+            self._bytes += size
+            self._evict()
+
+    def delete(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def acquire_lease(self, key, ttl):
+        """Threads are already coalesced in-process, so the lease is always granted."""
+        return uuid.uuid4().hex
+
+    def release_lease(self, key, token):
+        pass
+
+    def lease_held(self, key):
+        return False
+
+    def stats(self):
+        with self._lock:
+            return {
+                "backend": self.name,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
+
+    def _remove(self, key):
+        _, _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+
+
+class SQLiteCache:
+    """
+    Cross-process LRU cache stored in a single SQLite file.
+
+    Every gunicorn worker on the host opens the same file, so data fetched by
+    one worker is served to all of them. Needs no external service.
+    """
+
+    name = "sqlite"
+    TOUCH_INTERVAL = 5  # Seconds between last-access writes for a hot key
+
+    def __init__(self, path=creo_cache_path, max_entries=creo_cache_max_entries, max_bytes=creo_cache_max_bytes):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._stats_lock = threading.Lock()
+        self._connect().executescript("""
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_cache_last_access ON cache (last_access);
+            CREATE TABLE IF NOT EXISTS leases (
+                key TEXT PRIMARY KEY,
+                token TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            );
+        """)
+
+    def _connect(self):
+        """Return this thread's connection, reopening it after a fork."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _count(self, counter):
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, key):
+        """Return (value, stored_at) for a live entry, or None on a miss."""
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT value, stored_at, expires_at, last_access FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        now = time()
+        if row is None or row[2] <= now:
+            self._count("misses")
+            return None
+        if now - row[3] > self.TOUCH_INTERVAL:
+            conn.execute("UPDATE cache SET last_access = ? WHERE key = ?", (now, key))
+        try:
+            value = pickle.loads(row[0])
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {key}: {e}")
+            self.delete(key)
+            self._count("misses")
+            return None
+        self._count("hits")
+        return value, row[1]
+
+    def set(self, key, value, ttl):
+        """Store a value for `ttl` seconds, evicting least recently used entries."""
+        blob = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        now = time()
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, stored_at, expires_at, last_access, size) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, blob, now, now + ttl, now, len(blob))
+        )
+        self._evict(conn, now)
+
+    def delete(self, key):
+        self._connect().execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self):
+        self._connect().execute("DELETE FROM cache")
+
+    def acquire_lease(self, key, ttl):
+        """
+        Claim the right to recompute `key` across all worker processes.
+
+        Args:
+            key (str): Cache key being recomputed
+            ttl (float): Seconds after which an abandoned lease lapses
+
+        Returns:
+            str or None: Lease token, or None if another process holds it
+        """
+        token = uuid.uuid4().hex
+        now = time()
+        conn = self._connect()
+        conn.execute("DELETE FROM leases WHERE key = ? AND expires_at <= ?", (key, now))
+        claimed = conn.execute(
+            "INSERT OR IGNORE INTO leases (key, token, expires_at) VALUES (?, ?, ?)",
+            (key, token, now + ttl)
+        ).rowcount
+        return token if claimed else None
+
+    def release_lease(self, key, token):
+        self._connect().execute("DELETE FROM leases WHERE key = ? AND token = ?", (key, token))
+
+    def lease_held(self, key):
+        row = self._connect().execute(
+            "SELECT 1 FROM leases WHERE key = ? AND expires_at > ?", (key, time())
+        ).fetchone()
+        return row is not None
+
+    def stats(self):
+        entries, total = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache").fetchone()
+        return {
+            "backend": self.name,
+            "path": self.path,
+            "entries": entries,
+            "bytes": total,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+    def _evict(self, conn, now):
+        expired = conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,)).rowcount
+        entries, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache").fetchone()
+        evicted = 0
+        while entries > self.max_entries or total > self.max_bytes:
+            row = conn.execute("SELECT key, size FROM cache ORDER BY last_access LIMIT 1").fetchone()
+            if row is None:
+                break
+            conn.execute("DELETE FROM cache WHERE key = ?", (row[0],))
+            entries -= 1
+            total -= row[1]
+            evicted += 1
+        if expired or evicted:
+            with self._stats_lock:
+                self.evictions += expired + evicted
+
+
+CACHE_BACKENDS = {
+    "memory": MemoryCache,
+    "sqlite": SQLiteCache
+}
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """Return the configured process-wide cache backend (CREO_CACHE_BACKEND)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                backend = CACHE_BACKENDS.get(creo_cache_backend)
+                if backend is None:
+                    logger.warning(f"Unknown cache backend '{creo_cache_backend}', using memory")
+                    backend = MemoryCache
+                _cache = backend()
+    return _cache
+
+
+def cache_stats():
+    """Return size and hit/miss/eviction counters of the active cache backend."""
+    return get_cache().stats()
@@ -0,0 +1,84 @@
+"""Module: compression.py."""
+# utils/compression.py
+
+import gzip
+import logging
+
+from Creovue.app_secrets import creo_compress_min_size, creo_compress_level, creo_brotli_quality
+
+try:
+    import brotli
+except ImportError:  # Declared in requirements.txt; without it only gzip is offered
+    brotli = None
+
+logger = logging.getLogger('compression')
+
+COMPRESSIBLE_TYPES = {
+    "text/html", "text/css", "text/plain", "text/csv", "text/javascript",
+    "application/json", "application/javascript", "application/xml", "image/svg+xml"
+}
+
+
+def choose_encoding(accept_encodings):
+    """
+    Pick the best content coding the client accepts.
+
+    Args:
+        accept_encodings (werkzeug.datastructures.MIMEAccept): request.accept_encodings
+
+    Returns:
+        str or None: 'br', 'gzip' or None
+    """
+    if brotli is not None and accept_encodings["br"]:
+        return "br"
+    if accept_encodings["gzip"]:
+        return "gzip"
+    return None
+
+
+def compress(data, encoding):
+    if encoding == "br":
+        return brotli.compress(data, quality=creo_brotli_quality)
+    return gzip.compress(data, compresslevel=creo_compress_level, mtime=0)
+
+
+def compress_response(request, response):
+    """
+    Compress a buffered response body if it is worth it and the client accepts it.
+
+    Streamed and file responses, small bodies, non-text types and bodies that
+    already carry a Content-Encoding are left alone.
+    """
+    if (response.status_code < 200 or response.status_code in (204, 206, 304)
+            or response.direct_passthrough or response.is_streamed
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESSIBLE_TYPES):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = choose_encoding(request.accept_encodings)
+    if encoding is None:
+        return response
+
+    data = response.get_data()
+    if len(data) < creo_compress_min_size:
+        return response
+
+    response.set_data(compress(data, encoding))
+    response.headers["Content-Encoding"] = encoding
+    # The encoded body differs byte-for-byte, so a strong validator becomes weak
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def init_compression(app):
+    """Compress eligible responses of `app` after each request."""
+    from flask import request
+
+    @app.after_request
+    def _compress(response):
+        return compress_response(request, response)
+
+    logger.info(f"Response compression enabled ({'br, gzip' if brotli else 'gzip'}, >= {creo_compress_min_size} bytes)")
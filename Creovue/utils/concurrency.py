@@ -0,0 +1,77 @@
+"""Module: concurrency.py."""
+# utils/concurrency.py
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from time import monotonic
+
+from Creovue.app_secrets import creo_fanout_workers, creo_fanout_timeout
+
+logger = logging.getLogger('concurrency')
+
+# Shared, bounded pool so a burst of requests cannot spawn unbounded threads
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Return the process-wide fan-out thread pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=creo_fanout_workers,
+                    thread_name_prefix="creo-fanout"
+                )
+    return _executor
+
+
+def reset_after_fork():
+    """Forget the parent's fan-out pool in a forked child; its threads did not survive the fork."""
+    global _executor, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+
+
+def fan_out(tasks, timeout=creo_fanout_timeout, defaults=None):
+    """
+    Run independent blocking calls concurrently and collect their results.
+
+    Every task gets its own deadline measured from submission, so total
+    latency is bounded by the slowest call rather than the sum of all calls.
+    A task that fails or misses its deadline contributes its default value.
+
+    Args:
+        tasks (dict): {name: zero-argument callable}
+        timeout (float or dict): Deadline in seconds, or {name: seconds}
+        defaults (dict, optional): {name: value} used for incomplete tasks
+
+    Returns:
+        (dict, list): Results by task name, names of tasks that did not complete
+    """
+    defaults = defaults or {}
+    executor = get_executor()
+    started = monotonic()
+
+    futures = {name: executor.submit(call) for name, call in tasks.items()}
+
+    results = {}
+    incomplete = []
+    for name, future in futures.items():
+        deadline = timeout.get(name, creo_fanout_timeout) if isinstance(timeout, dict) else timeout
+        remaining = max(0, started + deadline - monotonic())
+        try:
+            results[name] = future.result(timeout=remaining)
+        except FutureTimeout:
+            future.cancel()
+            logger.warning(f"Fan-out task '{name}' missed its {deadline}s deadline")
+            results[name] = defaults.get(name)
+            incomplete.append(name)
+        except Exception as e:
+            logger.error(f"Fan-out task '{name}' failed: {e}")
+            results[name] = defaults.get(name)
+            incomplete.append(name)
+
+    return results, incomplete
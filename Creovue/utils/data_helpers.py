@@ -1 +1,34 @@
 """Module: data_helpers.py."""
+# utils/data_helpers.py
+
+import re
+
+# Filter out common words and short terms
+COMMON_WORDS = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", 
+               "with", "by", "of", "from", "as", "is", "are", "was", "were", "be", 
+               "this", "that", "it", "what", "when", "where", "how", "why", "who",
+               "video", "new", "top", "best", "vs", "you", "your", "i", "we", "they"}
+
+
+def extract_keywords_from_title(title):
+    """Extract meaningful keywords from title"""
+    # Remove special characters and lowercase
+    cleaned = re.sub(r'[^\w\s]', ' ', title.lower())
+    
+    keywords = [word for word in cleaned.split() if word not in COMMON_WORDS and len(word) > 2]
+    return keywords
+
+
+def video_keywords(item):
+    """
+    Distinct lower-cased keywords of a trending video: title words plus tags.
+
+    Args:
+        item (dict): A videos.list item with a snippet
+
+    Returns:
+        set: Keywords longer than two characters
+    """
+    snippet = item['snippet']
+    keywords = extract_keywords_from_title(snippet['title']) + snippet.get('tags', [])
+    return {keyword.lower() for keyword in keywords if len(keyword) > 2}
@@ -4,22 +4,202 @@ import time
 import functools
 import logging
 
-# In-memory cache
-_cache_store = {}
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from Creovue.utils.cache import get_cache, make_cache_key
+from Creovue.utils.quota import QuotaExceeded, BACKGROUND, quota_priority, should_degrade
+from Creovue.app_secrets import creo_cache_lease_seconds, creo_cache_refresh_workers, creo_cache_stale_grace
+
+LEASE_POLL_INTERVAL = 0.1  # Seconds between checks while another worker computes a key
+
+# Calls currently being computed in this process, keyed by cache key
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+# Background revalidation of stale entries
+_refresh_executor = ThreadPoolExecutor(max_workers=creo_cache_refresh_workers, thread_name_prefix="creo-refresh")
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+def reset_after_fork():
+    """
+    Drop the parent's refresh pool and in-flight bookkeeping in a forked child.
+
+    Threads do not survive a fork, so computations the parent had in flight
+    would never finish here and their locks might be left held.
+    """
+    global _inflight_lock, _refresh_executor, _refreshing_lock
+    _inflight.clear()
+    _inflight_lock = threading.Lock()
+    _refresh_executor = ThreadPoolExecutor(max_workers=creo_cache_refresh_workers, thread_name_prefix="creo-refresh")
+    _refreshing.clear()
+    _refreshing_lock = threading.Lock()
+
+
+class _Flight:
+    """A single in-progress computation that concurrent callers wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def _fresh(entry, expiry_seconds):
+    """Return True if a (value, stored_at) cache entry is younger than expiry_seconds."""
+    return entry is not None and time.time() - entry[1] < expiry_seconds
+
+
+def _single_flight(key, compute):
+    """
+    Run `compute` once per key for all concurrent callers in this process.
+
+    The first caller computes; everyone arriving while it runs waits and
+    shares the same result (or exception).
+    """
+    with _inflight_lock:
+        flight = _inflight.get(key)
+        leader = flight is None
+        if leader:
+            flight = _inflight[key] = _Flight()
+
+    if not leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    try:
+        flight.result = compute()
+        return flight.result
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+        flight.done.set()
+
+
+def _schedule_refresh(key, compute):
+    """Revalidate a stale key on the background pool, at most once at a time."""
+    with _refreshing_lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+
+    def refresh():
+        try:
+            with quota_priority(BACKGROUND):
+                _single_flight(key, compute)
+        except Exception as e:
+            logging.warning(f"Background refresh of {key} failed: {e}")
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(key)
+
+    _refresh_executor.submit(refresh)
+
+
+def _compute_and_store(cache, key, expiry_seconds, retention, func, args, kwargs):
+    """
+    Recompute a missed key, coordinating with other worker processes.
+
+    With a shared backend only the lease holder calls the API; other
+    processes poll the cache until its result lands or the lease lapses.
+    """
+    token = cache.acquire_lease(key, creo_cache_lease_seconds)
+    if token is None:
+        deadline = time.time() + creo_cache_lease_seconds
+        while time.time() < deadline:
+            time.sleep(LEASE_POLL_INTERVAL)
+            entry = cache.get(key)
+            if _fresh(entry, expiry_seconds):
+                return entry[0]
+            if not cache.lease_held(key):
+                break
+        token = cache.acquire_lease(key, creo_cache_lease_seconds)
+
+    try:
+        # Another process may have stored the value while we waited for the lease
+        entry = cache.get(key)
+        if _fresh(entry, expiry_seconds):
+            return entry[0]
+        result = func(*args, **kwargs)
+        cache.set(key, result, retention)
+        return result
+    finally:
+        if token is not None:
+            cache.release_lease(key, token)
+
+
+def _refresh_now(cache, key, retention, func, args, kwargs):
+    """Recompute and store a key unconditionally, unless another worker already is."""
+    token = cache.acquire_lease(key, creo_cache_lease_seconds)
+    if token is None:
+        return None
+    try:
+        result = func(*args, **kwargs)
+        cache.set(key, result, retention)
+        return result
+    finally:
+        cache.release_lease(key, token)
+
+
+def cached(expiry_seconds=3600, stale_while_revalidate=0):
+    """
+    Cache results in the shared cache backend for `expiry_seconds`.
+
+    Concurrent misses for the same key are coalesced into one computation,
+    across threads and, with a shared backend, across worker processes.
+
+    With `stale_while_revalidate`, an expired entry is still served for up to
+    that many extra seconds while a background worker refreshes it; past that
+    window the caller blocks on a fresh computation.
+
+    Expired entries are retained a while longer (CREO_CACHE_STALE_GRACE) and
+    served instead of calling the API once the quota budget is nearly spent.
+    """
+    retention = expiry_seconds + max(stale_while_revalidate, creo_cache_stale_grace)
 
-def cached(expiry_seconds=3600):
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            key = (func.__name__, args, frozenset(kwargs.items()))
-            now = time.time()
-            if key in _cache_store:
-                result, timestamp = _cache_store[key]
-                if now - timestamp < expiry_seconds:
-                    return result
-            result = func(*args, **kwargs)
-            _cache_store[key] = (result, now)
-            return result
+            cache = get_cache()
+            key = make_cache_key(func, args, kwargs)
+            compute = lambda: _compute_and_store(cache, key, expiry_seconds, retention, func, args, kwargs)
+            entry = cache.get(key)
+            if _fresh(entry, expiry_seconds):
+                return entry[0]
+            if entry is not None:
+                if should_degrade():
+                    return entry[0]
+                if _fresh(entry, expiry_seconds + stale_while_revalidate):
+                    _schedule_refresh(key, compute)
+                    return entry[0]
+            try:
+                return _single_flight(key, compute)
+            except QuotaExceeded as e:
+                if entry is None:
+                    raise
+                logging.warning(f"Serving expired {key}: {e}")
+                return entry[0]
+        def refresh(*args, **kwargs):
+            """Recompute the entry for these arguments now, e.g. from a warmer."""
+            cache = get_cache()
+            key = make_cache_key(func, args, kwargs)
+            return _single_flight(key, lambda: _refresh_now(cache, key, retention, func, args, kwargs))
+
+        def peek(*args, **kwargs):
+            """Return the cached (value, stored_at) for these arguments, or None."""
+            return get_cache().get(make_cache_key(func, args, kwargs))
+
+        wrapper.cache_key = lambda *args, **kwargs: make_cache_key(func, args, kwargs)
+        wrapper.refresh = refresh
+        wrapper.peek = peek
+        wrapper.expiry_seconds = expiry_seconds
         return wrapper
     return decorator
 
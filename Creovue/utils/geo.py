@@ -0,0 +1,134 @@
+"""Module: geo.py."""
+# utils/geo.py
+
+import logging
+import threading
+
+from Creovue.app_secrets import creo_default_region, creo_geolocate_default
+from Creovue.utils.lazy import lazy_import
+
+logger = logging.getLogger('geo')
+
+geocoder = lazy_import("geocoder")
+
+FALLBACK_REGION = "US"
+REGION_COOKIE = "creo_region"
+
+# Headers set by the client or by a CDN/proxy that already geolocated the user
+REGION_HEADERS = ("X-Creo-Region", "CF-IPCountry", "CloudFront-Viewer-Country", "X-Country-Code")
+
+# Most likely region for a bare Accept-Language tag such as "ja" or "pt"
+# ("zh" maps to TW because YouTube publishes no mostPopular chart for CN)
+LANGUAGE_REGIONS = {
+    "af": "ZA", "am": "ET", "ar": "SA", "az": "AZ", "be": "BY", "bg": "BG",
+    "bn": "BD", "bs": "BA", "ca": "ES", "cs": "CZ", "cy": "GB", "da": "DK",
+    "de": "DE", "el": "GR", "en": "US", "es": "ES", "et": "EE", "eu": "ES",
+    "fa": "IR", "fi": "FI", "fil": "PH", "fr": "FR", "ga": "IE", "gl": "ES",
+    "gu": "IN", "ha": "NG", "he": "IL", "hi": "IN", "hr": "HR", "hu": "HU",
+    "hy": "AM", "id": "ID", "ig": "NG", "is": "IS", "it": "IT", "iw": "IL",
+    "ja": "JP", "ka": "GE", "kk": "KZ", "km": "KH", "kn": "IN", "ko": "KR",
+    "lt": "LT", "lv": "LV", "mk": "MK", "ml": "IN", "mn": "MN", "mr": "IN",
+    "ms": "MY", "my": "MM", "nb": "NO", "ne": "NP", "nl": "NL", "no": "NO",
+    "pa": "IN", "pl": "PL", "pt": "BR", "ro": "RO", "ru": "RU", "si": "LK",
+    "sk": "SK", "sl": "SI", "sq": "AL", "sr": "RS", "sv": "SE", "sw": "KE",
+    "ta": "IN", "te": "IN", "th": "TH", "tl": "PH", "tr": "TR", "uk": "UA",
+    "ur": "PK", "uz": "UZ", "vi": "VN", "yo": "NG", "zh": "TW", "zu": "ZA"
+}
+
+_default_region = None
+_default_region_lock = threading.Lock()
+
+
+def _normalise_region(value):
+    """Return an upper-case ISO 3166 alpha-2 code, or None if `value` is not one."""
+    if not value:
+        return None
+    code = value.strip().upper()
+    if len(code) == 2 and code.isalpha() and code not in ("XX", "T1"):
+        return code
+    return None
+
+
+def _geolocate_server():
+    """Look up the server's country by IP. Network I/O: only called once at startup."""
+    try:
+        location = geocoder.ip('me')
+        if location and location.country:
+            return _normalise_region(location.country)
+    except Exception as e:
+        logger.warning(f"Geolocation failed: {e}")
+    return None
+
+
+def resolve_default_region():
+    """
+    Resolve the process-wide default region once and cache it.
+
+    Order: CREO_DEFAULT_REGION, then (if CREO_GEOLOCATE_DEFAULT is on) a single
+    geolocation of the server, then 'US'. The warm-up (utils/warmup.py) calls
+    this so requests never pay for the lookup; otherwise the first caller does.
+
+    Returns:
+        str: ISO region code
+    """
+    global _default_region
+    if _default_region is None:
+        with _default_region_lock:
+            if _default_region is None:
+                region = _normalise_region(creo_default_region)
+                if region is None and creo_geolocate_default:
+                    region = _geolocate_server()
+                _default_region = region or FALLBACK_REGION
+                logger.info(f"Default region resolved to {_default_region}")
+    return _default_region
+
+
+def region_from_accept_language(accept_languages):
+    """
+    Map a parsed Accept-Language header to a region code.
+
+    Args:
+        accept_languages (werkzeug.datastructures.LanguageAccept): Ordered by quality
+
+    Returns:
+        str or None: Region from the first usable language tag
+    """
+    for tag, _quality in accept_languages:
+        parts = tag.replace("_", "-").split("-")
+        for subtag in parts[1:]:
+            region = _normalise_region(subtag)
+            if region:
+                return region
+        region = LANGUAGE_REGIONS.get(parts[0].lower())
+        if region:
+            return region
+    return None
+
+
+def get_request_region(request):
+    """
+    Determine the region for the current visitor without any network I/O.
+
+    Order: geo headers, the region cookie, Accept-Language, then the
+    process-wide default region.
+
+    Args:
+        request (flask.Request): The incoming request
+
+    Returns:
+        str: ISO region code
+    """
+    for header in REGION_HEADERS:
+        region = _normalise_region(request.headers.get(header))
+        if region:
+            return region
+
+    region = _normalise_region(request.cookies.get(REGION_COOKIE))
+    if region:
+        return region
+
+    region = region_from_accept_language(request.accept_languages)
+    if region:
+        return region
+
+    return resolve_default_region()
@@ -0,0 +1,82 @@
+"""Module: http_cache.py."""
+# utils/http_cache.py
+
+import hashlib
+from datetime import datetime, timezone
+from time import time
+
+from flask import Response
+
+from Creovue.utils.geo import REGION_COOKIE, REGION_HEADERS
+
+# A response also depends on the headers the visitor's region is read from
+VARY_HEADERS = REGION_HEADERS + ("Cookie", "Accept-Language")
+
+
+def cache_validators(request, sources):
+    """
+    Derive HTTP cache validators from the cache entries a response is built from.
+
+    Args:
+        request (flask.Request): The incoming request (its path and arguments
+            are part of the ETag)
+        sources (list): [(cached_function, args), ...] for every @cached call
+            the response reads
+
+    Returns:
+        dict or None: {"etag", "last_modified", "max_age"}, or None if any
+        source is not cached yet (the response cannot be validated)
+    """
+    now = time()
+    stamps = []
+    max_age = None
+    last_modified = None
+    for func, args in sources:
+        entry = func.peek(*args)
+        if entry is None:
+            return None
+        stored_at = entry[1]
+        stamps.append(f"{func.cache_key(*args)}@{stored_at!r}")
+        remaining = max(0, int(func.expiry_seconds - (now - stored_at)))
+        max_age = remaining if max_age is None else min(max_age, remaining)
+        last_modified = stored_at if last_modified is None else max(last_modified, stored_at)
+
+    query = "&".join(f"{key}={value}" for key, value in sorted(request.args.items(multi=True)))
+    version = "|".join([request.path, query, request.cookies.get(REGION_COOKIE, "")]
+                       + [request.headers.get(header, "") for header in VARY_HEADERS] + stamps)
+    return {
+        "etag": hashlib.sha1(version.encode("utf-8")).hexdigest(),
+        "last_modified": datetime.fromtimestamp(int(last_modified), timezone.utc) if sources else None,
+        "max_age": max_age or 0
+    }
+
+
+def is_not_modified(request, validators):
+    """True if the client's If-None-Match / If-Modified-Since still matches."""
+    if validators is None:
+        return False
+    if request.if_none_match:
+        # Weak comparison: compressed variants carry the same ETag as a weak validator
+        return request.if_none_match.contains_weak(validators["etag"])
+    if request.if_modified_since and validators["last_modified"]:
+        return validators["last_modified"] <= request.if_modified_since
+    return False
+
+
+def apply_cache_headers(response, validators):
+    """Set ETag, Last-Modified and a Cache-Control max-age matching the remaining cache TTL."""
+    response.vary.update(VARY_HEADERS)
+    if validators is None:
+        response.cache_control.no_cache = True
+        return response
+    response.set_etag(validators["etag"])
+    if validators["last_modified"]:
+        response.last_modified = validators["last_modified"]
+    response.cache_control.private = True
+    response.cache_control.max_age = validators["max_age"]
+    return response
+
+
+def not_modified(validators):
+    """An empty 304 response carrying the current validators."""
+    return apply_cache_headers(Response(status=304), validators)
@@ -0,0 +1,130 @@
+"""Module: lazy.py."""
+# utils/lazy.py
+
+import importlib
+import logging
+import sys
+import threading
+import time
+import types
+
+from Creovue.app_secrets import creo_import_budget
+
+logger = logging.getLogger('lazy')
+
+# Third-party packages that are slow to import; none of them should be loaded
+# by `import Creovue`, only by the first request that needs them
+HEAVY_MODULES = (
+    "numpy", "matplotlib", "sklearn", "pytrends", "pandas", "pycountry",
+    "geocoder", "googleapiclient", "httplib2", "youtubesearchpython", "nltk"
+)
+
+_boot = {"started": time.perf_counter(), "seconds": None, "eager": []}
+_import_times = {}  # module name -> {"seconds": float, "after_boot": float}
+_proxies = {}  # module name -> LazyModule, shared by every importer
+_lock = threading.Lock()
+
+
+class LazyModule(types.ModuleType):
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    Once loaded, the real module's attributes are copied onto the proxy, so
+    later lookups are plain attribute reads.
+    """
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_lazy_loaded"] = False
+        self.__dict__["_lazy_lock"] = threading.RLock()
+
+    def _load(self):
+        name = self.__name__
+        with self._lazy_lock:
+            if not self._lazy_loaded:
+                start = time.perf_counter()
+                module = importlib.import_module(name)
+                elapsed = time.perf_counter() - start
+                self.__dict__.update(module.__dict__)
+                self.__dict__["_lazy_loaded"] = True
+                with _lock:
+                    _import_times[name] = {
+                        "seconds": round(elapsed, 4),
+                        "after_boot": round(start - _boot["started"], 3)
+                    }
+                logger.info(f"Imported {name} on first use in {elapsed:.3f}s")
+
+    def __getattr__(self, attr):
+        if self.__dict__.get("_lazy_loaded"):
+            raise AttributeError(f"module {self.__name__!r} has no attribute {attr!r}")
+        self._load()
+        return getattr(self, attr)
+
+    def __repr__(self):
+        state = "loaded" if self._lazy_loaded else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name):
+    """
+    Return `name` as a module that is only imported when first used.
+
+    Args:
+        name (str): Dotted module name, e.g. 'matplotlib.figure'
+
+    Returns:
+        module: The real module if it is already imported, else a LazyModule
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    with _lock:
+        proxy = _proxies.get(name)
+        if proxy is None:
+            proxy = _proxies[name] = LazyModule(name)
+    return proxy
+
+
+def preload(name):
+    """Import `name` now, through its lazy proxy if it has one, and return the real module."""
+    module = lazy_import(name)
+    if isinstance(module, LazyModule):
+        module._load()
+        return sys.modules[name]
+    return module
+
+
+def boot_complete():
+    """Record the end of app start-up and warn if it ran over the import budget."""
+    _boot["seconds"] = time.perf_counter() - _boot["started"]
+    _boot["eager"] = [name for name in HEAVY_MODULES if name in sys.modules]
+    report = import_report()
+    if report["eager_heavy"]:
+        logger.warning(f"Heavy modules imported at boot: {', '.join(report['eager_heavy'])}")
+    if report["over_budget"]:
+        logger.warning(f"App import took {report['boot_seconds']}s, over the {creo_import_budget}s budget")
+    else:
+        logger.info(f"App import took {report['boot_seconds']}s (budget {creo_import_budget}s)")
+    return report
+
+
+def import_report():
+    """
+    Boot time against the budget, and when each heavy dependency got loaded.
+
+    Returns:
+        dict: boot_seconds, budget, over_budget, eager_heavy (heavy packages
+        already loaded when start-up finished), loaded_heavy and deferred
+        ({module: {"seconds", "after_boot"}} for lazily imported modules)
+    """
+    boot_seconds = _boot["seconds"]
+    with _lock:
+        deferred = dict(_import_times)
+    return {
+        "boot_seconds": round(boot_seconds, 3) if boot_seconds is not None else None,
+        "budget": creo_import_budget,
+        "over_budget": boot_seconds is not None and boot_seconds > creo_import_budget,
+        "eager_heavy": list(_boot["eager"]),
+        "loaded_heavy": [name for name in HEAVY_MODULES if name in sys.modules],
+        "deferred": deferred
+    }
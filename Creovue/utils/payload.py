@@ -0,0 +1,148 @@
+"""Module: payload.py."""
+# utils/payload.py
+
+import base64
+import binascii
+import json
+
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# Response keys that describe the response itself; a `fields=` projection always keeps them
+CONTROL_KEYS = ("next_cursor", "incomplete")
+
+
+class InvalidPage(ValueError):
+    """Raised when the `limit`/`cursor` paging arguments are invalid."""
+
+
+class InvalidCursor(InvalidPage):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def parse_fields(spec):
+    """
+    Parse a `fields=` projection into a tree.
+
+    "trending_keywords.name,trending_keywords.trend_score,top_channels" gives
+    {"trending_keywords": {"name": {}, "trend_score": {}}, "top_channels": {}}.
+    An empty subtree keeps the whole value. Returns None when `spec` is empty.
+    """
+    if not spec:
+        return None
+    tree = {}
+    for path in spec.split(","):
+        node = tree
+        for part in filter(None, path.strip().split(".")):
+            node = node.setdefault(part, {})
+    return tree or None
+
+
+def project(value, tree):
+    """Keep only the fields in `tree`, applying it to every element of lists."""
+    if not tree:
+        return value
+    if isinstance(value, dict):
+        return {key: project(value[key], subtree) for key, subtree in tree.items() if key in value}
+    if isinstance(value, (list, tuple)):
+        return [project(item, tree) for item in value]
+    return value
+
+
+def encode_cursor(offset):
+    if offset < 0:
+        raise ValueError(f"Cursor offset must not be negative, got {offset}")
+    return base64.urlsafe_b64encode(json.dumps({"o": offset}).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    """Return the offset stored in `cursor` (0 for no cursor)."""
+    if not cursor:
+        return 0
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        offset = json.loads(base64.urlsafe_b64decode(padded))["o"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise InvalidCursor(f"Invalid cursor '{cursor}'")
+    if not isinstance(offset, int) or offset < 0:
+        raise InvalidCursor(f"Invalid cursor '{cursor}'")
+    return offset
+
+
+def parse_limit(value):
+    """Return the `limit=` argument as an int (None when omitted)."""
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise InvalidPage(f"Invalid limit '{value}', expected a positive integer")
+
+
+def paginate(payload, limit=None, cursor=None):
+    """
+    Page every top-level list of `payload` by the same window.
+
+    Args:
+        payload (dict): Response body
+        limit (int, optional): Items per list; no paging when omitted
+        cursor (str, optional): Opaque cursor from a previous page's "next_cursor"
+
+    Returns:
+        dict: The payload with its lists sliced and a "next_cursor" (None on the last page)
+
+    Raises:
+        InvalidPage: If `limit` is not positive
+        InvalidCursor: If `cursor` is malformed
+    """
+    if limit is not None and limit <= 0:
+        raise InvalidPage(f"Invalid limit '{limit}', expected a positive integer")
+    offset = decode_cursor(cursor)
+    if not limit and not offset:
+        return payload
+    end = offset + limit if limit else None
+    paged = {}
+    more = False
+    for key, value in payload.items():
+        if isinstance(value, list) and key not in CONTROL_KEYS:
+            paged[key] = value[offset:end]
+            more = more or (end is not None and len(value) > end)
+        else:
+            paged[key] = value
+    paged["next_cursor"] = encode_cursor(end) if more else None
+    return paged
+
+
+def shape_payload(payload, args):
+    """
+    Apply the `limit`/`cursor` and `fields` request arguments to a payload.
+
+    Args:
+        payload (dict): Response body
+        args (werkzeug.datastructures.MultiDict): The request's query arguments
+
+    Returns:
+        dict: The paged, projected payload
+
+    Raises:
+        InvalidPage: If the limit or cursor is invalid
+    """
+    paged = paginate(payload, parse_limit(args.get("limit")), args.get("cursor"))
+    fields = parse_fields(args.get("fields"))
+    if fields is not None:
+        fields = dict(fields, **{key: {} for key in CONTROL_KEYS if key in paged})
+    return project(paged, fields)
+
+
+def iter_json(value, chunk_size=STREAM_CHUNK_SIZE):
+    """Encode `value` as JSON incrementally, yielding chunks of about `chunk_size` characters."""
+    buffer = []
+    size = 0
+    for piece in json.JSONEncoder(separators=(",", ":")).iterencode(value):
+        buffer.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
@@ -0,0 +1,205 @@
+"""Module: quota.py."""
+# utils/quota.py
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date
+from time import time
+
+from Creovue.app_secrets import (
+    creo_api_key,
+    creo_quota_path,
+    creo_quota_daily_limit,
+    creo_quota_background_reserve,
+    creo_quota_degrade_fraction
+)
+
+logger = logging.getLogger('quota')
+
+# YouTube Data API v3 unit cost per call
+ENDPOINT_COSTS = {
+    "videos.list": 1,
+    "channels.list": 1,
+    "videoCategories.list": 1,
+    "search.list": 100
+}
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+
+_priority = threading.local()
+
+
+class QuotaExceeded(Exception):
+    """Raised when a call would overdraw the API key's quota for its priority."""
+
+
+@contextmanager
+def quota_priority(priority):
+    """Run the enclosed API calls at `priority` (INTERACTIVE or BACKGROUND) on this thread."""
+    previous = getattr(_priority, "value", INTERACTIVE)
+    _priority.value = priority
+    try:
+        yield
+    finally:
+        _priority.value = previous
+
+
+def current_priority():
+    return getattr(_priority, "value", INTERACTIVE)
+
+
+def _key_id(api_key):
+    """Identify a key in the ledger without storing the secret itself."""
+    return hashlib.sha1((api_key or "").encode("utf-8")).hexdigest()[:12]
+
+
+class QuotaLedger:
+    """
+    Token bucket per API key, shared by all worker processes via SQLite.
+
+    The bucket holds the daily quota and refills continuously at
+    daily_limit / 86400 units per second. Background work (warming, refreshes)
+    may not draw the bucket below `background_reserve`, so interactive
+    requests keep headroom.
+    """
+
+    def __init__(self, path=creo_quota_path, daily_limit=creo_quota_daily_limit,
+                 background_reserve=creo_quota_background_reserve,
+                 degrade_fraction=creo_quota_degrade_fraction):
+        self.path = path
+        self.capacity = daily_limit
+        self.refill_rate = daily_limit / 86400
+        self.background_floor = daily_limit * background_reserve
+        self.degrade_floor = daily_limit * degrade_fraction
+        self._local = threading.local()
+        self._connect().executescript("""
+            CREATE TABLE IF NOT EXISTS buckets (
+                key_id TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS usage (
+                day TEXT NOT NULL,
+                endpoint TEXT NOT NULL,
+                priority TEXT NOT NULL,
+                units INTEGER NOT NULL,
+                PRIMARY KEY (day, endpoint, priority)
+            );
+        """)
+
+    def _connect(self):
+        """Return this thread's connection, reopening it after a fork."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _tokens(self, conn, key_id, now):
+        row = conn.execute("SELECT tokens, updated_at FROM buckets WHERE key_id = ?", (key_id,)).fetchone()
+        if row is None:
+            return self.capacity
+        return min(self.capacity, row[0] + (now - row[1]) * self.refill_rate)
+
+    def _floor(self, priority):
+        return self.background_floor if priority == BACKGROUND else 0
+
+    def acquire(self, endpoint, api_key=creo_api_key, priority=None):
+        """
+        Spend the unit cost of one call to `endpoint`.
+
+        Args:
+            endpoint (str): e.g. 'videos.list'
+            api_key (str): Key whose bucket is charged
+            priority (str, optional): Defaults to the current thread's priority
+
+        Returns:
+            float: Units remaining after the charge
+
+        Raises:
+            QuotaExceeded: If the charge would go below the priority's floor
+        """
+        priority = priority or current_priority()
+        cost = ENDPOINT_COSTS.get(endpoint, 1)
+        key_id = _key_id(api_key)
+        now = time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            tokens = self._tokens(conn, key_id, now)
+            if tokens - cost < self._floor(priority):
+                conn.execute("ROLLBACK")
+                raise QuotaExceeded(f"{endpoint} needs {cost} units, {int(tokens)} left for {priority} calls")
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (key_id, tokens, updated_at) VALUES (?, ?, ?)",
+                (key_id, tokens - cost, now)
+            )
+            conn.execute(
+                "INSERT INTO usage (day, endpoint, priority, units) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (day, endpoint, priority) DO UPDATE SET units = units + excluded.units",
+                (date.today().isoformat(), endpoint, priority, cost)
+            )
+            conn.execute("COMMIT")
+        except QuotaExceeded:
+            raise
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return tokens - cost
+
+    def remaining(self, api_key=creo_api_key):
+        return self._tokens(self._connect(), _key_id(api_key), time())
+
+    def should_degrade(self, api_key=creo_api_key, priority=None):
+        """True once the budget is nearly spent and callers should prefer cached data."""
+        priority = priority or current_priority()
+        floor = self.background_floor if priority == BACKGROUND else self.degrade_floor
+        return self.remaining(api_key) <= floor
+
+    def report(self, api_key=creo_api_key):
+        """Remaining budget and today's spend per endpoint and priority."""
+        rows = self._connect().execute(
+            "SELECT endpoint, priority, units FROM usage WHERE day = ?", (date.today().isoformat(),)
+        ).fetchall()
+        spent = {}
+        for endpoint, priority, units in rows:
+            spent.setdefault(endpoint, {})[priority] = units
+        remaining = self.remaining(api_key)
+        return {
+            "daily_limit": self.capacity,
+            "remaining": int(remaining),
+            "background_reserve": int(self.background_floor),
+            "degraded": remaining <= self.degrade_floor,
+            "spent_today": spent
+        }
+
+
+_ledger = None
+_ledger_lock = threading.Lock()
+
+
+def get_quota_ledger():
+    """Return the process-wide quota ledger."""
+    global _ledger
+    if _ledger is None:
+        with _ledger_lock:
+            if _ledger is None:
+                _ledger = QuotaLedger()
+    return _ledger
+
+
+def charge(endpoint, api_key=creo_api_key):
+    """Charge one call to `endpoint` at the current thread's priority."""
+    return get_quota_ledger().acquire(endpoint, api_key)
+
+
+def should_degrade():
+    """True if the current thread should serve cached data instead of calling the API."""
+    return get_quota_ledger().should_degrade()
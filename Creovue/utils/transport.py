@@ -0,0 +1,119 @@
+"""Module: transport.py."""
+# utils/transport.py
+
+import logging
+import os
+import threading
+from time import perf_counter
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from Creovue.app_secrets import (
+    creo_api_key,
+    creo_base_url,
+    creo_http_connect_timeout,
+    creo_http_read_timeout,
+    creo_http_pool_size,
+    creo_http_retries
+)
+from Creovue.utils.quota import charge
+
+logger = logging.getLogger('transport')
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+_metrics = {}
+_metrics_lock = threading.Lock()
+
+
+def _build_session():
+    """Create a pooled session that retries idempotent calls on 429/5xx with backoff."""
+    retry = Retry(
+        total=creo_http_retries,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=creo_http_pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept-Encoding": "gzip, deflate"})
+    return session
+
+
+def get_session():
+    """Return the process-wide pooled session, recreated after a fork."""
+    global _session, _session_pid
+    if _session is None or _session_pid != os.getpid():
+        with _session_lock:
+            if _session is None or _session_pid != os.getpid():
+                _session = _build_session()
+                _session_pid = os.getpid()
+    return _session
+
+
+def _record(endpoint, elapsed, status):
+    with _metrics_lock:
+        stats = _metrics.setdefault(endpoint, {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0})
+        stats["count"] += 1
+        stats["total_ms"] += elapsed * 1000
+        stats["max_ms"] = max(stats["max_ms"], elapsed * 1000)
+        if status is None or status >= 400:
+            stats["errors"] += 1
+
+
+def youtube_get(endpoint, params, api_key=None):
+    """
+    GET a YouTube Data API REST endpoint through the shared transport.
+
+    Args:
+        endpoint (str): Resource path under the base URL, e.g. 'channels'
+        params (dict): Query parameters (the API key is added)
+        api_key (str, optional): Overrides the configured API key
+
+    Returns:
+        requests.Response: The final response after any retries
+
+    Raises:
+        QuotaExceeded: If the call would overdraw the API key's quota
+    """
+    api_key = api_key or creo_api_key
+    charge(f"{endpoint}.list", api_key)
+
+    url = f"{creo_base_url}/{endpoint}"
+    params = dict(params, key=api_key)
+    started = perf_counter()
+    status = None
+    try:
+        response = get_session().get(
+            url,
+            params=params,
+            timeout=(creo_http_connect_timeout, creo_http_read_timeout)
+        )
+        status = response.status_code
+        return response
+    finally:
+        _record(endpoint, perf_counter() - started, status)
+
+
+def get_http_metrics():
+    """Return per-endpoint call counts, error counts and latency in milliseconds."""
+    with _metrics_lock:
+        return {
+            endpoint: {
+                "count": stats["count"],
+                "errors": stats["errors"],
+                "avg_ms": round(stats["total_ms"] / stats["count"], 1) if stats["count"] else 0,
+                "max_ms": round(stats["max_ms"], 1)
+            }
+            for endpoint, stats in _metrics.items()
+        }
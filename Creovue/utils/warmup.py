@@ -0,0 +1,170 @@
+"""Module: warmup.py."""
+# utils/warmup.py
+
+import logging
+import os
+import threading
+from time import time
+
+from Creovue import app_secrets
+from Creovue.app_secrets import creo_warm_regions
+from Creovue.utils.lazy import preload
+
+logger = logging.getLogger('warmup')
+
+# Libraries imported during warm-up, so pre-forked workers share them copy-on-write
+WARM_MODULES = (
+    "numpy",
+    "matplotlib.figure",
+    "matplotlib.backends.backend_agg",
+    "googleapiclient.discovery",
+    "sklearn.feature_extraction.text",
+    "youtubesearchpython"
+)
+
+# Warm-up steps run in order; register more with @warmup_step
+WARMUP_STEPS = []
+
+_state = {"started": None, "finished": None, "steps": {}}
+_ready = threading.Event()
+_run_lock = threading.Lock()
+_start_lock = threading.Lock()
+_thread = None
+
+
+def warmup_step(name):
+    """Register a warm-up step under `name`."""
+    def register(func):
+        WARMUP_STEPS.append((name, func))
+        return func
+    return register
+
+
+@warmup_step("modules")
+def _warm_modules():
+    missing = []
+    for name in WARM_MODULES:
+        try:
+            preload(name)
+        except ImportError:
+            missing.append(name)
+    if missing:
+        raise ImportError(f"Could not import {', '.join(missing)}")
+
+
+@warmup_step("default_region")
+def _warm_default_region():
+    # May geolocate the server (network I/O), so it is kept out of app import
+    from Creovue.utils.geo import resolve_default_region
+    resolve_default_region()
+
+
+@warmup_step("youtube_client")
+def _warm_youtube_client():
+    from Creovue.utils.youtube_client import get_discovery_document
+    get_discovery_document()
+
+
+@warmup_step("regions")
+def _warm_regions():
+    from Creovue.models.catalog import get_all_regions
+    get_all_regions()
+
+
+@warmup_step("categories")
+def _warm_categories():
+    from Creovue.models.catalog import get_category_map
+    from Creovue.utils.geo import resolve_default_region
+    for region in dict.fromkeys([resolve_default_region(), *creo_warm_regions]):
+        get_category_map(region)
+
+
+@warmup_step("charts")
+def _warm_charts():
+    # First render builds matplotlib's font cache and this thread's templates
+    from Creovue.charts.render import grouped_bar_chart, line_chart, render_chart
+    render_chart(line_chart([0, 1], [0, 1]), fmt="png")
+    render_chart(grouped_bar_chart(["a"], [{"label": "a", "values": [1]}]), fmt="svg")
+
+
+def warm_up():
+    """
+    Run every warm-up step once per process and mark the app ready.
+
+    A failing step is logged and recorded but does not block readiness: the
+    work it would have primed is simply done by the first request instead.
+    Concurrent callers wait for the run already in progress. With
+    CREO_WARMUP_ENABLED=0 no step runs and the app is ready at once.
+
+    Returns:
+        dict: The warm-up report (see warmup_report)
+    """
+    with _run_lock:
+        if not _ready.is_set():
+            _state["started"] = time()
+            steps = WARMUP_STEPS if app_secrets.creo_warmup_enabled else []
+            for name, func in steps:
+                start = time()
+                try:
+                    func()
+                    error = None
+                except Exception as e:
+                    error = str(e)
+                    logger.warning(f"Warm-up step {name} failed: {e}")
+                _state["steps"][name] = {"seconds": round(time() - start, 3), "error": error}
+            _state["finished"] = time()
+            _ready.set()
+            logger.info(f"Warm-up finished in {_state['finished'] - _state['started']:.2f}s")
+    return warmup_report()
+
+
+def start_warmup():
+    """Run the warm-up on a background thread (no-op if it already ran or is running)."""
+    global _thread
+    with _start_lock:
+        if _ready.is_set() or (_thread and _thread.is_alive()):
+            return
+        _thread = threading.Thread(target=warm_up, name="creo-warmup", daemon=True)
+        _thread.start()
+
+
+def start_background():
+    """Start the warm-up and the trend warmer for a single-process server (main.py)."""
+    from Creovue.scheduler import start_scheduler
+
+    start_warmup()
+    start_scheduler()
+
+
+def is_ready():
+    """True once this process (or the master it was forked from) has finished warming up."""
+    return _ready.is_set()
+
+
+def warmup_report():
+    """Readiness, when the warm-up ran and how long each step took."""
+    started, finished = _state["started"], _state["finished"]
+    return {
+        "ready": _ready.is_set(),
+        "pid": os.getpid(),
+        "started": started,
+        "finished": finished,
+        "seconds": round(finished - started, 3) if finished else None,
+        "steps": dict(_state["steps"])
+    }
+
+
+def after_fork():
+    """
+    Restart per-process machinery in a freshly forked worker.
+
+    Thread pools, in-flight bookkeeping and the warmer's host-wide flock are
+    not inherited usefully across a fork, so they are rebuilt here rather
+    than in the master. The warm-up result itself is inherited.
+    """
+    from Creovue.scheduler import start_scheduler
+    from Creovue.utils import concurrency, decorators
+
+    concurrency.reset_after_fork()
+    decorators.reset_after_fork()
+    start_scheduler()
@@ -1,12 +1,86 @@
 # Creovue/utils/youtube_client.py
 
+import json
+import logging
 import os
-from googleapiclient.discovery import build
-from Creovue.app_secrets import creo_api_key
+import threading
+
+from Creovue.app_secrets import creo_api_key, creo_http_read_timeout
+from Creovue.utils.lazy import lazy_import
+from Creovue.utils.quota import charge
+
+# The API client library is only loaded when the first client is built
+httplib2 = lazy_import("httplib2")
+discovery = lazy_import("googleapiclient.discovery")
+discovery_cache = lazy_import("googleapiclient.discovery_cache")
+
+logger = logging.getLogger('youtube_client')
+
+YOUTUBE_API_SERVICE_NAME = "youtube"
+YOUTUBE_API_VERSION = "v3"
+
+# Parsed discovery document, shared read-only by every client in the process
+_discovery_doc = None
+_discovery_lock = threading.Lock()
+
+# httplib2.Http is not thread-safe, so each thread keeps its own client and
+# with it a keep-alive connection to the API host
+_local = threading.local()
+
+
+def get_discovery_document():
+    """
+    Load the YouTube discovery document bundled with google-api-python-client.
+
+    Parsed once per process and never fetched over the network.
+    """
+    global _discovery_doc
+    if _discovery_doc is None:
+        with _discovery_lock:
+            if _discovery_doc is None:
+                content = discovery_cache.get_static_doc(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION)
+                if content is None:
+                    raise RuntimeError(f"No bundled discovery document for {YOUTUBE_API_SERVICE_NAME} {YOUTUBE_API_VERSION}")
+                _discovery_doc = json.loads(content)
+    return _discovery_doc
+
 
 def get_youtube_client():
     """
     Returns an authenticated YouTube Data API client.
     Requires `creo_api_key` to be defined in app_secrets.py
+
+    The client is built once per thread (and rebuilt after a fork) and reused,
+    so repeated calls share its pooled keep-alive HTTP connection.
+    """
+    client = getattr(_local, "client", None)
+    if client is None or _local.pid != os.getpid():
+        try:
+            client = discovery.build_from_document(
+                get_discovery_document(),
+                developerKey=creo_api_key,
+                http=httplib2.Http(timeout=creo_http_read_timeout)
+            )
+        except Exception as e:
+            logger.error(f"Failed to create YouTube API client: {e}")
+            raise
+        _local.client = client
+        _local.pid = os.getpid()
+    return client
+
+
+def execute(request):
+    """
+    Execute a googleapiclient request after charging its quota cost.
+
+    Args:
+        request (googleapiclient.http.HttpRequest): e.g. youtube.videos().list(...)
+
+    Returns:
+        dict: The decoded API response
+
+    Raises:
+        QuotaExceeded: If the call would overdraw the quota for this thread's priority
     """
-    return build("youtube", "v3", developerKey=creo_api_key)
+    charge(request.methodId.replace(f"{YOUTUBE_API_SERVICE_NAME}.", "", 1))
+    return request.execute()
@@ -2,14 +2,14 @@
 
 """Module: yt_api.py."""
 # utils/yt_api.py
-import requests
 import datetime
 import time
 import datetime
 
 
 
-from Creovue.app_secets import creo_api_key, cre_base_url
+from Creovue.utils.transport import youtube_get
+from Creovue.models.channels import get_channel
 
 
 
@@ -21,23 +21,13 @@ def fetch_youtube_analytics(channel_id, days=700):
     end_date = datetime.date.today()
     start_date = end_date - datetime.timedelta(days=days)
 
-    url = f'{cre_base_url}/channels'
-    params = {
-        'part': 'statistics',
-        'id': channel_id,
-        'key': creo_api_key
-    }
-
-    response = requests.get(url, params=params)
-    data = response.json()
-
-    if response.status_code != 200:
-        raise Exception(f"API Error: {response.status_code} - {data.get('error', {}).get('message', '')}")
+    # Channel statistics come from the shared, cached channel service
+    channel = get_channel(channel_id)
 
-    if not data.get("items"):
+    if channel is None:
         raise Exception("No channel data returned.")
 
-    stats = data['items'][0]['statistics']
+    stats = channel['statistics']
     total_views = int(stats.get("viewCount", 0))
     subscriber_count = int(stats.get("subscriberCount", 0))
     video_count = int(stats.get("videoCount", 1))
@@ -68,15 +58,13 @@ def validate_api_key():
     Returns:
         bool: True if the API key is valid, False otherwise
     """
-    test_url = f"{cre_base_url}/videos"
     params = {
         'part': 'snippet',
         'chart': 'mostPopular',
-        'maxResults': 1,
-        'key': creo_api_key
+        'maxResults': 1
     }
     
-    response = requests.get(test_url, params=params)
+    response = youtube_get('videos', params)
     return response.status_code == 200
 
 
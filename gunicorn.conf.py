@@ -0,0 +1,29 @@
+# gunicorn.conf.py
+# Run with: gunicorn -c gunicorn.conf.py
+#
+# The app is imported and warmed up once in the master, then forked, so every
+# worker starts with loaded libraries, the parsed discovery document, regions,
+# categories and matplotlib's font cache already in (copy-on-write) memory.
+
+import multiprocessing
+import os
+
+wsgi_app = "Creovue:app"
+bind = os.environ.get("CREO_BIND", "0.0.0.0:9600")  # Same default as config.py
+workers = int(os.environ.get("CREO_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get("CREO_THREADS", 4))
+timeout = int(os.environ.get("CREO_WORKER_TIMEOUT", 60))
+preload_app = True
+
+
+def on_starting(server):
+    """Warm up in the master, after the app is preloaded and before any worker forks."""
+    from Creovue.utils.warmup import warm_up
+    report = warm_up()
+    server.log.info(f"Warm-up finished in {report['seconds']}s: {report['steps']}")
+
+
+def post_fork(server, worker):
+    """Threads and the warmer's flock do not survive a fork; start them afresh in each worker."""
+    from Creovue.utils.warmup import after_fork
+    after_fork()
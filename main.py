@@ -1,6 +1,11 @@
+import os
+
 import config
 from Creovue import app
+from Creovue.utils.warmup import start_background
 
 if __name__ == "__main__":
+    # With the debug reloader only the child process that serves starts background work
+    if not config.DEGUB or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_background()
     app.run(host=config.HOST, port=config.PORT, debug=config.DEGUB)
-